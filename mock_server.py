@@ -1,158 +1,85 @@
-from flask import Flask, jsonify
-from mock_server.constants import (
-    ORDER_STATUS_PENDING,
-    PAYMENT_STATUS_PENDING,
-    PAYMENT_STATUS_REFUNDED,
-    REFUND_STATUS_COMPLETED,
-    DEFAULT_CURRENCY,
-    DEFAULT_PAYMENT_METHOD,
-    get_current_timestamp
-)
-from mock_server.helpers import (
-    simulate_processing_time,
-    create_not_found_response,
-    create_validation_error,
-    create_invalid_request_error,
-    create_invalid_status_error,
-    parse_request_json
-)
+import argparse
+import signal
+import sys
+from mock_server import app as app_module
+from mock_server.app import app
+from mock_server.constants import SERVER_READY_MARKER
+from mock_server.helpers import latency_profiles
+from mock_server.replay import ReplayStore
+from mock_server.serving import SERVER_ENGINES, serve
+from mock_server.storage import create_storage
+from utils.config import config
 
-app = Flask(__name__)
 
-@app.after_request
-def after_request(response):
-    response.headers.add('Access-Control-Allow-Origin', '*')
-    response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization')
-    response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
-    return response
-
-orders_db = {}
-payments_db = {}
-order_counter = 1
-payment_counter = 1
-
-
-@app.route('/orders', methods=['POST'])
-def create_order():
-    global order_counter
-    
-    data = parse_request_json(force=True)
-    
-    if not data:
-        return create_invalid_request_error("Request body is required")
-    
-    if 'amount' not in data or 'currency' not in data:
-        return create_validation_error("amount and currency are required")
-    
-    if data.get('amount', 0) <= 0:
-        return create_validation_error("amount must be greater than 0")
-    
-    simulate_processing_time()
-    
-    order_id = f"order_{order_counter}"
-    order_counter += 1
-    
-    order = {
-        "id": order_id,
-        "amount": data['amount'],
-        "currency": data.get('currency', DEFAULT_CURRENCY),
-        "status": ORDER_STATUS_PENDING,
-        "created_at": get_current_timestamp(),
-        "description": data.get('description', ''),
-        "customer": data.get('customer', {})
-    }
-    
-    orders_db[order_id] = order
-    return jsonify(order), 201
-
-
-@app.route('/orders/<order_id>', methods=['GET'])
-def get_order(order_id):
-    simulate_processing_time()
-    
-    if order_id not in orders_db:
-        return create_not_found_response("Order", order_id)
-    
-    return jsonify(orders_db[order_id]), 200
-
-
-@app.route('/orders/<order_id>/payments', methods=['POST'])
-def create_payment(order_id):
-    global payment_counter
-    
-    simulate_processing_time()
-    
-    if order_id not in orders_db:
-        return create_not_found_response("Order", order_id)
-    
-    data = parse_request_json()
-    
-    payment_id = f"payment_{payment_counter}"
-    payment_counter += 1
-    
-    order = orders_db[order_id]
-    payment = {
-        "id": payment_id,
-        "order_id": order_id,
-        "amount": order['amount'],
-        "currency": order['currency'],
-        "status": PAYMENT_STATUS_PENDING,
-        "created_at": get_current_timestamp(),
-        "payment_method": data.get('payment_method', DEFAULT_PAYMENT_METHOD) if data else DEFAULT_PAYMENT_METHOD
-    }
-    
-    payments_db[payment_id] = payment
-    return jsonify(payment), 201
-
-
-@app.route('/payments/<payment_id>', methods=['GET'])
-def get_payment(payment_id):
-    simulate_processing_time()
-    
-    if payment_id not in payments_db:
-        return create_not_found_response("Payment", payment_id)
-    
-    return jsonify(payments_db[payment_id]), 200
-
-
-@app.route('/payments/<payment_id>/refund', methods=['POST'])
-def refund_payment(payment_id):
-    simulate_processing_time()
-    
-    if payment_id not in payments_db:
-        return create_not_found_response("Payment", payment_id)
-    
-    payment = payments_db[payment_id]
-    
-    if payment['status'] == PAYMENT_STATUS_REFUNDED:
-        return create_invalid_status_error("Payment already refunded")
-    
-    data = parse_request_json()
-    refund_amount = data.get('amount', payment['amount']) if data else payment['amount']
-    
-    if refund_amount > payment['amount']:
-        return create_validation_error("Refund amount cannot exceed payment amount")
-    
-    payment['status'] = PAYMENT_STATUS_REFUNDED
-    payment['refunded_amount'] = refund_amount
-    payment['refunded_at'] = get_current_timestamp()
-    
-    refund = {
-        "id": f"refund_{payment_id}",
-        "payment_id": payment_id,
-        "amount": refund_amount,
-        "currency": payment['currency'],
-        "status": REFUND_STATUS_COMPLETED,
-        "created_at": get_current_timestamp()
-    }
-    
-    return jsonify(refund), 201
-
-
-@app.route('/health', methods=['GET'])
-def health():
-    return jsonify({"status": "ok"}), 200
+def report_ready(port: int) -> None:
+    # The socket is already listening here; report the bound port so launchers need not poll
+    print(f"{SERVER_READY_MARKER} {port}", flush=True)
 
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=False)
+    parser = argparse.ArgumentParser(description="ioka API mock server")
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=config.mock_server_port, help="0 picks a free port")
+    parser.add_argument('--engine', choices=SERVER_ENGINES, default=config.mock_server_engine)
+    parser.add_argument('--threads', type=int, default=config.mock_server_threads)
+    parser.add_argument('--workers', type=int, default=config.mock_server_workers)
+    parser.add_argument(
+        '--independent-workers',
+        action='store_true',
+        help="Allow several workers with in-memory storage: each keeps its own orders and payments"
+    )
+    parser.add_argument('--storage', choices=['memory', 'sqlite'], default=None)
+    parser.add_argument('--sqlite-path', default=None, help="SQLite database file for --storage sqlite")
+    parser.add_argument('--zero-latency', action='store_true', help="No simulated delays or faults on any endpoint")
+    parser.add_argument('--replay', default=None, help="Serve recorded responses from this capture file")
+    parser.add_argument(
+        '--replay-latency',
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Delay replayed responses by their recorded server time"
+    )
+    args = parser.parse_args()
+    
+    # Forked workers would share one inherited connection and each hand out the same ids
+    storage_backend = args.storage or ('sqlite' if args.sqlite_path else config.mock_server_storage)
+    if args.workers > 1 and storage_backend == 'sqlite':
+        parser.error("sqlite storage cannot be shared by multiple workers; use --workers 1")
+    # In memory every worker has its own records: ids repeat across workers and a request
+    # routed to another worker than the one that created the record gets a 404
+    if args.workers > 1 and not args.independent_workers:
+        parser.error("in-memory state is not shared between workers; use --workers 1 or --independent-workers")
+    if args.workers > 1:
+        print(
+            f"warning: {args.workers} workers keep separate in-memory state; "
+            "requests for records created by another worker return 404",
+            file=sys.stderr
+        )
+    
+    if args.zero_latency:
+        latency_profiles.configure({'default': {'type': 'zero'}})
+    
+    if args.storage or args.sqlite_path:
+        app_module.set_storage(create_storage(
+            storage_backend,
+            max_records=config.mock_server_max_records,
+            ttl_seconds=config.mock_server_ttl_seconds,
+            sqlite_path=args.sqlite_path or str(config.base_dir / config.mock_server_sqlite_path),
+            sqlite_batch_size=config.mock_server_sqlite_batch_size,
+            sqlite_flush_interval=config.mock_server_sqlite_flush_interval_ms / 1000
+        ))
+    
+    if args.replay:
+        app_module.set_replay(ReplayStore(args.replay, replay_latency=args.replay_latency))
+    
+    # Exit through SystemExit on terminate so pending storage writes get flushed at exit
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    
+    serve(
+        app,
+        args.host,
+        args.port,
+        engine=args.engine,
+        threads=args.threads,
+        workers=args.workers,
+        on_ready=report_ready
+    )
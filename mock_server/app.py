@@ -0,0 +1,472 @@
+from typing import Dict, Any, List, Optional, Tuple
+from flask import Flask, Response, jsonify, request
+from mock_server.constants import (
+    ORDER_STATUS_PENDING,
+    PAYMENT_STATUS_PENDING,
+    PAYMENT_STATUS_REFUNDED,
+    REFUND_STATUS_COMPLETED,
+    DEFAULT_CURRENCY,
+    DEFAULT_PAYMENT_METHOD,
+    ERROR_INVALID_REQUEST,
+    ERROR_VALIDATION_ERROR,
+    ERROR_NOT_FOUND,
+    ERROR_REPLAY_MISS,
+    MAX_BATCH_SIZE,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE
+)
+from mock_server.clock import (
+    TIMESTAMP_FORMAT,
+    timestamps,
+    current_epoch,
+    format_timestamp,
+    parse_timestamp
+)
+from mock_server.helpers import (
+    latency_profiles,
+    simulate_processing_time,
+    simulated_sleep,
+    build_error,
+    create_error_response,
+    create_not_found_response,
+    create_validation_error,
+    create_invalid_request_error,
+    create_invalid_status_error,
+    parse_request_json
+)
+from mock_server.idempotency import IdempotencyCache, idempotent
+from mock_server.instrumentation import ServerMetrics, instrument
+from mock_server.json_provider import FastJSONProvider
+from mock_server.latency import InjectedFault
+from mock_server.records import OrderRecord, PaymentRecord
+from mock_server.storage import create_storage
+from utils.config import config
+
+app = Flask(__name__)
+app.json = FastJSONProvider(app, config.mock_server_json_backend)
+
+@app.after_request
+def after_request(response):
+    response.headers.add('Access-Control-Allow-Origin', '*')
+    response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization')
+    response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
+    return response
+
+server_metrics = ServerMetrics()
+instrument(app, server_metrics)
+
+@app.errorhandler(InjectedFault)
+def handle_injected_fault(fault):
+    return create_error_response(fault.code, fault.message, fault.status_code)
+
+storage = create_storage(
+    config.mock_server_storage,
+    max_records=config.mock_server_max_records,
+    ttl_seconds=config.mock_server_ttl_seconds,
+    sqlite_path=str(config.base_dir / config.mock_server_sqlite_path),
+    sqlite_batch_size=config.mock_server_sqlite_batch_size,
+    sqlite_flush_interval=config.mock_server_sqlite_flush_interval_ms / 1000
+)
+
+idempotency_cache = IdempotencyCache(
+    max_entries=config.mock_server_idempotency_max_keys,
+    ttl_seconds=config.mock_server_idempotency_ttl_seconds
+)
+idempotent_endpoint = idempotent(idempotency_cache)
+
+
+def set_storage(new_storage) -> None:
+    global storage
+    storage.close()
+    storage = new_storage
+
+
+# In replay mode recorded responses are served instead of running the handlers;
+# admin, metrics and health endpoints keep working normally
+replay_store = None
+REPLAY_PASSTHROUGH = ('/admin/', '/metrics', '/health')
+
+
+def set_replay(new_store) -> None:
+    global replay_store
+    replay_store = new_store
+
+
+@app.before_request
+def serve_replay():
+    if replay_store is None or request.path.startswith(REPLAY_PASSTHROUGH):
+        return None
+    
+    path = request.path
+    if request.query_string:
+        path += '?' + request.query_string.decode('utf-8')
+    entry = replay_store.take(request.method, path, request.get_data(as_text=True) or None)
+    if entry is None:
+        return create_error_response(ERROR_REPLAY_MISS, f"No recorded response for {request.method} {path}", 404)
+    
+    simulated_sleep(replay_store.latency_seconds(entry))
+    return Response(entry['response'], status=entry['status'], content_type=entry['content_type'])
+
+
+def validate_order_data(data: Optional[Dict[str, Any]]) -> Optional[Tuple[str, str]]:
+    if not data:
+        return ERROR_INVALID_REQUEST, "Request body is required"
+    
+    if 'amount' not in data or 'currency' not in data:
+        return ERROR_VALIDATION_ERROR, "amount and currency are required"
+    
+    amount = data['amount']
+    if isinstance(amount, bool) or not isinstance(amount, (int, float)):
+        return ERROR_VALIDATION_ERROR, "amount must be a number"
+    
+    if amount <= 0:
+        return ERROR_VALIDATION_ERROR, "amount must be greater than 0"
+    
+    if not isinstance(data['currency'], str):
+        return ERROR_VALIDATION_ERROR, "currency must be a string"
+    
+    if not isinstance(data.get('description', ''), str):
+        return ERROR_VALIDATION_ERROR, "description must be a string"
+    
+    return None
+
+
+def validate_payment_data(data: Optional[Dict[str, Any]]) -> Optional[Tuple[str, str]]:
+    if data and not isinstance(data.get('payment_method', DEFAULT_PAYMENT_METHOD), str):
+        return ERROR_VALIDATION_ERROR, "payment_method must be a string"
+    
+    return None
+
+
+def build_order(data: Dict[str, Any]) -> OrderRecord:
+    seq, created_at = storage.orders.allocate(current_epoch)
+    return OrderRecord(
+        seq,
+        amount=data['amount'],
+        currency=data.get('currency', DEFAULT_CURRENCY),
+        status=ORDER_STATUS_PENDING,
+        created_at=created_at,
+        description=data.get('description', ''),
+        customer=data.get('customer', {})
+    )
+
+
+def build_payment(order_id: str, order: Dict[str, Any], data: Optional[Dict[str, Any]]) -> PaymentRecord:
+    seq, created_at = storage.payments.allocate(current_epoch)
+    return PaymentRecord(
+        seq,
+        order_seq=OrderRecord.parse_id(order_id),
+        amount=order['amount'],
+        currency=order['currency'],
+        status=PAYMENT_STATUS_PENDING,
+        created_at=created_at,
+        payment_method=data.get('payment_method', DEFAULT_PAYMENT_METHOD) if data else DEFAULT_PAYMENT_METHOD
+    )
+
+
+def parse_batch_items(key: str) -> Tuple[Optional[List[Any]], Optional[tuple]]:
+    data = parse_request_json(force=True)
+    items = data.get(key) if isinstance(data, dict) else None
+    
+    if not isinstance(items, list) or not items:
+        return None, create_invalid_request_error(f"{key} must be a non-empty list")
+    
+    if len(items) > MAX_BATCH_SIZE:
+        return None, create_validation_error(f"{key} cannot contain more than {MAX_BATCH_SIZE} items")
+    
+    return items, None
+
+
+def parse_page_params(record_type) -> Tuple[Optional[Dict[str, Any]], Optional[tuple]]:
+    args = request.args
+    
+    limit = args.get('limit', str(DEFAULT_PAGE_SIZE))
+    if not (limit.isascii() and limit.isdigit()) or not 1 <= int(limit) <= MAX_PAGE_SIZE:
+        return None, create_validation_error(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+    
+    # The cursor is the id of the last record on the previous page
+    after = 0
+    if 'cursor' in args:
+        after = record_type.parse_id(args['cursor'])
+        if after is None:
+            return None, create_invalid_request_error("Invalid cursor")
+    
+    params = {'limit': int(limit), 'after': after}
+    for name in ('created_from', 'created_to'):
+        if name in args:
+            try:
+                params[name] = parse_timestamp(args[name])
+            except ValueError:
+                return None, create_validation_error(f"{name} must be a timestamp like 2024-01-31T12:00:00Z")
+    
+    return params, None
+
+
+def create_page_response(record_type, page: List[Dict[str, Any]], next_seq: Optional[int]):
+    next_cursor = record_type.format_id(next_seq) if next_seq is not None else None
+    return jsonify({"data": page, "next_cursor": next_cursor}), 200
+
+
+@app.route('/orders', methods=['GET'])
+def list_orders():
+    params, error_response = parse_page_params(OrderRecord)
+    if error_response:
+        return error_response
+    
+    simulate_processing_time()
+    
+    filters = {name: request.args[name] for name in ('status', 'currency') if name in request.args}
+    page, next_seq = storage.orders.query(filters, **params)
+    return create_page_response(OrderRecord, page, next_seq)
+
+
+@app.route('/orders', methods=['POST'])
+@idempotent_endpoint
+def create_order():
+    data = parse_request_json(force=True)
+    
+    error = validate_order_data(data)
+    if error:
+        return create_error_response(*error)
+    
+    simulate_processing_time()
+    
+    order = build_order(data)
+    storage.orders.insert(order)
+    return jsonify(order.to_dict()), 201
+
+
+@app.route('/orders:batch', methods=['POST'])
+@idempotent_endpoint
+def create_orders_batch():
+    items, error_response = parse_batch_items('orders')
+    if error_response:
+        return error_response
+    
+    simulate_processing_time()
+    
+    results = []
+    orders = []
+    for index, data in enumerate(items):
+        error = validate_order_data(data if isinstance(data, dict) else None)
+        if error:
+            results.append({"index": index, "status": 400, **build_error(*error)})
+            continue
+        order = build_order(data)
+        orders.append(order)
+        results.append({"index": index, "status": 201, "order": order.to_dict()})
+    
+    storage.orders.insert_many(orders)
+    return jsonify({
+        "results": results,
+        "created": len(orders),
+        "failed": len(results) - len(orders)
+    }), 200
+
+
+@app.route('/orders/<order_id>', methods=['GET'])
+def get_order(order_id):
+    simulate_processing_time()
+    
+    order = storage.orders.get(order_id)
+    if order is None:
+        return create_not_found_response("Order", order_id)
+    
+    return jsonify(order), 200
+
+
+@app.route('/orders/<order_id>/payments', methods=['POST'])
+@idempotent_endpoint
+def create_payment(order_id):
+    simulate_processing_time()
+    
+    order = storage.orders.get(order_id)
+    if order is None:
+        return create_not_found_response("Order", order_id)
+    
+    data = parse_request_json()
+    error = validate_payment_data(data)
+    if error:
+        return create_error_response(*error)
+    
+    payment = build_payment(order_id, order, data)
+    storage.payments.insert(payment)
+    return jsonify(payment.to_dict()), 201
+
+
+@app.route('/orders/<order_id>/payments', methods=['GET'])
+def list_order_payments(order_id):
+    params, error_response = parse_page_params(PaymentRecord)
+    if error_response:
+        return error_response
+    
+    simulate_processing_time()
+    
+    if storage.orders.get(order_id) is None:
+        return create_not_found_response("Order", order_id)
+    
+    filters = {'order': OrderRecord.parse_id(order_id)}
+    if 'status' in request.args:
+        filters['status'] = request.args['status']
+    page, next_seq = storage.payments.query(filters, **params)
+    return create_page_response(PaymentRecord, page, next_seq)
+
+
+@app.route('/payments:batch', methods=['POST'])
+@idempotent_endpoint
+def create_payments_batch():
+    items, error_response = parse_batch_items('payments')
+    if error_response:
+        return error_response
+    
+    simulate_processing_time()
+    
+    results = []
+    payments = []
+    for index, data in enumerate(items):
+        order_id = data.get('order_id') if isinstance(data, dict) else None
+        if not isinstance(order_id, str):
+            results.append({
+                "index": index,
+                "status": 400,
+                **build_error(ERROR_VALIDATION_ERROR, "order_id is required")
+            })
+            continue
+        
+        error = validate_payment_data(data)
+        if error:
+            results.append({"index": index, "status": 400, **build_error(*error)})
+            continue
+        
+        order = storage.orders.get(order_id)
+        if order is None:
+            results.append({
+                "index": index,
+                "status": 404,
+                **build_error(ERROR_NOT_FOUND, f"Order {order_id} not found")
+            })
+            continue
+        
+        payment = build_payment(order_id, order, data)
+        payments.append(payment)
+        results.append({"index": index, "status": 201, "payment": payment.to_dict()})
+    
+    storage.payments.insert_many(payments)
+    return jsonify({
+        "results": results,
+        "created": len(payments),
+        "failed": len(results) - len(payments)
+    }), 200
+
+
+@app.route('/payments/<payment_id>', methods=['GET'])
+def get_payment(payment_id):
+    simulate_processing_time()
+    
+    payment = storage.payments.get(payment_id)
+    if payment is None:
+        return create_not_found_response("Payment", payment_id)
+    
+    return jsonify(payment), 200
+
+
+@app.route('/payments/<payment_id>/refund', methods=['POST'])
+@idempotent_endpoint
+def refund_payment(payment_id):
+    simulate_processing_time()
+    
+    data = parse_request_json()
+    
+    with storage.payments.locked(payment_id) as payment:
+        if payment is None:
+            return create_not_found_response("Payment", payment_id)
+        
+        if payment.status == PAYMENT_STATUS_REFUNDED:
+            return create_invalid_status_error("Payment already refunded")
+        
+        refund_amount = data.get('amount', payment.amount) if data else payment.amount
+        
+        if isinstance(refund_amount, bool) or not isinstance(refund_amount, (int, float)):
+            return create_validation_error("amount must be a number")
+        
+        if refund_amount > payment.amount:
+            return create_validation_error("Refund amount cannot exceed payment amount")
+        
+        refunded_at = current_epoch()
+        payment.refund(refund_amount, PAYMENT_STATUS_REFUNDED, refunded_at)
+    
+    refund = {
+        "id": f"refund_{payment_id}",
+        "payment_id": payment_id,
+        "amount": refund_amount,
+        "currency": payment.currency,
+        "status": REFUND_STATUS_COMPLETED,
+        "created_at": format_timestamp(refunded_at)
+    }
+    
+    return jsonify(refund), 201
+
+
+@app.route('/admin/stats', methods=['GET'])
+def admin_stats():
+    stats = {**storage.stats(), 'idempotency': idempotency_cache.stats()}
+    if replay_store is not None:
+        stats['replay'] = replay_store.stats()
+    return jsonify(stats), 200
+
+
+@app.route('/admin/latency', methods=['GET'])
+def get_latency_profiles():
+    return jsonify(latency_profiles.settings()), 200
+
+
+@app.route('/admin/latency', methods=['PUT', 'PATCH'])
+def set_latency_profiles():
+    # PUT replaces every profile; PATCH merges endpoint overrides, null removing one
+    data = parse_request_json(force=True)
+    if data is None:
+        return create_invalid_request_error("Request body is required")
+    
+    try:
+        if request.method == 'PUT':
+            latency_profiles.configure(data)
+        else:
+            latency_profiles.update(data)
+    except ValueError as e:
+        return create_validation_error(str(e))
+    
+    return jsonify(latency_profiles.settings()), 200
+
+
+@app.route('/admin/clock', methods=['GET'])
+def get_clock():
+    return jsonify(timestamps.settings()), 200
+
+
+@app.route('/admin/clock', methods=['PUT'])
+def set_clock():
+    # {"frozen_at": "2024-01-01T00:00:00Z"} stops the clock there, {"frozen_at": null} restarts it
+    data = parse_request_json(force=True)
+    if data is None or 'frozen_at' not in data:
+        return create_invalid_request_error("frozen_at is required")
+    
+    frozen_at = data['frozen_at']
+    if frozen_at is None:
+        timestamps.unfreeze()
+    else:
+        try:
+            timestamps.freeze(parse_timestamp(frozen_at))
+        except (TypeError, ValueError):
+            return create_validation_error(f"frozen_at must be formatted as {TIMESTAMP_FORMAT}")
+    
+    return jsonify(timestamps.settings()), 200
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    return Response(server_metrics.render(), mimetype='text/plain; version=0.0.4'), 200
+
+
+@app.route('/health', methods=['GET'])
+def health():
+    return jsonify({"status": "ok"}), 200
@@ -0,0 +1,79 @@
+import calendar
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+class FrozenClock:
+    # Stands still until moved; time.time drop-in for deterministic timestamps
+
+    def __init__(self, epoch: float):
+        self.epoch = float(epoch)
+
+    def __call__(self) -> float:
+        return self.epoch
+
+    def advance(self, seconds: float) -> None:
+        self.epoch += seconds
+
+
+class TimestampService:
+    # Timestamps have second resolution, so the formatted string for the last second seen
+    # is cached: records rendered or created within the same second reuse it instead of
+    # going through datetime/strftime again. The cache is a single (epoch, text) tuple,
+    # swapped atomically, so concurrent handlers need no lock.
+
+    def __init__(self, clock: Optional[Callable[[], float]] = None):
+        self.clock = clock or time.time
+        self._cached = (None, '')
+
+    def set_clock(self, clock: Optional[Callable[[], float]] = None) -> None:
+        self.clock = clock or time.time
+
+    def freeze(self, epoch: Optional[float] = None) -> FrozenClock:
+        clock = FrozenClock(self.clock() if epoch is None else epoch)
+        self.clock = clock
+        return clock
+
+    def unfreeze(self) -> None:
+        self.clock = time.time
+
+    @property
+    def frozen(self) -> bool:
+        return isinstance(self.clock, FrozenClock)
+
+    def now_epoch(self) -> int:
+        return int(self.clock())
+
+    def format(self, epoch: int) -> str:
+        cached_epoch, text = self._cached
+        if cached_epoch == epoch:
+            return text
+        text = datetime.fromtimestamp(epoch, tz=timezone.utc).strftime(TIMESTAMP_FORMAT)
+        self._cached = (epoch, text)
+        return text
+
+    def now(self) -> str:
+        return self.format(self.now_epoch())
+
+    def settings(self) -> Dict[str, Any]:
+        epoch = self.now_epoch()
+        return {'frozen': self.frozen, 'epoch': epoch, 'now': self.format(epoch)}
+
+
+# Shared by every handler and record; tests swap the clock on this instance
+timestamps = TimestampService()
+
+
+def current_epoch() -> int:
+    return timestamps.now_epoch()
+
+
+def format_timestamp(epoch: int) -> str:
+    return timestamps.format(epoch)
+
+
+def parse_timestamp(value: str) -> int:
+    return calendar.timegm(time.strptime(value, TIMESTAMP_FORMAT))
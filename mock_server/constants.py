@@ -1,22 +1,42 @@
-from datetime import datetime
-
 ORDER_STATUS_PENDING = "pending"
 PAYMENT_STATUS_PENDING = "pending"
 PAYMENT_STATUS_REFUNDED = "refunded"
 REFUND_STATUS_COMPLETED = "completed"
 
+ORDER_STATUSES = (ORDER_STATUS_PENDING,)
+PAYMENT_STATUSES = (PAYMENT_STATUS_PENDING, PAYMENT_STATUS_REFUNDED)
+REFUND_STATUSES = (REFUND_STATUS_COMPLETED,)
+
 ERROR_INVALID_REQUEST = "INVALID_REQUEST"
 ERROR_VALIDATION_ERROR = "VALIDATION_ERROR"
 ERROR_NOT_FOUND = "NOT_FOUND"
 ERROR_INVALID_STATUS = "INVALID_STATUS"
+ERROR_INTERNAL = "INTERNAL_ERROR"
+ERROR_TIMEOUT = "GATEWAY_TIMEOUT"
+ERROR_IDEMPOTENCY_CONFLICT = "IDEMPOTENCY_CONFLICT"
+ERROR_REPLAY_MISS = "REPLAY_MISS"
+
+ERROR_CODES = (
+    ERROR_INVALID_REQUEST,
+    ERROR_VALIDATION_ERROR,
+    ERROR_NOT_FOUND,
+    ERROR_INVALID_STATUS,
+    ERROR_INTERNAL,
+    ERROR_TIMEOUT,
+    ERROR_IDEMPOTENCY_CONFLICT,
+    ERROR_REPLAY_MISS
+)
 
 DEFAULT_CURRENCY = "KZT"
 DEFAULT_PAYMENT_METHOD = "card"
 
+MAX_BATCH_SIZE = 1000
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
 MIN_PROCESSING_TIME = 0.001
 MAX_PROCESSING_TIME = 0.01
 
 
-def get_current_timestamp() -> str:
-    return datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-
+SERVER_READY_MARKER = "MOCK_SERVER_READY"
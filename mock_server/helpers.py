@@ -1,28 +1,62 @@
-from flask import jsonify
+from flask import g, jsonify, request
 from typing import Dict, Any, Optional
 import time
-import random
 from mock_server.constants import (
-    MIN_PROCESSING_TIME,
-    MAX_PROCESSING_TIME,
     ERROR_INVALID_REQUEST,
     ERROR_VALIDATION_ERROR,
     ERROR_NOT_FOUND,
-    ERROR_INVALID_STATUS
+    ERROR_INVALID_STATUS,
+    ERROR_INTERNAL,
+    ERROR_TIMEOUT
 )
+from mock_server.latency import InjectedFault, LatencyProfiles
+from utils.config import config
 
+latency_profiles = LatencyProfiles(config.mock_server_latency_profiles)
 
-def simulate_processing_time() -> None:
-    time.sleep(random.uniform(MIN_PROCESSING_TIME, MAX_PROCESSING_TIME))
 
+def current_route() -> Optional[str]:
+    # "GET /orders/{order_id}" - the same route names the client reports metrics under
+    if request.url_rule is None:
+        return None
+    return f"{request.method} {request.url_rule.rule.replace('<', '{').replace('>', '}')}"
 
-def create_error_response(code: str, message: str, status_code: int = 400) -> tuple:
-    return jsonify({
+
+def simulated_sleep(seconds: float) -> None:
+    # Accounted separately so server metrics can tell handler time from injected latency
+    start = time.perf_counter()
+    time.sleep(seconds)
+    g.simulated_seconds = g.get('simulated_seconds', 0.0) + time.perf_counter() - start
+
+
+def simulate_processing_time(endpoint: Optional[str] = None) -> None:
+    profile = latency_profiles.for_endpoint(endpoint or current_route())
+    fault = profile.fault(latency_profiles.rng)
+    
+    if fault == 'timeout':
+        simulated_sleep(profile.timeout_ms / 1000)
+        raise InjectedFault(ERROR_TIMEOUT, "Injected timeout", 504)
+    
+    # A zero delay skips the sleep call entirely so throughput runs measure only the handlers
+    delay_ms = profile.delay_ms(latency_profiles.rng)
+    if delay_ms > 0:
+        simulated_sleep(delay_ms / 1000)
+    
+    if fault == 'error':
+        raise InjectedFault(ERROR_INTERNAL, "Injected server error", profile.error_status)
+
+
+def build_error(code: str, message: str) -> Dict[str, Any]:
+    return {
         "error": {
             "code": code,
             "message": message
         }
-    }), status_code
+    }
+
+
+def create_error_response(code: str, message: str, status_code: int = 400) -> tuple:
+    return jsonify(build_error(code, message)), status_code
 
 
 def create_not_found_response(resource_type: str, resource_id: str) -> tuple:
@@ -46,8 +80,6 @@ def create_invalid_status_error(message: str) -> tuple:
 
 
 def parse_request_json(force: bool = False) -> Optional[Dict[str, Any]]:
-    from flask import request
-    
     try:
         if force:
             return request.get_json(force=True) if request.data else None
@@ -0,0 +1,163 @@
+import functools
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from flask import Response, current_app, request
+from mock_server.constants import ERROR_IDEMPOTENCY_CONFLICT
+from mock_server.helpers import create_error_response
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+REPLAYED_HEADER = 'Idempotent-Replayed'
+
+
+class CachedResponse:
+    __slots__ = ('fingerprint', 'status', 'headers', 'body', 'stored_at')
+
+    def __init__(
+        self,
+        fingerprint: bytes,
+        status: int,
+        headers: List[Tuple[str, str]],
+        body: bytes,
+        stored_at: float
+    ):
+        self.fingerprint = fingerprint
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.stored_at = stored_at
+
+
+class IdempotencyCache:
+    # First responses per (key, endpoint), least recently used first. max_entries caps
+    # the count and ttl_seconds expires keys measured from when the response was stored.
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: float = 86400,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self.entries: Dict[Tuple[str, str], CachedResponse] = OrderedDict()
+        # Keys whose handler is running; a concurrent retry with the same key waits on the event
+        self.in_flight: Dict[Tuple[str, str], threading.Event] = {}
+        self.hits = 0
+        self.misses = 0
+        self.conflicts = 0
+        self.evicted = 0
+        self._lock = threading.Lock()
+
+    def claim(self, key: Tuple[str, str]) -> Optional[threading.Event]:
+        # None when the caller now owns the key, otherwise the event to wait on before retrying
+        with self._lock:
+            event = self.in_flight.get(key)
+            if event is None:
+                self.in_flight[key] = threading.Event()
+            return event
+
+    def release(self, key: Tuple[str, str]) -> None:
+        with self._lock:
+            event = self.in_flight.pop(key)
+        event.set()
+
+    def lookup(self, key: Tuple[str, str], fingerprint: bytes) -> Tuple[str, Optional[CachedResponse]]:
+        # ('miss', None), ('hit', entry) or ('conflict', entry) when the key was used with another body
+        now = self.clock()
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None and self.ttl_seconds and now - entry.stored_at >= self.ttl_seconds:
+                del self.entries[key]
+                self.evicted += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return 'miss', None
+            self.entries.move_to_end(key)
+            if entry.fingerprint != fingerprint:
+                self.conflicts += 1
+                return 'conflict', entry
+            self.hits += 1
+            return 'hit', entry
+
+    def put(self, key: Tuple[str, str], entry: CachedResponse) -> None:
+        with self._lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while self.max_entries and len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evicted += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'entries': len(self.entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'conflicts': self.conflicts,
+                'evicted': self.evicted,
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds
+            }
+
+
+def replay(entry: CachedResponse) -> Response:
+    response = Response(entry.body, status=entry.status, headers=entry.headers)
+    response.headers[REPLAYED_HEADER] = 'true'
+    return response
+
+
+def idempotent(store: IdempotencyCache):
+    # Requests carrying an Idempotency-Key run the view once; repeats with the same key on
+    # the same endpoint get the stored response back byte-for-byte. 5xx responses are not
+    # stored, so a retry after a server error runs the handler again.
+
+    def decorator(view):
+
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            idempotency_key = request.headers.get(IDEMPOTENCY_HEADER)
+            if not idempotency_key:
+                return view(*args, **kwargs)
+
+            key = (idempotency_key, f"{request.method} {request.path}")
+            fingerprint = hashlib.sha256(request.get_data()).digest()
+
+            # Only requests with the same key and endpoint wait for each other
+            while True:
+                running = store.claim(key)
+                if running is None:
+                    break
+                running.wait()
+
+            try:
+                outcome, entry = store.lookup(key, fingerprint)
+                if outcome == 'hit':
+                    return replay(entry)
+                if outcome == 'conflict':
+                    return create_error_response(
+                        ERROR_IDEMPOTENCY_CONFLICT,
+                        f"Idempotency-Key {idempotency_key} was already used with a different request body",
+                        422
+                    )
+
+                response = current_app.make_response(view(*args, **kwargs))
+                if response.status_code < 500:
+                    store.put(key, CachedResponse(
+                        fingerprint,
+                        response.status_code,
+                        list(response.headers.items()),
+                        response.get_data(),
+                        store.clock()
+                    ))
+                return response
+            finally:
+                store.release(key)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,139 @@
+import bisect
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from flask import Flask, g
+from mock_server.helpers import current_route
+
+# Prometheus-style cumulative buckets, in seconds
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+UNMATCHED_ROUTE = 'UNMATCHED'
+
+HISTOGRAMS = {
+    'mock_server_request_duration_seconds': "Time from request start to response, including simulated latency",
+    'mock_server_handler_duration_seconds': "Time spent in the handler, excluding simulated latency",
+    'mock_server_simulated_duration_seconds': "Simulated processing time injected by latency profiles"
+}
+
+
+class Histogram:
+    __slots__ = ('counts', 'count', 'total')
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        position = bisect.bisect_left(BUCKETS, seconds)
+        if position < len(BUCKETS):
+            self.counts[position] += 1
+        self.count += 1
+        self.total += seconds
+
+
+def escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class ServerMetrics:
+    # Per-route request counters, an in-flight gauge and duration histograms, rendered in
+    # the Prometheus text exposition format. Each server process keeps its own numbers.
+
+    def __init__(self):
+        self.requests: Dict[Tuple[str, int], int] = {}
+        self.histograms: Dict[str, Dict[str, Histogram]] = {name: {} for name in HISTOGRAMS}
+        self.in_flight = 0
+        self._lock = threading.Lock()
+
+    def started(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def finished(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def record(self, route: str, status_code: int, total: float, simulated: float) -> None:
+        with self._lock:
+            key = (route, status_code)
+            self.requests[key] = self.requests.get(key, 0) + 1
+            for name, seconds in (
+                ('mock_server_request_duration_seconds', total),
+                ('mock_server_handler_duration_seconds', max(total - simulated, 0.0)),
+                ('mock_server_simulated_duration_seconds', simulated)
+            ):
+                histogram = self.histograms[name].get(route)
+                if histogram is None:
+                    histogram = self.histograms[name][route] = Histogram()
+                histogram.observe(seconds)
+
+    def render(self) -> str:
+        with self._lock:
+            lines = [
+                "# HELP mock_server_requests_total Requests handled, by route and status",
+                "# TYPE mock_server_requests_total counter"
+            ]
+            for (route, status_code), count in sorted(self.requests.items()):
+                lines.append(
+                    f'mock_server_requests_total{{route="{escape_label(route)}",status="{status_code}"}} {count}'
+                )
+            lines += [
+                "# HELP mock_server_requests_in_flight Requests currently being handled",
+                "# TYPE mock_server_requests_in_flight gauge",
+                f"mock_server_requests_in_flight {self.in_flight}"
+            ]
+            for name, description in HISTOGRAMS.items():
+                lines += [f"# HELP {name} {description}", f"# TYPE {name} histogram"]
+                for route, histogram in sorted(self.histograms[name].items()):
+                    lines += self._render_histogram(name, escape_label(route), histogram)
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _render_histogram(name: str, route: str, histogram: Histogram) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(BUCKETS, histogram.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{route="{route}",le="{bound}"}} {cumulative}')
+        lines += [
+            f'{name}_bucket{{route="{route}",le="+Inf"}} {histogram.count}',
+            f'{name}_sum{{route="{route}"}} {histogram.total:.6f}',
+            f'{name}_count{{route="{route}"}} {histogram.count}'
+        ]
+        return lines
+
+
+def server_timing_header(total_ms: float, simulated_ms: float) -> str:
+    return f"app;dur={max(total_ms - simulated_ms, 0.0):.3f}, sim;dur={simulated_ms:.3f}, total;dur={total_ms:.3f}"
+
+
+def instrument(app: Flask, metrics: ServerMetrics) -> None:
+    # simulate_processing_time adds its sleeps to g.simulated_seconds so handler time can be split out
+
+    @app.before_request
+    def start_timer():
+        g.request_start = time.perf_counter()
+        g.simulated_seconds = 0.0
+        metrics.started()
+
+    @app.after_request
+    def record_timing(response):
+        start: Optional[float] = g.pop('request_start', None)
+        if start is None:
+            return response
+        total = time.perf_counter() - start
+        simulated = g.get('simulated_seconds', 0.0)
+        metrics.record(current_route() or UNMATCHED_ROUTE, response.status_code, total, simulated)
+        response.headers['Server-Timing'] = server_timing_header(total * 1000, simulated * 1000)
+        return response
+
+    @app.teardown_request
+    def finish(exception=None):
+        # Runs even when an unhandled error skipped after_request
+        start = g.pop('request_start', None)
+        if start is not None:
+            metrics.record(
+                current_route() or UNMATCHED_ROUTE, 500, time.perf_counter() - start, g.get('simulated_seconds', 0.0)
+            )
+        metrics.finished()
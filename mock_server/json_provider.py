@@ -0,0 +1,46 @@
+import re
+from typing import Any
+from flask import Flask, Response
+from flask.json.provider import JSONProvider
+from utils.json_backend import get_json_backend
+
+# Everything json.dumps(ensure_ascii=True) escapes that orjson writes out raw
+NEEDS_ESCAPE = re.compile('[^\x00-\x7e]')
+
+
+def escape_non_ascii(text: str) -> str:
+    # \uXXXX escapes (surrogate pairs above the BMP), as json.dumps(ensure_ascii=True) writes them
+    def escape(match: re.Match) -> str:
+        code = ord(match.group())
+        if code > 0xFFFF:
+            code -= 0x10000
+            return '\\u%04x\\u%04x' % (0xD800 | code >> 10, 0xDC00 | code & 0x3FF)
+        return '\\u%04x' % code
+    return NEEDS_ESCAPE.sub(escape, text)
+
+
+class FastJSONProvider(JSONProvider):
+    # jsonify and request.get_json go through the configured backend (orjson when
+    # available); responses are built from bytes without an intermediate str. The wire
+    # format stays that of Flask's default provider: sorted keys, ASCII-only text and a
+    # trailing newline.
+
+    def __init__(self, app: Flask, backend: str = 'auto'):
+        super().__init__(app)
+        self.backend = get_json_backend(backend)
+
+    def _encode(self, obj: Any) -> bytes:
+        data = self.backend.dumps(obj, sort_keys=True)
+        if not data.isascii() or b'\x7f' in data:
+            data = escape_non_ascii(data.decode('utf-8')).encode('ascii')
+        return data
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return self._encode(obj).decode('ascii')
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return self.backend.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._encode(obj) + b'\n', mimetype='application/json')
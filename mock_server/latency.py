@@ -0,0 +1,187 @@
+import bisect
+import math
+import random
+import threading
+from typing import Dict, Any, List, Optional
+from mock_server.constants import MIN_PROCESSING_TIME, MAX_PROCESSING_TIME
+
+LATENCY_TYPES = ('zero', 'uniform', 'fixed', 'normal', 'lognormal', 'histogram')
+DEFAULT_TIMEOUT_MS = 10000
+DEFAULT_ERROR_STATUS = 500
+
+# Profiles are plain dicts so they round-trip through config.json and the admin endpoint:
+#   {"type": "fixed", "ms": 20}
+#   {"type": "uniform", "min_ms": 1, "max_ms": 10}
+#   {"type": "normal", "mean_ms": 40, "stddev_ms": 10}
+#   {"type": "lognormal", "median_ms": 30, "sigma": 0.8}
+#   {"type": "histogram", "buckets": [[10, 900], [50, 90], [400, 10]]}  - [upper_ms, count]
+# plus optional fault rates: "error_rate", "error_status", "timeout_rate", "timeout_ms".
+DEFAULT_PROFILE = {
+    'type': 'uniform',
+    'min_ms': MIN_PROCESSING_TIME * 1000,
+    'max_ms': MAX_PROCESSING_TIME * 1000
+}
+
+
+class InjectedFault(Exception):
+
+    def __init__(self, code: str, message: str, status_code: int):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.status_code = status_code
+
+
+def check_number(value: Any, name: str, minimum: float = 0) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value < minimum:
+        raise ValueError(f"{name} must be a number >= {minimum}")
+    return value
+
+
+def number(spec: Dict[str, Any], key: str, default: Optional[float] = None, minimum: float = 0) -> float:
+    return check_number(spec.get(key, default), key, minimum)
+
+
+def rate(spec: Dict[str, Any], key: str) -> float:
+    value = number(spec, key, 0)
+    if value > 1:
+        raise ValueError(f"{key} must be between 0 and 1")
+    return value
+
+
+class LatencyProfile:
+    # A compiled profile: delay_ms() samples the next delay, fault() decides whether this
+    # request fails and how; all parameters are validated up front so sampling cannot raise
+
+    def __init__(self, spec: Dict[str, Any]):
+        if not isinstance(spec, dict):
+            raise ValueError("latency profile must be an object")
+        self.spec = spec
+        self.type = spec.get('type', 'uniform')
+        if self.type not in LATENCY_TYPES:
+            raise ValueError(f"type must be one of {', '.join(LATENCY_TYPES)}")
+        self.error_rate = rate(spec, 'error_rate')
+        self.timeout_rate = rate(spec, 'timeout_rate')
+        self.error_status = int(number(spec, 'error_status', DEFAULT_ERROR_STATUS, minimum=500))
+        if self.error_status > 599:
+            raise ValueError("error_status must be a 5xx status")
+        self.timeout_ms = number(spec, 'timeout_ms', DEFAULT_TIMEOUT_MS)
+        self._compile()
+
+    def _compile(self) -> None:
+        spec = self.spec
+        if self.type == 'uniform':
+            self.low = number(spec, 'min_ms', DEFAULT_PROFILE['min_ms'])
+            self.high = number(spec, 'max_ms', DEFAULT_PROFILE['max_ms'])
+            if self.high < self.low:
+                raise ValueError("max_ms must be >= min_ms")
+        elif self.type == 'fixed':
+            self.ms = number(spec, 'ms')
+        elif self.type == 'normal':
+            self.mean = number(spec, 'mean_ms')
+            self.stddev = number(spec, 'stddev_ms')
+        elif self.type == 'lognormal':
+            self.mu = math.log(number(spec, 'median_ms', minimum=0.001))
+            self.sigma = number(spec, 'sigma')
+        elif self.type == 'histogram':
+            self._compile_histogram(spec.get('buckets'))
+
+    def _compile_histogram(self, buckets: Any) -> None:
+        # Cumulative weights for bisect sampling; a delay is drawn uniformly inside its bucket
+        if not isinstance(buckets, list) or not buckets or any(
+            not isinstance(bucket, list) or len(bucket) != 2 for bucket in buckets
+        ):
+            raise ValueError("buckets must be a non-empty list of [upper_ms, count]")
+        self.bounds: List[float] = []
+        self.cumulative: List[float] = []
+        total = 0
+        for upper, count in sorted(
+            (check_number(upper, 'upper_ms'), check_number(count, 'count')) for upper, count in buckets
+        ):
+            total += count
+            self.bounds.append(upper)
+            self.cumulative.append(total)
+        if total <= 0:
+            raise ValueError("buckets must have a positive total count")
+
+    def delay_ms(self, rng: random.Random) -> float:
+        if self.type == 'zero':
+            return 0.0
+        if self.type == 'uniform':
+            return rng.uniform(self.low, self.high)
+        if self.type == 'fixed':
+            return self.ms
+        if self.type == 'normal':
+            return max(0.0, rng.gauss(self.mean, self.stddev))
+        if self.type == 'lognormal':
+            return rng.lognormvariate(self.mu, self.sigma)
+        position = bisect.bisect_right(self.cumulative, rng.uniform(0, self.cumulative[-1]))
+        position = min(position, len(self.bounds) - 1)
+        lower = self.bounds[position - 1] if position else 0.0
+        return rng.uniform(lower, self.bounds[position])
+
+    def fault(self, rng: random.Random) -> Optional[str]:
+        if not self.error_rate and not self.timeout_rate:
+            return None
+        roll = rng.random()
+        if roll < self.timeout_rate:
+            return 'timeout'
+        if roll < self.timeout_rate + self.error_rate:
+            return 'error'
+        return None
+
+
+class LatencyProfiles:
+    # The default profile plus per-endpoint overrides keyed like the client routes,
+    # e.g. "GET /orders/{order_id}". Updates swap the whole mapping, so readers never lock.
+
+    def __init__(self, settings: Optional[Dict[str, Any]] = None, seed: Optional[int] = None):
+        self.rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.configure(settings or {})
+
+    @staticmethod
+    def compile(settings: Dict[str, Any]) -> Dict[str, Any]:
+        if not isinstance(settings, dict):
+            raise ValueError("latency settings must be an object")
+        endpoints = settings.get('endpoints', {})
+        if not isinstance(endpoints, dict):
+            raise ValueError("endpoints must be an object")
+        compiled = {}
+        for route, spec in endpoints.items():
+            try:
+                compiled[route] = LatencyProfile(spec)
+            except ValueError as e:
+                raise ValueError(f"{route}: {e}") from e
+        return {'default': LatencyProfile(settings.get('default', DEFAULT_PROFILE)), 'endpoints': compiled}
+
+    def configure(self, settings: Dict[str, Any]) -> None:
+        compiled = self.compile(settings)
+        with self._lock:
+            self._profiles = compiled
+
+    def update(self, settings: Dict[str, Any]) -> None:
+        # Merge per-endpoint overrides into the current settings; null removes an override
+        if not isinstance(settings, dict) or not isinstance(settings.get('endpoints') or {}, dict):
+            raise ValueError("latency settings must be an object with an endpoints object")
+        with self._lock:
+            current = self.settings()
+            if 'default' in settings:
+                current['default'] = settings['default']
+            for route, spec in (settings.get('endpoints') or {}).items():
+                if spec is None:
+                    current['endpoints'].pop(route, None)
+                else:
+                    current['endpoints'][route] = spec
+            self._profiles = self.compile(current)
+
+    def settings(self) -> Dict[str, Any]:
+        profiles = self._profiles
+        return {
+            'default': dict(profiles['default'].spec),
+            'endpoints': {route: dict(profile.spec) for route, profile in profiles['endpoints'].items()}
+        }
+
+    def for_endpoint(self, endpoint: Optional[str]) -> LatencyProfile:
+        profiles = self._profiles
+        return profiles['endpoints'].get(endpoint, profiles['default'])
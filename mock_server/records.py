@@ -0,0 +1,120 @@
+import sys
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional
+from mock_server.clock import format_timestamp
+
+# Stored orders and payments use __slots__ records instead of dicts: no per-record key
+# strings or hash table, integer sequence numbers instead of "order_123" id strings,
+# interned status/currency strings and epoch-second timestamps. The JSON shape is only
+# built by to_dict() when a response is rendered.
+
+EMPTY_CUSTOMER = object()
+
+
+class CompactRecord(ABC):
+    __slots__ = ('seq', 'last_access')
+    PREFIX = ''
+
+    @classmethod
+    def format_id(cls, seq: int) -> str:
+        return f"{cls.PREFIX}_{seq}"
+
+    @classmethod
+    def parse_id(cls, record_id: str) -> Optional[int]:
+        prefix, _, number = record_id.rpartition('_')
+        # Only the canonical spelling maps to a record: "order_01" is not "order_1"
+        if prefix != cls.PREFIX or not (number.isascii() and number.isdigit()) or str(int(number)) != number:
+            return None
+        return int(number)
+
+    @property
+    def id(self) -> str:
+        return self.format_id(self.seq)
+
+    @abstractmethod
+    def to_dict(self) -> Dict[str, Any]:
+        ...
+
+
+class OrderRecord(CompactRecord):
+    __slots__ = ('amount', 'currency', 'status', 'created_at', 'description', 'customer')
+    PREFIX = 'order'
+
+    def __init__(
+        self,
+        seq: int,
+        amount: float,
+        currency: str,
+        status: str,
+        created_at: int,
+        description: str = '',
+        customer: Any = EMPTY_CUSTOMER
+    ):
+        self.seq = seq
+        self.last_access = 0.0
+        self.amount = amount
+        self.currency = sys.intern(currency) if isinstance(currency, str) else currency
+        self.status = sys.intern(status)
+        self.created_at = created_at
+        self.description = description
+        self.customer = EMPTY_CUSTOMER if customer == {} else customer
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "amount": self.amount,
+            "currency": self.currency,
+            "status": self.status,
+            "created_at": format_timestamp(self.created_at),
+            "description": self.description,
+            "customer": {} if self.customer is EMPTY_CUSTOMER else self.customer
+        }
+
+
+class PaymentRecord(CompactRecord):
+    __slots__ = (
+        'order_seq', 'amount', 'currency', 'status', 'created_at', 'payment_method',
+        'refunded_amount', 'refunded_at'
+    )
+    PREFIX = 'payment'
+
+    def __init__(
+        self,
+        seq: int,
+        order_seq: int,
+        amount: float,
+        currency: str,
+        status: str,
+        created_at: int,
+        payment_method: str
+    ):
+        self.seq = seq
+        self.last_access = 0.0
+        self.order_seq = order_seq
+        self.amount = amount
+        self.currency = sys.intern(currency) if isinstance(currency, str) else currency
+        self.status = sys.intern(status)
+        self.created_at = created_at
+        self.payment_method = sys.intern(payment_method) if isinstance(payment_method, str) else payment_method
+        self.refunded_amount = None
+        self.refunded_at = None
+
+    def refund(self, amount: float, status: str, refunded_at: int) -> None:
+        self.refunded_amount = amount
+        self.refunded_at = refunded_at
+        self.status = sys.intern(status)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "id": self.id,
+            "order_id": OrderRecord.format_id(self.order_seq),
+            "amount": self.amount,
+            "currency": self.currency,
+            "status": self.status,
+            "created_at": format_timestamp(self.created_at),
+            "payment_method": self.payment_method
+        }
+        if self.refunded_at is not None:
+            data["refunded_amount"] = self.refunded_amount
+            data["refunded_at"] = format_timestamp(self.refunded_at)
+        return data
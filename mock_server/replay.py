@@ -0,0 +1,107 @@
+import threading
+from collections import deque
+from typing import Dict, Any, Deque, List, Optional, Tuple
+from utils.capture import iter_capture, request_key
+
+DEFAULT_MAX_BUFFERED = 10000
+DEFAULT_MAX_READ_AHEAD = 1000
+READ_CHUNK = 64
+
+
+class ReplayStore:
+    # Serves recorded responses in capture order per request key. The capture is read
+    # lazily: a request reads ahead until its own next entry turns up, buffering the
+    # entries it passes over for the requests that will follow. A single lookup reads at
+    # most max_read_ahead entries and the buffer never holds more than max_buffered, so
+    # memory stays bounded however large the capture is; when either limit is hit the
+    # request misses but nothing is discarded, later requests still find their entries.
+    # The file is read under its own lock, so requests served from the buffer never wait
+    # on capture I/O.
+
+    def __init__(
+        self,
+        path: str,
+        max_buffered: int = DEFAULT_MAX_BUFFERED,
+        replay_latency: bool = True,
+        max_read_ahead: int = DEFAULT_MAX_READ_AHEAD
+    ):
+        self.path = path
+        self.max_buffered = max_buffered
+        self.max_read_ahead = max_read_ahead
+        self.replay_latency = replay_latency
+        self.entries = iter_capture(path)
+        self.pending: Dict[str, Deque[Dict[str, Any]]] = {}
+        self.buffered = 0
+        self.exhausted = False
+        self.served = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._read_lock = threading.Lock()
+
+    def _pop(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            queue = self.pending.get(key)
+            if not queue:
+                return None
+            entry = queue.popleft()
+            self.buffered -= 1
+            if not queue:
+                del self.pending[key]
+            self.served += 1
+            return entry
+
+    def _read_chunk(self, size: int) -> List[Tuple[str, Dict[str, Any]]]:
+        chunk = []
+        for _ in range(size):
+            entry = next(self.entries, None)
+            if entry is None:
+                self.exhausted = True
+                break
+            chunk.append((request_key(entry['method'], entry['path'], entry['body']), entry))
+        return chunk
+
+    def take(self, method: str, path: str, body: Optional[str]) -> Optional[Dict[str, Any]]:
+        key = request_key(method, path, body)
+        entry = self._pop(key)
+        if entry is not None:
+            return entry
+
+        read = 0
+        with self._read_lock:
+            while True:
+                # Another request's read-ahead may have buffered this entry meanwhile
+                entry = self._pop(key)
+                if entry is not None:
+                    return entry
+                size = min(READ_CHUNK, self.max_read_ahead - read, self.max_buffered - self.buffered)
+                if self.exhausted or size <= 0:
+                    break
+                chunk = self._read_chunk(size)
+                read += len(chunk)
+                with self._lock:
+                    for entry_key, chunk_entry in chunk:
+                        self.pending.setdefault(entry_key, deque()).append(chunk_entry)
+                    self.buffered += len(chunk)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def latency_seconds(self, entry: Dict[str, Any]) -> float:
+        # The server-side time when the capture has it, otherwise what the client observed
+        if not self.replay_latency:
+            return 0.0
+        ms = entry.get('server_ms')
+        if ms is None:
+            ms = entry.get('ms') or 0.0
+        return ms / 1000
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'path': self.path,
+                'served': self.served,
+                'misses': self.misses,
+                'buffered': self.buffered,
+                'exhausted': self.exhausted
+            }
@@ -0,0 +1,75 @@
+"""
+Pre-seed a SQLite database for the mock server.
+
+Usage:
+    python -m mock_server.seed --orders 1000000 --payments-per-order 1
+    python mock_server.py --storage sqlite
+"""
+import argparse
+import random
+import sys
+import time
+from typing import List, Optional
+from mock_server.constants import (
+    ORDER_STATUS_PENDING,
+    PAYMENT_STATUS_PENDING,
+    DEFAULT_CURRENCY,
+    DEFAULT_PAYMENT_METHOD
+)
+from mock_server.clock import current_epoch
+from mock_server.records import OrderRecord, PaymentRecord
+from mock_server.sqlite_storage import SQLiteStorage
+from utils.config import config
+
+CHUNK_SIZE = 50000
+
+
+def seed(storage: SQLiteStorage, orders: int, payments_per_order: int = 0) -> None:
+    created_at = current_epoch()
+    remaining = orders
+    while remaining > 0:
+        chunk = min(CHUNK_SIZE, remaining)
+        order_records = [
+            OrderRecord(
+                storage.orders.next_seq(),
+                amount=round(random.uniform(100, 100000), 2),
+                currency=DEFAULT_CURRENCY,
+                status=ORDER_STATUS_PENDING,
+                created_at=created_at
+            )
+            for _ in range(chunk)
+        ]
+        storage.orders.insert_many(order_records)
+        storage.payments.insert_many(
+            PaymentRecord(
+                storage.payments.next_seq(),
+                order_seq=order.seq,
+                amount=order.amount,
+                currency=order.currency,
+                status=PAYMENT_STATUS_PENDING,
+                created_at=created_at,
+                payment_method=DEFAULT_PAYMENT_METHOD
+            )
+            for order in order_records
+            for _ in range(payments_per_order)
+        )
+        remaining -= chunk
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Pre-seed the mock server SQLite database")
+    parser.add_argument('--db', default=str(config.base_dir / config.mock_server_sqlite_path))
+    parser.add_argument('--orders', type=int, default=100000)
+    parser.add_argument('--payments-per-order', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    start = time.monotonic()
+    storage = SQLiteStorage(args.db)
+    seed(storage, args.orders, args.payments_per_order)
+    storage.close()
+    print(f"Seeded {args.orders} orders into {args.db} in {time.monotonic() - start:.1f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+from typing import Callable
+
+SERVER_ENGINES = ('werkzeug', 'waitress', 'gunicorn')
+
+
+def serve_werkzeug(app, host: str, port: int, threads: int, workers: int, on_ready: Callable[[int], None]) -> None:
+    from werkzeug.serving import make_server
+
+    # processes=N would fork per request, each child with a throwaway copy of the storage
+    if workers > 1:
+        raise ValueError("werkzeug is single-process; use the gunicorn engine for workers")
+    server = make_server(host, port, app, threaded=True)
+    on_ready(server.server_port)
+    server.serve_forever()
+
+
+def serve_waitress(app, host: str, port: int, threads: int, workers: int, on_ready: Callable[[int], None]) -> None:
+    try:
+        from waitress import create_server
+    except ImportError as e:
+        raise RuntimeError("waitress is not installed: pip install waitress") from e
+
+    if workers > 1:
+        raise ValueError("waitress is single-process; use --threads or the gunicorn engine for workers")
+
+    server = create_server(app, host=host, port=port, threads=threads, connection_limit=max(threads * 64, 1000))
+    on_ready(server.effective_port)
+    server.run()
+
+
+def serve_gunicorn(app, host: str, port: int, threads: int, workers: int, on_ready: Callable[[int], None]) -> None:
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError as e:
+        raise RuntimeError("gunicorn is not installed (POSIX only): pip install gunicorn") from e
+
+    class MockServerApplication(BaseApplication):
+
+        def load_config(self):
+            self.cfg.set('bind', f"{host}:{port}")
+            self.cfg.set('workers', workers)
+            self.cfg.set('threads', threads)
+            self.cfg.set('worker_class', 'gthread')
+            self.cfg.set('keepalive', 30)
+            self.cfg.set('backlog', 2048)
+            self.cfg.set('when_ready', lambda arbiter: on_ready(arbiter.LISTENERS[0].sock.getsockname()[1]))
+
+        def load(self):
+            return app
+
+    MockServerApplication().run()
+
+
+def serve(
+    app,
+    host: str,
+    port: int,
+    engine: str = 'waitress',
+    threads: int = 8,
+    workers: int = 1,
+    on_ready: Callable[[int], None] = lambda port: None
+) -> None:
+    # Each gunicorn worker holds its own in-memory state, so workers > 1 only suits
+    # stateless throughput runs; SQLite storage is refused with workers by the launcher
+    engines = {
+        'werkzeug': serve_werkzeug,
+        'waitress': serve_waitress,
+        'gunicorn': serve_gunicorn
+    }
+    if engine not in engines:
+        raise ValueError(f"Unknown server engine '{engine}', expected one of {', '.join(SERVER_ENGINES)}")
+    engines[engine](app, host, port, threads, workers, on_ready)
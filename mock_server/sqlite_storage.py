@@ -0,0 +1,338 @@
+import atexit
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Tuple, Type
+from mock_server.records import CompactRecord, OrderRecord, PaymentRecord, EMPTY_CUSTOMER
+from mock_server.storage import StripedLock, DEFAULT_LOCK_STRIPES, process_memory_bytes
+
+# Columns without a declared type keep SQLite from coercing values, so an amount posted
+# as 1000 comes back as 1000 and not 1000.0 - responses stay identical to the memory backend
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS orders (
+    seq INTEGER PRIMARY KEY,
+    amount,
+    currency,
+    status TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    description,
+    customer TEXT
+);
+CREATE TABLE IF NOT EXISTS payments (
+    seq INTEGER PRIMARY KEY,
+    order_seq INTEGER NOT NULL,
+    amount,
+    currency,
+    status TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    payment_method,
+    refunded_amount,
+    refunded_at INTEGER
+);
+CREATE INDEX IF NOT EXISTS orders_status ON orders (status, seq);
+CREATE INDEX IF NOT EXISTS orders_currency ON orders (currency, seq);
+CREATE INDEX IF NOT EXISTS orders_created_at ON orders (created_at, seq);
+CREATE INDEX IF NOT EXISTS payments_order ON payments (order_seq, seq);
+CREATE INDEX IF NOT EXISTS payments_status ON payments (status, seq);
+"""
+
+BINDABLE_TYPES = (int, float, str, type(None))
+
+
+def check_row(table: str, row: tuple) -> None:
+    # A value sqlite3 cannot bind fails the statement; reject it before touching the transaction
+    for value in row:
+        if not isinstance(value, BINDABLE_TYPES):
+            raise ValueError(f"Cannot store {type(value).__name__} value {value!r} in {table}")
+
+
+def order_to_row(order: OrderRecord) -> tuple:
+    customer = None if order.customer is EMPTY_CUSTOMER else json.dumps(order.customer)
+    return (order.seq, order.amount, order.currency, order.status, order.created_at, order.description, customer)
+
+
+def order_from_row(row: tuple) -> OrderRecord:
+    seq, amount, currency, status, created_at, description, customer = row
+    return OrderRecord(
+        seq,
+        amount=amount,
+        currency=currency,
+        status=status,
+        created_at=created_at,
+        description=description,
+        customer=EMPTY_CUSTOMER if customer is None else json.loads(customer)
+    )
+
+
+def payment_to_row(payment: PaymentRecord) -> tuple:
+    return (
+        payment.seq, payment.order_seq, payment.amount, payment.currency, payment.status,
+        payment.created_at, payment.payment_method, payment.refunded_amount, payment.refunded_at
+    )
+
+
+def payment_from_row(row: tuple) -> PaymentRecord:
+    seq, order_seq, amount, currency, status, created_at, payment_method, refunded_amount, refunded_at = row
+    payment = PaymentRecord(
+        seq,
+        order_seq=order_seq,
+        amount=amount,
+        currency=currency,
+        status=status,
+        created_at=created_at,
+        payment_method=payment_method
+    )
+    payment.refunded_amount = refunded_amount
+    payment.refunded_at = refunded_at
+    return payment
+
+
+class SQLiteDatabase:
+    # One connection shared by all threads. Writes are committed in groups - when
+    # batch_size writes are pending or every flush_interval seconds - which keeps
+    # throughput close to the in-memory store; reads on the same connection already
+    # see uncommitted writes.
+
+    def __init__(self, path: str, batch_size: int = 500, flush_interval: float = 0.05):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        self.lock = threading.RLock()
+        self.pending = 0
+        self.closed = False
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._flusher.start()
+        atexit.register(self.close)
+
+    def _flush_periodically(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.commit()
+
+    def commit(self) -> None:
+        with self.lock:
+            if self.pending and not self.closed:
+                self.connection.execute("COMMIT")
+                self.pending = 0
+
+    @contextmanager
+    def _statement(self) -> Iterator[None]:
+        # Runs one write inside the open batch; a failing write is rolled back on its own
+        # (to a savepoint when earlier writes are pending) and the error re-raised, so the
+        # batch stays usable and the writes before it still get committed
+        if self.pending:
+            self.connection.execute("SAVEPOINT write")
+        else:
+            self.connection.execute("BEGIN")
+        try:
+            yield
+        except Exception:
+            if self.pending:
+                self.connection.execute("ROLLBACK TO write")
+                self.connection.execute("RELEASE write")
+            else:
+                self.connection.execute("ROLLBACK")
+            raise
+        if self.pending:
+            self.connection.execute("RELEASE write")
+
+    def write(self, sql: str, params: tuple = ()) -> None:
+        with self.lock:
+            with self._statement():
+                self.connection.execute(sql, params)
+            self.pending += 1
+            if self.pending >= self.batch_size:
+                self.connection.execute("COMMIT")
+                self.pending = 0
+
+    def write_many(self, sql: str, rows: Iterable[tuple]) -> None:
+        with self.lock:
+            with self._statement():
+                self.connection.executemany(sql, rows)
+            self.connection.execute("COMMIT")
+            self.pending = 0
+
+    def query_one(self, sql: str, params: tuple = ()) -> Optional[tuple]:
+        with self.lock:
+            return self.connection.execute(sql, params).fetchone()
+
+    def query_all(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self.lock:
+            return self.connection.execute(sql, params).fetchall()
+
+    def close(self) -> None:
+        self._stop.set()
+        with self.lock:
+            if self.closed:
+                return
+            if self.pending:
+                self.connection.execute("COMMIT")
+                self.pending = 0
+            self.closed = True
+            self.connection.close()
+
+
+class SQLiteRecordStore:
+
+    def __init__(
+        self,
+        database: SQLiteDatabase,
+        record_type: Type[CompactRecord],
+        table: str,
+        to_row,
+        from_row,
+        index_columns: Dict[str, str],
+        stripes: int = DEFAULT_LOCK_STRIPES
+    ):
+        self.database = database
+        self.index_columns = index_columns
+        self.record_type = record_type
+        self.table = table
+        self.to_row = to_row
+        self.from_row = from_row
+        self.locks = StripedLock(stripes)
+        self.inserted = 0
+        self._counter_lock = threading.Lock()
+        max_seq, count = database.query_one(f"SELECT COALESCE(MAX(seq), 0), COUNT(*) FROM {table}")
+        self._next_seq = max_seq + 1
+        self._count = count
+        columns = [row[1] for row in database.query_all(f"PRAGMA table_info({table})")]
+        # Plain INSERT so a reused seq fails loudly instead of overwriting another record
+        self._insert_sql = f"INSERT INTO {table} VALUES ({', '.join('?' * len(columns))})"
+        self._update_sql = (
+            f"UPDATE {table} SET {', '.join(f'{column} = ?' for column in columns[1:])} WHERE seq = ?"
+        )
+
+    def next_seq(self) -> int:
+        with self._counter_lock:
+            seq = self._next_seq
+            self._next_seq += 1
+            return seq
+
+    def allocate(self, now: Callable[[], int]) -> Tuple[int, int]:
+        with self._counter_lock:
+            seq = self._next_seq
+            self._next_seq += 1
+            return seq, now()
+
+    def _row(self, record: CompactRecord) -> tuple:
+        row = self.to_row(record)
+        check_row(self.table, row)
+        return row
+
+    def insert(self, record: CompactRecord) -> None:
+        self.database.write(self._insert_sql, self._row(record))
+        with self._counter_lock:
+            self.inserted += 1
+            self._count += 1
+
+    def insert_many(self, records: Iterable[CompactRecord]) -> None:
+        rows = [self._row(record) for record in records]
+        if not rows:
+            return
+        self.database.write_many(self._insert_sql, rows)
+        with self._counter_lock:
+            self.inserted += len(rows)
+            self._count += len(rows)
+
+    def _load(self, record_id: str) -> Optional[CompactRecord]:
+        seq = self.record_type.parse_id(record_id)
+        if seq is None:
+            return None
+        row = self.database.query_one(f"SELECT * FROM {self.table} WHERE seq = ?", (seq,))
+        return self.from_row(row) if row is not None else None
+
+    def get(self, record_id: str) -> Optional[Dict[str, Any]]:
+        record = self._load(record_id)
+        return record.to_dict() if record is not None else None
+
+    @contextmanager
+    def locked(self, record_id: str) -> Iterator[Optional[CompactRecord]]:
+        # Changes made to the yielded record inside the block are written back on exit;
+        # a record left untouched (e.g. a rejected refund) is not written at all
+        with self.locks.for_key(record_id):
+            record = self._load(record_id)
+            original = self.to_row(record) if record is not None else None
+            yield record
+            if record is not None:
+                row = self._row(record)
+                if row != original:
+                    self.database.write(self._update_sql, row[1:] + row[:1])
+
+    def query(
+        self,
+        filters: Dict[str, Any],
+        created_from: Optional[int] = None,
+        created_to: Optional[int] = None,
+        after: int = 0,
+        limit: int = 50
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        conditions = ["seq > ?"]
+        params: List[Any] = [after]
+        for name, value in filters.items():
+            conditions.append(f"{self.index_columns[name]} = ?")
+            params.append(value)
+        if created_from is not None:
+            conditions.append("created_at >= ?")
+            params.append(created_from)
+        if created_to is not None:
+            conditions.append("created_at <= ?")
+            params.append(created_to)
+        params.append(limit + 1)
+        rows = self.database.query_all(
+            f"SELECT * FROM {self.table} WHERE {' AND '.join(conditions)} ORDER BY seq LIMIT ?",
+            tuple(params)
+        )
+        records = [self.from_row(row) for row in rows]
+        next_cursor = records[limit - 1].seq if len(records) > limit else None
+        return [record.to_dict() for record in records[:limit]], next_cursor
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'records': self._count,
+            'inserted': self.inserted,
+            'evicted_lru': 0,
+            'expired_ttl': 0,
+            'max_records': 0,
+            'ttl_seconds': 0
+        }
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class SQLiteStorage:
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 500,
+        flush_interval: float = 0.05,
+        stripes: int = DEFAULT_LOCK_STRIPES
+    ):
+        self.database = SQLiteDatabase(path, batch_size, flush_interval)
+        self.orders = SQLiteRecordStore(
+            self.database, OrderRecord, 'orders', order_to_row, order_from_row,
+            {'status': 'status', 'currency': 'currency'}, stripes
+        )
+        self.payments = SQLiteRecordStore(
+            self.database, PaymentRecord, 'payments', payment_to_row, payment_from_row,
+            {'order': 'order_seq', 'status': 'status'}, stripes
+        )
+
+    def close(self) -> None:
+        self.database.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'orders': self.orders.stats(),
+            'payments': self.payments.stats(),
+            'rss_bytes': process_memory_bytes(),
+            'backend': 'sqlite',
+            'path': self.database.path
+        }
@@ -0,0 +1,463 @@
+import bisect
+import itertools
+import os
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Tuple, Type
+from mock_server.records import CompactRecord, OrderRecord, PaymentRecord
+
+DEFAULT_LOCK_STRIPES = 64
+MAX_EXPIRED_PER_SWEEP = 128
+
+
+class StripedLock:
+    # A fixed pool of locks shared by hash: per-record exclusion without a lock per record
+
+    def __init__(self, stripes: int = DEFAULT_LOCK_STRIPES):
+        self.locks = [threading.Lock() for _ in range(stripes)]
+
+    def for_key(self, key: str) -> threading.Lock:
+        return self.locks[hash(key) % len(self.locks)]
+
+
+def index_key(value: Any) -> Any:
+    return value if isinstance(value, (str, int)) else None
+
+
+class SeqList:
+    # Sorted sequence numbers with lazy removal. Records are evicted from the cold end,
+    # which is almost always the front of the list, so removing one usually just moves
+    # `head` forward; the prefix is cut off once it is half the list. Anything removed
+    # from the middle stays behind as a stale entry until the list is compacted, which
+    # filters it in seq order without sorting.
+
+    __slots__ = ('seqs', 'head', 'stale')
+
+    def __init__(self):
+        self.seqs = array('q')
+        self.head = 0
+        self.stale = 0
+
+    def __len__(self) -> int:
+        return len(self.seqs) - self.head
+
+    def add(self, seq: int) -> None:
+        # Sequence numbers arrive almost in order, so appending is the common case
+        seqs = self.seqs
+        if not seqs or seq > seqs[-1]:
+            seqs.append(seq)
+        else:
+            bisect.insort(seqs, seq, self.head)
+
+    def start(self, after: int) -> int:
+        return bisect.bisect_right(self.seqs, after, self.head)
+
+    def first(self) -> Optional[int]:
+        return self.seqs[self.head] if self.head < len(self.seqs) else None
+
+    def discard(self, seq: int, is_live: Callable[[int], bool]) -> bool:
+        # Returns True when the list was trimmed or compacted
+        seqs = self.seqs
+        if self.head < len(seqs) and seqs[self.head] == seq:
+            self.head += 1
+            # Stale entries that reach the front go with it
+            while self.head < len(seqs) and not is_live(seqs[self.head]):
+                self.head += 1
+                self.stale = max(self.stale - 1, 0)
+            if self.head > 1024 and self.head * 2 > len(seqs):
+                del seqs[:self.head]
+                self.head = 0
+                return True
+            return False
+        return self.mark_stale(is_live)
+
+    def mark_stale(self, is_live: Callable[[int], bool]) -> bool:
+        self.stale += 1
+        if self.stale > max(len(self) - self.stale, 1024):
+            self.compact(is_live)
+            return True
+        return False
+
+    def compact(self, is_live: Callable[[int], bool]) -> None:
+        kept = array('q')
+        previous = None
+        for position in range(self.head, len(self.seqs)):
+            seq = self.seqs[position]
+            if seq != previous and is_live(seq):
+                kept.append(seq)
+                previous = seq
+        self.seqs = kept
+        self.head = 0
+        self.stale = 0
+
+
+class RecordIndex:
+    # Secondary indexes as sorted seq lists per field value, plus a per-second time index
+    # mapping created_at to the first and last seq created in that second. The time index
+    # is only valid while created_at never decreases as seq grows (RecordStore.allocate
+    # hands both out together); records may be inserted in any order, but once one breaks
+    # that order (a frozen or rewound clock) created_at filters fall back to a full scan
+    # until the out-of-order records have been evicted. Evictions and field changes update the
+    # index incrementally, it is never rebuilt as a whole.
+
+    def __init__(self, fields: Dict[str, Callable[[CompactRecord], Any]], records: Dict[int, CompactRecord]):
+        self.fields = fields
+        self.records = records
+        self.all = SeqList()
+        self.postings: Dict[str, Dict[Any, SeqList]] = {name: {} for name in self.fields}
+        self.reset_time_index()
+
+    def reset_time_index(self) -> None:
+        self.time_seconds = array('q')
+        self.time_seqs = array('q')
+        self.time_last_seqs = array('q')
+        self.time_ordered = True
+        self.max_seq = 0
+
+    def keys(self, record: CompactRecord) -> Dict[str, Any]:
+        return {name: index_key(key_fn(record)) for name, key_fn in self.fields.items()}
+
+    def _is_live(self, seq: int) -> bool:
+        return seq in self.records
+
+    def _posting_live(self, name: str, key: Any) -> Callable[[int], bool]:
+        key_fn = self.fields[name]
+
+        def is_live(seq: int) -> bool:
+            record = self.records.get(seq)
+            return record is not None and index_key(key_fn(record)) == key
+        return is_live
+
+    def _add_posting(self, name: str, key: Any, seq: int) -> None:
+        if key is not None:
+            posting = self.postings[name].get(key)
+            if posting is None:
+                posting = self.postings[name][key] = SeqList()
+            posting.add(seq)
+
+    def _add_time(self, record: CompactRecord) -> None:
+        seq, created_at = record.seq, record.created_at
+        self.max_seq = max(self.max_seq, seq)
+        if not self.time_ordered:
+            return
+        seconds = self.time_seconds
+        position = bisect.bisect_left(seconds, created_at)
+        same_second = position < len(seconds) and seconds[position] == created_at
+        following = position + 1 if same_second else position
+        # Still ordered if every earlier second ends before seq and every later one starts after it
+        if position > 0 and self.time_last_seqs[position - 1] > seq or (
+            following < len(seconds) and self.time_seqs[following] < seq
+        ):
+            self.time_ordered = False
+        elif same_second:
+            self.time_seqs[position] = min(self.time_seqs[position], seq)
+            self.time_last_seqs[position] = max(self.time_last_seqs[position], seq)
+        else:
+            seconds.insert(position, created_at)
+            self.time_seqs.insert(position, seq)
+            self.time_last_seqs.insert(position, seq)
+
+    def add(self, record: CompactRecord) -> None:
+        self.all.add(record.seq)
+        for name, key in self.keys(record).items():
+            self._add_posting(name, key, record.seq)
+        self._add_time(record)
+
+    def update(self, record: CompactRecord, old_keys: Dict[str, Any]) -> None:
+        for name, key in self.keys(record).items():
+            old_key = old_keys[name]
+            if key != old_key:
+                self._add_posting(name, key, record.seq)
+                posting = self.postings[name].get(old_key)
+                if posting is not None:
+                    posting.mark_stale(self._posting_live(name, old_key))
+
+    def discard(self, record: CompactRecord) -> None:
+        # Called after the record has left self.records
+        for name, key in self.keys(record).items():
+            postings = self.postings[name]
+            posting = postings.get(key)
+            if posting is not None:
+                posting.discard(record.seq, self._posting_live(name, key))
+                if not len(posting):
+                    del postings[key]
+        if self.all.discard(record.seq, self._is_live):
+            self._trim_time_index()
+
+    def _trim_time_index(self) -> None:
+        first = self.all.first()
+        if not self.time_ordered:
+            # The records that broke the order may be gone by now; walking the live
+            # seqs in order rebuilds the time index without sorting
+            self.reset_time_index()
+            for position in range(self.all.head, len(self.all.seqs)):
+                record = self.records.get(self.all.seqs[position])
+                if record is not None:
+                    self._add_time(record)
+            return
+        if first is None:
+            self.reset_time_index()
+            return
+        # Seconds that ended before the first live seq can go
+        position = bisect.bisect_right(self.time_seqs, first) - 1
+        if position > 0:
+            del self.time_seconds[:position]
+            del self.time_seqs[:position]
+            del self.time_last_seqs[:position]
+
+    def candidates(self, filters: Dict[str, Any]) -> SeqList:
+        selected = self.all
+        for name, value in filters.items():
+            posting = self.postings[name].get(value)
+            if posting is None:
+                return SeqList()
+            if len(posting) < len(selected):
+                selected = posting
+        return selected
+
+    def first_seq_from(self, created_from: Optional[int]) -> int:
+        if created_from is None or not self.time_ordered:
+            return 0
+        position = bisect.bisect_left(self.time_seconds, created_from)
+        if position < len(self.time_seqs):
+            return self.time_seqs[position]
+        # Nothing was created that late: start past the newest record
+        return self.max_seq + 1
+
+    def first_seq_after(self, created_to: Optional[int]) -> Optional[int]:
+        if created_to is None or not self.time_ordered:
+            return None
+        position = bisect.bisect_right(self.time_seconds, created_to)
+        return self.time_seqs[position] if position < len(self.time_seqs) else None
+
+
+class RecordStore:
+    # Records are kept in least-recently-used order. max_records caps the count by evicting
+    # from the cold end; ttl_seconds expires records that have not been touched for that long.
+
+    def __init__(
+        self,
+        record_type: Type[CompactRecord],
+        stripes: int = DEFAULT_LOCK_STRIPES,
+        max_records: int = 0,
+        ttl_seconds: float = 0,
+        on_evict: Optional[Callable[[CompactRecord], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        index_fields: Optional[Dict[str, Callable[[CompactRecord], Any]]] = None
+    ):
+        self.record_type = record_type
+        self.max_records = max_records
+        self.ttl_seconds = ttl_seconds
+        self.on_evict = on_evict
+        self.clock = clock
+        # LRU order is only needed when something can be evicted; a plain dict is far smaller
+        self.bounded = bool(max_records or ttl_seconds)
+        self.records: Dict[int, CompactRecord] = OrderedDict() if self.bounded else {}
+        self.index = RecordIndex(index_fields or {}, self.records)
+        self.locks = StripedLock(stripes)
+        self.evicted_lru = 0
+        self.expired_ttl = 0
+        self.inserted = 0
+        self._lock = threading.Lock()
+        self._counter = itertools.count(1)
+        self._counter_lock = threading.Lock()
+
+    def next_seq(self) -> int:
+        with self._counter_lock:
+            return next(self._counter)
+
+    def allocate(self, now: Callable[[], int]) -> Tuple[int, int]:
+        # seq and created_at together, so created_at never goes backwards as seq grows
+        with self._counter_lock:
+            return next(self._counter), now()
+
+    def _evict(self, record: CompactRecord) -> None:
+        self.index.discard(record)
+        if self.on_evict is not None:
+            self.on_evict(record)
+
+    def _sweep(self, now: float) -> None:
+        # Called with self._lock held; the coldest entries sit at the front
+        if self.ttl_seconds:
+            for _ in range(MAX_EXPIRED_PER_SWEEP):
+                if not self.records:
+                    break
+                seq, record = next(iter(self.records.items()))
+                if now - record.last_access < self.ttl_seconds:
+                    break
+                del self.records[seq]
+                self.expired_ttl += 1
+                self._evict(record)
+        if self.max_records:
+            while len(self.records) > self.max_records:
+                _, record = self.records.popitem(last=False)
+                self.evicted_lru += 1
+                self._evict(record)
+
+    def _touch(self, record_id: str) -> Optional[CompactRecord]:
+        seq = self.record_type.parse_id(record_id)
+        if seq is None:
+            return None
+        now = self.clock()
+        with self._lock:
+            record = self.records.get(seq)
+            if record is not None:
+                if self.ttl_seconds and now - record.last_access >= self.ttl_seconds:
+                    del self.records[seq]
+                    self.expired_ttl += 1
+                    self._evict(record)
+                    return None
+                record.last_access = now
+                if self.bounded:
+                    self.records.move_to_end(seq)
+            self._sweep(now)
+        return record
+
+    def insert(self, record: CompactRecord) -> None:
+        now = self.clock()
+        with self._lock:
+            record.last_access = now
+            self.records[record.seq] = record
+            self.index.add(record)
+            self.inserted += 1
+            self._sweep(now)
+
+    def insert_many(self, records: Iterable[CompactRecord]) -> None:
+        now = self.clock()
+        with self._lock:
+            for record in records:
+                record.last_access = now
+                self.records[record.seq] = record
+                self.index.add(record)
+                self.inserted += 1
+            self._sweep(now)
+
+    def get(self, record_id: str) -> Optional[Dict[str, Any]]:
+        # A snapshot, so serialising it cannot race a concurrent transition
+        with self.locks.for_key(record_id):
+            record = self._touch(record_id)
+            return record.to_dict() if record is not None else None
+
+    @contextmanager
+    def locked(self, record_id: str) -> Iterator[Optional[CompactRecord]]:
+        # Check-then-set state transitions must run inside this block to stay atomic
+        with self.locks.for_key(record_id):
+            record = self._touch(record_id)
+            old_keys = self.index.keys(record) if record is not None else None
+            yield record
+            if record is not None:
+                with self._lock:
+                    self.index.update(record, old_keys)
+
+    def query(
+        self,
+        filters: Dict[str, Any],
+        created_from: Optional[int] = None,
+        created_to: Optional[int] = None,
+        after: int = 0,
+        limit: int = 50
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        # Seq-ordered page of records matching every filter, starting after the `after` cursor
+        matched = []
+        with self._lock:
+            candidates = self.index.candidates(filters)
+            start = max(after, self.index.first_seq_from(created_from) - 1)
+            stop = self.index.first_seq_after(created_to)
+            previous = None
+            seqs = candidates.seqs
+            for position in range(candidates.start(start), len(seqs)):
+                seq = seqs[position]
+                if stop is not None and seq >= stop:
+                    break
+                if seq == previous:
+                    continue
+                previous = seq
+                record = self.records.get(seq)
+                if record is None or not self._matches(record, filters, created_from, created_to):
+                    continue
+                matched.append(record)
+                if len(matched) > limit:
+                    break
+            page = [record.to_dict() for record in matched[:limit]]
+        next_cursor = matched[limit - 1].seq if len(matched) > limit else None
+        return page, next_cursor
+
+    def _matches(
+        self,
+        record: CompactRecord,
+        filters: Dict[str, Any],
+        created_from: Optional[int],
+        created_to: Optional[int]
+    ) -> bool:
+        if created_from is not None and record.created_at < created_from:
+            return False
+        if created_to is not None and record.created_at > created_to:
+            return False
+        return all(index_key(self.index.fields[name](record)) == value for name, value in filters.items())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'records': len(self.records),
+                'inserted': self.inserted,
+                'evicted_lru': self.evicted_lru,
+                'expired_ttl': self.expired_ttl,
+                'max_records': self.max_records,
+                'ttl_seconds': self.ttl_seconds
+            }
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+
+def process_memory_bytes() -> Optional[int]:
+    # Current RSS where /proc is available (Linux); None elsewhere
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class Storage:
+
+    def __init__(self, stripes: int = DEFAULT_LOCK_STRIPES, max_records: int = 0, ttl_seconds: float = 0):
+        self.orders = RecordStore(
+            OrderRecord, stripes, max_records, ttl_seconds,
+            index_fields={'status': lambda order: order.status, 'currency': lambda order: order.currency}
+        )
+        self.payments = RecordStore(
+            PaymentRecord, stripes, max_records, ttl_seconds,
+            index_fields={'order': lambda payment: payment.order_seq, 'status': lambda payment: payment.status}
+        )
+
+    def close(self) -> None:
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'orders': self.orders.stats(),
+            'payments': self.payments.stats(),
+            'rss_bytes': process_memory_bytes(),
+            'backend': 'memory'
+        }
+
+
+def create_storage(
+    backend: str = 'memory',
+    max_records: int = 0,
+    ttl_seconds: float = 0,
+    sqlite_path: str = 'mock_server.db',
+    sqlite_batch_size: int = 500,
+    sqlite_flush_interval: float = 0.05
+):
+    if backend == 'memory':
+        return Storage(max_records=max_records, ttl_seconds=ttl_seconds)
+    if backend == 'sqlite':
+        # Retention limits do not apply: the point of this backend is to keep everything across restarts
+        from mock_server.sqlite_storage import SQLiteStorage
+        return SQLiteStorage(sqlite_path, batch_size=sqlite_batch_size, flush_interval=sqlite_flush_interval)
+    raise ValueError(f"Unknown storage backend '{backend}', expected 'memory' or 'sqlite'")
@@ -7,7 +7,7 @@ import os
 
 
 def main():
-    """Run tests and generate Allure report"""
+    """Run tests and generate Allure report; extra arguments go to pytest (e.g. -n auto)"""
     print("=" * 60)
     print("Running ioka API Tests")
     print("=" * 60)
@@ -15,7 +15,7 @@ def main():
     # Run tests
     print("\n[1/2] Running tests...")
     result = subprocess.run(
-        [sys.executable, "-m", "pytest", "--alluredir=allure-results", "-v"],
+        [sys.executable, "-m", "pytest", "--alluredir=allure-results", "-v", *sys.argv[1:]],
         cwd=os.path.dirname(os.path.abspath(__file__))
     )
     
@@ -1,58 +1,198 @@
 import pytest
 import subprocess
 import time
-import requests
+import json
+import os
+import queue
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+from mock_server.constants import SERVER_READY_MARKER
 from utils.config import config
+from utils.metrics import MetricsCollector
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--update-latency-baseline",
+        action="store_true",
+        default=False,
+        help="Store measured latency percentiles as the new baseline instead of comparing against it"
+    )
+    parser.addoption(
+        "--mock-server-mode",
+        choices=["subprocess", "in_process"],
+        default=None,
+        help="Run the mock server as a subprocess over real sockets or in-process through WSGI"
+    )
+    parser.addoption(
+        "--capture-traffic",
+        default=None,
+        help="Record every api_client exchange to this capture file (.jsonl or .jsonl.gz)"
+    )
+
+
+def wait_for_ready_port(server_process: subprocess.Popen, timeout: float) -> Optional[int]:
+    # A reader thread keeps draining stdout so the server never blocks on a full pipe
+    lines = queue.Queue()
+    
+    def read_stdout():
+        for line in iter(server_process.stdout.readline, b''):
+            lines.put(line.decode('utf-8', errors='ignore').strip())
+        lines.put(None)
+    
+    threading.Thread(target=read_stdout, daemon=True).start()
+    
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        try:
+            line = lines.get(timeout=remaining)
+        except queue.Empty:
+            return None
+        if line is None:
+            return None
+        if line.startswith(SERVER_READY_MARKER):
+            return int(line.split()[1])
 
 
 @pytest.fixture(scope="session")
-def mock_server():
+def mock_server_mode(request):
+    return request.config.getoption("--mock-server-mode") or config.mock_server_mode
+
+
+@pytest.fixture(scope="session")
+def wsgi_app(mock_server_mode):
+    if mock_server_mode != 'in_process':
+        return None
+    from mock_server.app import app
+    return app
+
+
+@pytest.fixture(scope="session")
+def mock_server(mock_server_mode):
     import sys
-    import os
-    from pathlib import Path
+    
+    if mock_server_mode == 'in_process':
+        yield config.api_base_url
+        return
     
     project_root = Path(__file__).parent.parent
     mock_server_path = project_root / "mock_server.py"
     
+    # Under pytest-xdist every worker gets its own server (and its own in-memory state)
+    # on a port picked by the OS and reported back through the ready marker
+    parallel = bool(os.environ.get('PYTEST_XDIST_WORKER'))
+    port = 0 if parallel else config.mock_server_port
+    
+    stderr_file = tempfile.TemporaryFile()
     server_process = subprocess.Popen(
-        [sys.executable, str(mock_server_path)],
+        [sys.executable, str(mock_server_path), '--port', str(port)],
         stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
+        stderr=stderr_file,
         cwd=str(project_root),
         creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if sys.platform == 'win32' else 0
     )
     
-    max_attempts = 30
-    server_ready = False
-    for attempt in range(max_attempts):
-        try:
-            response = requests.get(f"{config.api_base_url}/health", timeout=2)
-            if response.status_code == 200:
-                server_ready = True
-                break
-        except Exception:
-            time.sleep(0.5)
-    
-    if not server_ready:
-        try:
-            stdout, stderr = server_process.communicate(timeout=1)
-            error_msg = stderr.decode('utf-8', errors='ignore') if stderr else "Unknown error"
-        except:
-            error_msg = "Could not get error details"
+    bound_port = wait_for_ready_port(server_process, config.mock_server_startup_timeout)
+    
+    if bound_port is None:
         server_process.terminate()
         server_process.wait()
-        pytest.fail(f"Mock server failed to start after {max_attempts} attempts. Error: {error_msg}")
+        stderr_file.seek(0)
+        error_msg = stderr_file.read().decode('utf-8', errors='ignore') or "Unknown error"
+        stderr_file.close()
+        pytest.fail(
+            f"Mock server exited or did not report readiness within "
+            f"{config.mock_server_startup_timeout}s. Error: {error_msg}"
+        )
     
-    yield
+    base_url = f"http://127.0.0.1:{bound_port}" if parallel else config.api_base_url
+    
+    yield base_url
     
     server_process.terminate()
     server_process.wait()
+    stderr_file.close()
+
+
+@pytest.fixture(scope="session")
+def metrics_collector():
+    collector = MetricsCollector()
+    
+    yield collector
+    
+    summary = collector.summary()
+    if not summary:
+        return
+    
+    report = json.dumps(summary, indent=2)
+    if config.latency_report_path:
+        report_path = Path(config.latency_report_path)
+        if not report_path.is_absolute():
+            report_path = config.base_dir / report_path
+        worker = os.environ.get('PYTEST_XDIST_WORKER')
+        if worker:
+            report_path = report_path.with_name(f"{report_path.stem}.{worker}{report_path.suffix}")
+        report_path.write_text(report + '\n', encoding='utf-8')
+    
+    if config.attach_latency_report:
+        import allure
+        allure.attach(report, name="Latency percentiles", attachment_type=allure.attachment_type.JSON)
+
+
+@pytest.fixture(scope="session")
+def latency_baseline(request):
+    baseline_path = Path(config.latency_baseline_path)
+    if not baseline_path.is_absolute():
+        baseline_path = config.base_dir / baseline_path
+    
+    update = request.config.getoption("--update-latency-baseline")
+    baseline = {}
+    if baseline_path.exists() and not update:
+        baseline = json.loads(baseline_path.read_text(encoding='utf-8'))
+    
+    yield baseline
+    
+    if update and baseline:
+        # xdist workers each measure a subset of routes, so merge into what is already on disk
+        if baseline_path.exists() and os.environ.get('PYTEST_XDIST_WORKER'):
+            baseline = {**json.loads(baseline_path.read_text(encoding='utf-8')), **baseline}
+        baseline_path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+
+
+@pytest.fixture(scope="session")
+def traffic_recorder(request):
+    path = request.config.getoption("--capture-traffic")
+    if not path:
+        yield None
+        return
+    worker = os.environ.get('PYTEST_XDIST_WORKER')
+    if worker:
+        path = f"{path}.{worker}"
+    from utils.capture import TrafficRecorder
+    with TrafficRecorder(path) as recorder:
+        yield recorder
 
 
 @pytest.fixture
-def api_client():
+def api_client(mock_server, wsgi_app, metrics_collector, traffic_recorder):
     from utils.api_client import APIClient
-    return APIClient()
+    with APIClient(
+        base_url=mock_server, metrics=metrics_collector, wsgi_app=wsgi_app, recorder=traffic_recorder
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+def restore_latency_profiles(api_client):
+    # Tests that inject latency or faults put the server's profiles back afterwards
+    original = api_client.get_latency_profiles()[0].json()
+    yield
+    api_client.set_latency_profiles(original)
 
 
 @pytest.fixture
@@ -0,0 +1,38 @@
+import allure
+from utils.config import config
+
+
+@allure.feature("Admin API")
+@allure.story("Storage Stats")
+class TestAdminStats:
+    
+    def test_admin_stats_structure(self, api_client, validator, mock_server):
+        with allure.step("Get storage stats"):
+            response, execution_time = api_client.get_admin_stats()
+        
+        with allure.step("Verify status code is 200"):
+            validator.assert_status_code(response, 200)
+        
+        with allure.step("Verify response time"):
+            validator.assert_response_time(execution_time, config.max_response_time_ms)
+        
+        with allure.step("Verify response structure"):
+            data = response.json()
+            validator.assert_json_structure(data, ['orders', 'payments', 'rss_bytes'])
+            for store in ('orders', 'payments'):
+                validator.assert_json_structure(
+                    data[store],
+                    ['records', 'inserted', 'evicted_lru', 'expired_ttl', 'max_records', 'ttl_seconds']
+                )
+    
+    def test_admin_stats_count_inserts(self, api_client, validator, test_helpers, mock_server):
+        with allure.step("Get stats before creating records"):
+            before = api_client.get_admin_stats()[0].json()
+        
+        with allure.step("Create order and payment"):
+            test_helpers.create_order_and_payment(amount=1500.0, currency='KZT')
+        
+        with allure.step("Verify inserted counters grew"):
+            after = api_client.get_admin_stats()[0].json()
+            assert after['orders']['inserted'] == before['orders']['inserted'] + 1
+            assert after['payments']['inserted'] == before['payments']['inserted'] + 1
@@ -0,0 +1,57 @@
+import asyncio
+import allure
+from utils.async_api_client import AsyncAPIClient
+from utils.config import config
+
+
+async def run_payment_flow(client: AsyncAPIClient, amount: float):
+    order_response, _ = await client.create_order(amount, 'KZT')
+    order_id = order_response.json()['id']
+    payment_response, _ = await client.create_payment(order_id)
+    payment_id = payment_response.json()['id']
+    refund_response, execution_time = await client.refund_payment(payment_id)
+    return order_response, payment_response, refund_response, execution_time
+
+
+async def run_concurrent_flows(count: int, base_url: str, metrics_collector, wsgi_app):
+    async with AsyncAPIClient(base_url=base_url, metrics=metrics_collector, wsgi_app=wsgi_app) as client:
+        return await asyncio.gather(*(run_payment_flow(client, 1000.0 + i) for i in range(count)))
+
+
+@allure.feature("Async API Client")
+@allure.story("Concurrent Flows")
+class TestAsyncClient:
+    
+    def test_async_get_order_not_found(self, validator, metrics_collector, wsgi_app, mock_server):
+        async def get_missing_order():
+            async with AsyncAPIClient(
+                base_url=mock_server, metrics=metrics_collector, wsgi_app=wsgi_app
+            ) as client:
+                return await client.get_order('order_nonexistent_999')
+        
+        with allure.step("Get non-existent order"):
+            response, execution_time = asyncio.run(get_missing_order())
+        
+        with allure.step("Verify status code is 404"):
+            validator.assert_status_code(response, 404)
+        
+        with allure.step("Verify response time"):
+            validator.assert_response_time(execution_time, config.max_response_time_ms)
+        
+        with allure.step("Verify error structure"):
+            validator.assert_error_structure(response.json(), 'NOT_FOUND')
+    
+    def test_concurrent_order_payment_refund_flows(self, validator, metrics_collector, wsgi_app, mock_server):
+        with allure.step("Run order, payment and refund flows concurrently"):
+            results = asyncio.run(run_concurrent_flows(20, mock_server, metrics_collector, wsgi_app))
+        
+        with allure.step("Verify every flow completed"):
+            for order_response, payment_response, refund_response, execution_time in results:
+                validator.assert_status_code(order_response, 201)
+                validator.assert_status_code(payment_response, 201)
+                validator.assert_status_code(refund_response, 201)
+                validator.assert_field_value(refund_response.json(), 'status', 'completed')
+        
+        with allure.step("Verify payment ids are unique"):
+            payment_ids = [payment_response.json()['id'] for _, payment_response, _, _ in results]
+            assert len(set(payment_ids)) == len(payment_ids), "Payment ids should be unique"
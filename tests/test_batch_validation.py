@@ -0,0 +1,70 @@
+import allure
+import requests
+from utils.batch_validation import MALFORMED_ERROR, BatchValidator, check_response
+
+
+def make_response(method: str, url: str, status_code: int, body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response.request = requests.Request(method, url).prepare()
+    response.headers['Content-Type'] = 'application/json'
+    response._content = body
+    return response
+
+
+@allure.feature("Validation")
+@allure.story("Batch Validation")
+class TestBatchValidation:
+    
+    def test_stream_of_live_responses(self, api_client, test_helpers, mock_server):
+        order_id, _ = test_helpers.create_test_order()
+        
+        def responses():
+            for _ in range(20):
+                yield api_client.get_order(order_id)
+                yield api_client.get_order('order_nonexistent_999')
+                yield api_client.list_orders(limit=5)
+        
+        with allure.step("Validate a generator of responses"):
+            report = BatchValidator(workers=3).validate(responses())
+        
+        with allure.step("Verify the aggregated counts"):
+            assert report['total'] == 60
+            assert report['passed'] == 40
+            assert report['invalid'] == 0
+            assert report['error_codes'] == {'NOT_FOUND': 20}
+            assert report['status_codes'] == {'200': 40, '404': 20}
+            assert report['routes']['GET /orders/{order_id}'] == {'total': 40, 'passed': 20, 'failed': 20}
+            assert report['latency_ms']['count'] == 60
+            assert all(sample['error_code'] == 'NOT_FOUND' for sample in report['samples'])
+    
+    def test_violations_never_raise(self):
+        with allure.step("Check malformed responses"):
+            not_json = make_response('GET', 'http://mock/orders/order_1', 200, b'<html>')
+            bad_error = make_response('GET', 'http://mock/payments/payment_1', 500, b'{"message": "boom"}')
+            bad_order = make_response('POST', 'http://mock/orders', 201, b'{"id": "order_1", "status": "paid"}')
+            
+            assert check_response(not_json) == ('GET /orders/{order_id}', None, ["$: body is not valid JSON"])
+            route, error_code, violations = check_response(bad_error)
+            assert (route, error_code) == ('GET /payments/{payment_id}', MALFORMED_ERROR)
+            assert violations == ["$.error: missing"]
+            assert "$.status: 'paid' is not one of ['pending']" in check_response(bad_order)[2]
+    
+    def test_memory_stays_bounded(self):
+        bad_page = make_response(
+            'GET', 'http://mock/orders', 200, b'{"data": [{"id": "x"}, {"id": "y"}], "next_cursor": null}'
+        )
+        
+        with allure.step("Push many failing responses through a small pipeline"):
+            with BatchValidator(workers=2, sample_size=5, queue_size=8, seed=1) as validator:
+                for _ in range(2000):
+                    validator.submit(bad_page, 1.0)
+            report = validator.report()
+        
+        with allure.step("Verify samples and violation keys do not grow with the input"):
+            assert report['total'] == 2000
+            assert report['invalid'] == 2000
+            assert len(report['samples']) == 5
+            assert report['violations']['$.data[].id'] == 4000
+            assert len(report['violations']) == 7
@@ -0,0 +1,98 @@
+import allure
+from utils.config import config
+
+
+@allure.feature("Bulk API")
+@allure.story("Create Orders Batch")
+class TestCreateOrdersBulk:
+    
+    def test_create_orders_bulk_success(self, api_client, validator, mock_server):
+        with allure.step("Create a batch of orders"):
+            response, execution_time = api_client.create_orders_bulk(
+                [{'amount': 1000.0 + i, 'currency': 'KZT'} for i in range(50)]
+            )
+        
+        with allure.step("Verify status code is 200"):
+            validator.assert_status_code(response, 200)
+        
+        with allure.step("Verify response time"):
+            validator.assert_response_time(execution_time, config.max_response_time_ms)
+        
+        with allure.step("Verify every item was created"):
+            data = response.json()
+            validator.assert_schema(data, 'order_batch')
+            validator.assert_field_value(data, 'created', 50)
+            validator.assert_field_value(data, 'failed', 0)
+            for index, result in enumerate(data['results']):
+                validator.assert_field_value(result, 'index', index)
+                validator.assert_field_value(result, 'status', 201)
+                validator.assert_field_starts_with(result['order'], 'id', 'order_')
+                validator.assert_field_value(result['order'], 'amount', 1000.0 + index)
+        
+        with allure.step("Verify created orders can be fetched"):
+            order_id = data['results'][-1]['order']['id']
+            order_response, _ = api_client.get_order(order_id)
+            validator.assert_status_code(order_response, 200)
+    
+    def test_create_orders_bulk_partial_errors(self, api_client, validator, mock_server):
+        with allure.step("Create a batch with invalid items"):
+            response, _ = api_client.create_orders_bulk([
+                {'amount': 1000.0, 'currency': 'KZT'},
+                {'currency': 'KZT'},
+                {'amount': 0, 'currency': 'KZT'}
+            ])
+        
+        with allure.step("Verify per-item results"):
+            validator.assert_status_code(response, 200)
+            data = response.json()
+            validator.assert_field_value(data, 'created', 1)
+            validator.assert_field_value(data, 'failed', 2)
+            validator.assert_field_value(data['results'][0], 'status', 201)
+            for result in data['results'][1:]:
+                validator.assert_field_value(result, 'status', 400)
+                validator.assert_error_structure(result, 'VALIDATION_ERROR')
+    
+    def test_create_orders_bulk_empty(self, api_client, validator, mock_server):
+        with allure.step("Create an empty batch"):
+            response, _ = api_client.create_orders_bulk([])
+        
+        with allure.step("Verify status code is 400"):
+            validator.assert_status_code(response, 400)
+            validator.assert_error_structure(response.json(), 'INVALID_REQUEST')
+
+
+@allure.feature("Bulk API")
+@allure.story("Create Payments Batch")
+class TestCreatePaymentsBulk:
+    
+    def test_create_payments_bulk_success(self, api_client, validator, test_helpers, mock_server):
+        with allure.step("Create orders in bulk"):
+            order_ids = test_helpers.create_test_orders(20, amount=2500.0)
+        
+        with allure.step("Create payments in bulk"):
+            payment_ids = test_helpers.create_test_payments(order_ids)
+        
+        with allure.step("Verify payments belong to their orders"):
+            assert len(payment_ids) == len(order_ids)
+            response, _ = api_client.get_payment(payment_ids[0])
+            validator.assert_status_code(response, 200)
+            validator.assert_field_value(response.json(), 'order_id', order_ids[0])
+            validator.assert_field_value(response.json(), 'amount', 2500.0)
+    
+    def test_create_payments_bulk_order_not_found(self, api_client, validator, test_helpers, mock_server):
+        with allure.step("Create a batch with a missing order"):
+            order_ids = test_helpers.create_test_orders(1)
+            response, _ = api_client.create_payments_bulk([
+                {'order_id': order_ids[0]},
+                {'order_id': 'order_nonexistent_999'},
+                {'payment_method': 'card'}
+            ])
+        
+        with allure.step("Verify per-item results"):
+            validator.assert_status_code(response, 200)
+            data = response.json()
+            validator.assert_field_value(data, 'created', 1)
+            validator.assert_field_value(data['results'][1], 'status', 404)
+            validator.assert_error_structure(data['results'][1], 'NOT_FOUND')
+            validator.assert_field_value(data['results'][2], 'status', 400)
+            validator.assert_error_structure(data['results'][2], 'VALIDATION_ERROR')
@@ -0,0 +1,65 @@
+import allure
+import pytest
+from mock_server.clock import FrozenClock, TimestampService
+
+
+@pytest.fixture
+def frozen_clock(api_client):
+    # Stops the server clock for a test and restarts it afterwards
+    yield lambda frozen_at: api_client.freeze_clock(frozen_at)
+    api_client.freeze_clock(None)
+
+
+@allure.feature("Mock Server")
+@allure.story("Timestamps")
+class TestTimestampService:
+    
+    def test_formats_utc_with_injected_clock(self):
+        clock = FrozenClock(1704067199.9)
+        timestamps = TimestampService(clock)
+        
+        with allure.step("Verify the frozen second is formatted in UTC"):
+            assert timestamps.now() == "2023-12-31T23:59:59Z"
+            assert timestamps.now() is timestamps.now()
+        
+        with allure.step("Advance the clock across a second boundary"):
+            clock.advance(0.1)
+            assert timestamps.now() == "2024-01-01T00:00:00Z"
+            assert timestamps.format(0) == "1970-01-01T00:00:00Z"
+    
+    def test_freeze_and_unfreeze(self):
+        timestamps = TimestampService()
+        
+        with allure.step("Freeze the clock"):
+            clock = timestamps.freeze(1700000000)
+            assert timestamps.frozen
+            assert timestamps.settings() == {'frozen': True, 'epoch': 1700000000, 'now': "2023-11-14T22:13:20Z"}
+            clock.advance(60)
+            assert timestamps.now_epoch() == 1700000060
+        
+        with allure.step("Unfreeze the clock"):
+            timestamps.unfreeze()
+            assert not timestamps.frozen
+            assert timestamps.now_epoch() > 1700000060
+    
+    def test_frozen_server_clock(self, api_client, validator, test_helpers, frozen_clock, mock_server):
+        with allure.step("Freeze the server clock"):
+            response, _ = frozen_clock("2024-02-29T12:00:00Z")
+            validator.assert_status_code(response, 200)
+            validator.assert_field_value(response.json(), 'frozen', True)
+        
+        with allure.step("Verify new records carry the frozen timestamp"):
+            order_id, order_response = test_helpers.create_test_order()
+            validator.assert_field_value(order_response.json(), 'created_at', "2024-02-29T12:00:00Z")
+            payment_response, _ = api_client.create_payment(order_id)
+            refund_response, _ = api_client.refund_payment(payment_response.json()['id'])
+            validator.assert_status_code(refund_response, 201)
+            validator.assert_field_value(refund_response.json(), 'created_at', "2024-02-29T12:00:00Z")
+    
+    def test_invalid_frozen_at(self, api_client, validator, frozen_clock, mock_server):
+        with allure.step("Freeze the server clock at a malformed time"):
+            response, _ = frozen_clock("yesterday")
+        
+        with allure.step("Verify validation error"):
+            validator.assert_status_code(response, 400)
+            validator.assert_error_structure(response.json(), 'VALIDATION_ERROR')
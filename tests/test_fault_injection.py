@@ -0,0 +1,79 @@
+import allure
+from utils.config import config
+
+LIST_ORDERS = 'GET /orders'
+
+
+@allure.feature("Fault Injection")
+@allure.story("Latency Profiles")
+class TestLatencyProfiles:
+    
+    def test_get_latency_profiles(self, api_client, validator, mock_server):
+        with allure.step("Get latency profiles"):
+            response, execution_time = api_client.get_latency_profiles()
+        
+        with allure.step("Verify status code is 200"):
+            validator.assert_status_code(response, 200)
+            validator.assert_response_time(execution_time, config.max_response_time_ms)
+        
+        with allure.step("Verify response structure"):
+            validator.assert_json_structure(response.json(), ['default', 'endpoints'])
+    
+    def test_fixed_latency_profile(self, api_client, validator, mock_server, restore_latency_profiles):
+        with allure.step("Set a fixed 50 ms delay on one endpoint"):
+            response, _ = api_client.update_latency_profiles({LIST_ORDERS: {'type': 'fixed', 'ms': 50}})
+            validator.assert_status_code(response, 200)
+            validator.assert_field_value(response.json()['endpoints'][LIST_ORDERS], 'ms', 50)
+        
+        with allure.step("Verify the endpoint is delayed"):
+            response, execution_time = api_client.list_orders(limit=1)
+            validator.assert_status_code(response, 200)
+            assert execution_time >= 50, f"Expected at least 50 ms, got {execution_time:.1f} ms"
+        
+        with allure.step("Remove the override"):
+            response, _ = api_client.update_latency_profiles({LIST_ORDERS: None})
+            assert LIST_ORDERS not in response.json()['endpoints']
+    
+    def test_invalid_latency_profile(self, api_client, validator, mock_server, restore_latency_profiles):
+        with allure.step("Set an unknown profile type"):
+            response, _ = api_client.update_latency_profiles({LIST_ORDERS: {'type': 'pareto'}})
+        
+        with allure.step("Verify status code is 400"):
+            validator.assert_status_code(response, 400)
+            validator.assert_error_structure(response.json(), 'VALIDATION_ERROR')
+        
+        with allure.step("Verify a histogram needs buckets"):
+            response, _ = api_client.update_latency_profiles({LIST_ORDERS: {'type': 'histogram'}})
+            validator.assert_status_code(response, 400)
+
+
+@allure.feature("Fault Injection")
+@allure.story("Injected Faults")
+class TestInjectedFaults:
+    
+    def test_injected_server_error(self, api_client, validator, mock_server, restore_latency_profiles):
+        with allure.step("Fail every request to one endpoint with 503"):
+            api_client.update_latency_profiles(
+                {LIST_ORDERS: {'type': 'zero', 'error_rate': 1.0, 'error_status': 503}}
+            )
+        
+        with allure.step("Verify the injected error"):
+            response, _ = api_client.list_orders(limit=1)
+            validator.assert_status_code(response, 503)
+            validator.assert_error_structure(response.json(), 'INTERNAL_ERROR')
+        
+        with allure.step("Verify other endpoints are unaffected"):
+            response, _ = api_client.create_order(1000.0, 'KZT')
+            validator.assert_status_code(response, 201)
+    
+    def test_injected_timeout(self, api_client, validator, mock_server, restore_latency_profiles):
+        with allure.step("Time out every request to one endpoint after 100 ms"):
+            api_client.update_latency_profiles(
+                {LIST_ORDERS: {'type': 'zero', 'timeout_rate': 1.0, 'timeout_ms': 100}}
+            )
+        
+        with allure.step("Verify the injected timeout"):
+            response, execution_time = api_client.list_orders(limit=1)
+            validator.assert_status_code(response, 504)
+            validator.assert_error_structure(response.json(), 'GATEWAY_TIMEOUT')
+            assert execution_time >= 100, f"Expected at least 100 ms, got {execution_time:.1f} ms"
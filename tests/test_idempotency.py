@@ -0,0 +1,108 @@
+import allure
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask
+from mock_server.idempotency import IdempotencyCache, idempotent
+from utils.api_client import APIClient
+
+
+@allure.feature("Idempotency")
+@allure.story("Idempotency-Key")
+class TestIdempotencyKey:
+    
+    def test_repeated_create_order_is_replayed(self, api_client, validator, mock_server):
+        key = str(uuid.uuid4())
+        
+        with allure.step("Create an order with an Idempotency-Key"):
+            first, _ = api_client.create_order(1000.0, 'KZT', idempotency_key=key)
+            validator.assert_status_code(first, 201)
+        
+        with allure.step("Repeat the same request"):
+            second, _ = api_client.create_order(1000.0, 'KZT', idempotency_key=key)
+        
+        with allure.step("Verify the first response is replayed byte-for-byte"):
+            validator.assert_status_code(second, 201)
+            assert second.content == first.content
+            assert second.headers.get('Idempotent-Replayed') == 'true'
+            assert 'Idempotent-Replayed' not in first.headers
+    
+    def test_key_reused_with_different_body(self, api_client, validator, mock_server):
+        key = str(uuid.uuid4())
+        api_client.create_order(1000.0, 'KZT', idempotency_key=key)
+        
+        with allure.step("Reuse the key with another amount"):
+            response, _ = api_client.create_order(2000.0, 'KZT', idempotency_key=key)
+        
+        with allure.step("Verify status code is 422"):
+            validator.assert_status_code(response, 422)
+            validator.assert_error_structure(response.json(), 'IDEMPOTENCY_CONFLICT')
+    
+    def test_repeated_refund_is_replayed(self, api_client, validator, test_helpers, mock_server):
+        _, payment_id, _, _ = test_helpers.create_order_and_payment()
+        key = str(uuid.uuid4())
+        
+        with allure.step("Refund the same payment twice with one key"):
+            first, _ = api_client.refund_payment(payment_id, idempotency_key=key)
+            second, _ = api_client.refund_payment(payment_id, idempotency_key=key)
+        
+        with allure.step("Verify the retry returns the original refund"):
+            validator.assert_status_code(first, 201)
+            validator.assert_status_code(second, 201)
+            assert second.json() == first.json()
+        
+        with allure.step("Verify a refund without the key is still rejected"):
+            response, _ = api_client.refund_payment(payment_id)
+            validator.assert_status_code(response, 400)
+    
+    def test_concurrent_retries_create_one_payment(self, api_client, validator, test_helpers, mock_server):
+        order_id, _ = test_helpers.create_test_order()
+        key = str(uuid.uuid4())
+        
+        with allure.step("Send the same payment request concurrently"):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                responses = list(pool.map(
+                    lambda _: api_client.create_payment(order_id, idempotency_key=key)[0], range(8)
+                ))
+        
+        with allure.step("Verify a single payment was created"):
+            assert len({response.json()['id'] for response in responses}) == 1
+            payments = list(api_client.iter_order_payments(order_id))
+            assert len(payments) == 1, f"Expected one payment, got {len(payments)}"
+    
+    def test_client_generates_keys(self, validator, mock_server, wsgi_app):
+        with allure.step("Create orders with automatic keys"):
+            with APIClient(base_url=mock_server, wsgi_app=wsgi_app, auto_idempotency_keys=True) as client:
+                first, _ = client.create_order(1000.0, 'KZT')
+                second, _ = client.create_order(1000.0, 'KZT')
+        
+        with allure.step("Verify each call got its own key"):
+            validator.assert_status_code(first, 201)
+            validator.assert_status_code(second, 201)
+            assert first.json()['id'] != second.json()['id']
+            assert first.request.headers['Idempotency-Key'] != second.request.headers['Idempotency-Key']
+    
+    def test_distinct_keys_do_not_wait_for_each_other(self):
+        # More concurrent handlers than a striped lock pool would allow
+        concurrent = 70
+        store = IdempotencyCache()
+        app = Flask(__name__)
+        barrier = threading.Barrier(concurrent, timeout=5)
+        
+        @app.route('/slow', methods=['POST'])
+        @idempotent(store)
+        def slow():
+            barrier.wait()
+            return {'ok': True}, 201
+        
+        def post(number: int) -> int:
+            with app.test_client() as client:
+                return client.post('/slow', headers={'Idempotency-Key': f"key-{number}"}).status_code
+        
+        with allure.step("Run every handler at once"):
+            with ThreadPoolExecutor(max_workers=concurrent) as pool:
+                statuses = list(pool.map(post, range(concurrent)))
+        
+        with allure.step("Verify none of them blocked another"):
+            assert statuses == [201] * concurrent
+            assert store.in_flight == {}
@@ -0,0 +1,68 @@
+import allure
+import pytest
+from flask import Flask
+from mock_server.json_provider import FastJSONProvider
+from utils import json_backend
+from utils.json_backend import StdlibJSONBackend, get_json_backend
+
+
+@allure.feature("Performance")
+@allure.story("JSON Backend")
+class TestJSONBackend:
+    
+    @pytest.mark.parametrize("name", ['auto', 'stdlib'])
+    def test_backend_round_trip(self, name):
+        payload = {'amount': 1000.5, 'currency': 'KZT', 'description': 'Заказ', 'items': [1, None, True]}
+        backend = get_json_backend(name)
+        
+        with allure.step(f"Encode and decode with the {backend.name} backend"):
+            encoded = backend.dumps(payload)
+            assert isinstance(encoded, bytes)
+            assert backend.loads(encoded) == payload
+            assert StdlibJSONBackend().loads(encoded) == payload
+    
+    def test_stdlib_fallback_without_orjson(self, monkeypatch):
+        monkeypatch.setattr(json_backend, 'orjson', None)
+        
+        with allure.step("Verify auto falls back to the standard library"):
+            assert get_json_backend('auto').name == 'stdlib'
+        
+        with allure.step("Verify an explicit orjson request fails loudly"):
+            with pytest.raises(RuntimeError):
+                get_json_backend('orjson')
+        
+        with allure.step("Verify unknown backends are rejected"):
+            with pytest.raises(ValueError):
+                get_json_backend('simplejson')
+    
+    @pytest.mark.parametrize("name", ['auto', 'stdlib'])
+    def test_responses_match_flask_default_format(self, name):
+        payload = {
+            'status': 'pending',
+            'amount': 1000.0,
+            'customer': {'name': 'Алия', 'note': 'emoji \U0001F600, quote " and \x7f'},
+            'items': [0.1, None, True]
+        }
+        reference, fast = Flask('reference'), Flask('fast')
+        fast.json = FastJSONProvider(fast, name)
+        
+        with allure.step(f"Render the same payload with Flask's provider and the {name} backend"):
+            with reference.app_context():
+                expected = reference.json.response(payload).get_data()
+            with fast.app_context():
+                actual = fast.json.response(payload).get_data()
+        
+        with allure.step("Verify sorted keys, ASCII escapes and the trailing newline are kept"):
+            assert actual == expected
+            assert actual.startswith(b'{"amount":1000.0,"customer":{"name":"\\u0410')
+            assert actual.endswith(b'}\n')
+    
+    def test_server_and_client_exchange(self, api_client, validator, mock_server):
+        with allure.step("Create order with non-ASCII description"):
+            response, _ = api_client.create_order(1000.0, 'KZT', description='Оплата заказа')
+            validator.assert_status_code(response, 201)
+            assert response.headers['Content-Type'] == 'application/json'
+        
+        with allure.step("Verify the body round-trips and is decoded once"):
+            validator.assert_field_value(response.json(), 'description', 'Оплата заказа')
+            assert response.json() is response.json()
@@ -0,0 +1,62 @@
+import allure
+import pytest
+from utils.api_client import APIClient
+from utils.config import config
+from utils.metrics import MetricsCollector
+
+SAMPLES_PER_ENDPOINT = 50
+
+
+def drive_endpoint(client: APIClient, route: str, samples: int) -> None:
+    if route == 'POST /orders':
+        for _ in range(samples):
+            client.create_order(1000.0, 'KZT')
+        return
+    
+    order_ids = [client.create_order(1000.0, 'KZT')[0].json()['id'] for _ in range(samples)]
+    if route == 'GET /orders/{order_id}':
+        for order_id in order_ids:
+            client.get_order(order_id)
+        return
+    
+    payment_ids = [client.create_payment(order_id)[0].json()['id'] for order_id in order_ids]
+    if route == 'GET /payments/{payment_id}':
+        for payment_id in payment_ids:
+            client.get_payment(payment_id)
+    elif route == 'POST /payments/{payment_id}/refund':
+        for payment_id in payment_ids:
+            client.refund_payment(payment_id)
+    elif route != 'POST /orders/{order_id}/payments':
+        pytest.skip(f"No load driver for {route}")
+
+
+@allure.feature("Performance")
+@allure.story("Latency Budgets")
+class TestLatencyBudgets:
+    
+    @pytest.mark.parametrize("route", sorted(config.latency_budgets))
+    def test_latency_budget(self, route, validator, latency_baseline, request, wsgi_app, mock_server):
+        budget = config.latency_budgets[route]
+        collector = MetricsCollector()
+        
+        with allure.step(f"Collect {SAMPLES_PER_ENDPOINT} samples for {route}"):
+            with APIClient(base_url=mock_server, metrics=collector, wsgi_app=wsgi_app) as client:
+                drive_endpoint(client, route, SAMPLES_PER_ENDPOINT)
+            histogram = collector.histogram(route)
+        
+        with allure.step("Verify percentile budget"):
+            validator.assert_latency_percentiles(histogram, budget, endpoint=route)
+        
+        with allure.step("Verify no regression against baseline"):
+            summary = histogram.summary()
+            if request.config.getoption("--update-latency-baseline"):
+                latency_baseline[route] = summary
+            elif route in latency_baseline:
+                validator.assert_no_latency_regression(
+                    summary,
+                    latency_baseline[route],
+                    config.latency_regression_tolerance,
+                    config.latency_regression_slack_ms,
+                    endpoint=route,
+                    percentiles=list(budget)
+                )
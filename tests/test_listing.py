@@ -0,0 +1,112 @@
+import allure
+import uuid
+from utils.config import config
+
+
+@allure.feature("Listing API")
+@allure.story("List Orders")
+class TestListOrders:
+    
+    def test_list_orders_paginates_by_cursor(self, api_client, validator, test_helpers, mock_server):
+        currency = f"T{uuid.uuid4().hex[:8]}"
+        
+        with allure.step("Create orders in a dedicated currency"):
+            order_ids = test_helpers.create_test_orders(7, currency=currency)
+        
+        with allure.step("Fetch the first page"):
+            response, execution_time = api_client.list_orders(limit=3, currency=currency)
+            validator.assert_status_code(response, 200)
+            validator.assert_response_time(execution_time, config.max_response_time_ms)
+            page = response.json()
+            validator.assert_schema(page, 'order_page')
+            assert [order['id'] for order in page['data']] == order_ids[:3]
+            validator.assert_field_value(page, 'next_cursor', order_ids[2])
+        
+        with allure.step("Iterate through every page"):
+            assert [order['id'] for order in api_client.iter_orders(limit=3, currency=currency)] == order_ids
+    
+    def test_list_orders_filters_by_status_and_created_at(self, api_client, validator, test_helpers, mock_server):
+        currency = f"T{uuid.uuid4().hex[:8]}"
+        order_ids = test_helpers.create_test_orders(2, currency=currency)
+        created_at = api_client.get_order(order_ids[0])[0].json()['created_at']
+        
+        with allure.step("Filter by status"):
+            orders = list(api_client.iter_orders(currency=currency, status='pending'))
+            assert [order['id'] for order in orders] == order_ids
+            assert list(api_client.iter_orders(currency=currency, status='paid')) == []
+        
+        with allure.step("Filter by created_at range"):
+            orders = list(api_client.iter_orders(currency=currency, created_from=created_at))
+            assert order_ids[0] in [order['id'] for order in orders]
+            assert list(api_client.iter_orders(currency=currency, created_to='2000-01-01T00:00:00Z')) == []
+    
+    def test_list_orders_created_before_newer_records(self, api_client, validator, test_helpers, mock_server):
+        currency = f"T{uuid.uuid4().hex[:8]}"
+        test_helpers.create_test_orders(1)
+        
+        with allure.step("Create an order with a frozen clock set in the past"):
+            api_client.freeze_clock("2024-01-01T00:00:00Z")
+            try:
+                order_id, _ = test_helpers.create_test_order(currency=currency)
+            finally:
+                api_client.freeze_clock(None)
+        
+        with allure.step("Filter by a created_at range that only the older order falls into"):
+            orders = list(api_client.iter_orders(currency=currency, created_to='2024-06-01T00:00:00Z'))
+            assert [order['id'] for order in orders] == [order_id]
+            orders = list(api_client.iter_orders(currency=currency, created_from='2023-12-31T00:00:00Z'))
+            assert [order['id'] for order in orders] == [order_id]
+    
+    def test_list_orders_invalid_params(self, api_client, validator, mock_server):
+        with allure.step("Request an invalid cursor"):
+            response, _ = api_client.list_orders(cursor='payment_1')
+            validator.assert_status_code(response, 400)
+            validator.assert_error_structure(response.json(), 'INVALID_REQUEST')
+            response, _ = api_client.list_orders(cursor='order_\u00b2')
+            validator.assert_status_code(response, 400)
+            validator.assert_error_structure(response.json(), 'INVALID_REQUEST')
+        
+        with allure.step("Request an invalid limit and timestamp"):
+            response, _ = api_client.list_orders(limit=0)
+            validator.assert_status_code(response, 400)
+            validator.assert_error_structure(response.json(), 'VALIDATION_ERROR')
+            response, _ = api_client.list_orders(limit='\u00b2')
+            validator.assert_status_code(response, 400)
+            validator.assert_error_structure(response.json(), 'VALIDATION_ERROR')
+            response, _ = api_client.list_orders(created_from='yesterday')
+            validator.assert_status_code(response, 400)
+            validator.assert_error_structure(response.json(), 'VALIDATION_ERROR')
+
+
+@allure.feature("Listing API")
+@allure.story("List Order Payments")
+class TestListOrderPayments:
+    
+    def test_list_order_payments_tracks_refunds(self, api_client, validator, test_helpers, mock_server):
+        with allure.step("Create an order with several payments"):
+            order_id, _ = test_helpers.create_test_order()
+            payment_ids = test_helpers.create_test_payments([order_id] * 4)
+        
+        with allure.step("List every payment of the order"):
+            response, _ = api_client.list_order_payments(order_id, limit=2)
+            validator.assert_status_code(response, 200)
+            validator.assert_field_value(response.json(), 'next_cursor', payment_ids[1])
+            payments = list(api_client.iter_order_payments(order_id, limit=2))
+            assert [payment['id'] for payment in payments] == payment_ids
+            for payment in payments:
+                validator.assert_field_value(payment, 'order_id', order_id)
+        
+        with allure.step("Refund one payment and filter by status"):
+            api_client.refund_payment(payment_ids[1])
+            refunded = list(api_client.iter_order_payments(order_id, status='refunded'))
+            assert [payment['id'] for payment in refunded] == [payment_ids[1]]
+            pending = list(api_client.iter_order_payments(order_id, status='pending'))
+            assert [payment['id'] for payment in pending] == [payment_ids[0]] + payment_ids[2:]
+    
+    def test_list_order_payments_not_found(self, api_client, validator, mock_server):
+        with allure.step("List payments of a missing order"):
+            response, _ = api_client.list_order_payments('order_nonexistent')
+        
+        with allure.step("Verify status code is 404"):
+            validator.assert_status_code(response, 404)
+            validator.assert_error_structure(response.json(), 'NOT_FOUND')
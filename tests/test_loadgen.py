@@ -0,0 +1,36 @@
+import allure
+from utils.loadgen import DEFAULT_MIX, ENDPOINTS, LoadGenerator, parse_mix
+
+
+@allure.feature("Performance")
+@allure.story("Load Generator")
+class TestLoadGenerator:
+    
+    def test_short_run_report(self, mock_server, wsgi_app):
+        generator = LoadGenerator(
+            parse_mix(DEFAULT_MIX),
+            concurrency=4,
+            duration=1.0,
+            base_url=mock_server,
+            wsgi_app=wsgi_app
+        )
+        
+        with allure.step("Run the default mix for a second"):
+            report = generator.run()
+        
+        with allure.step("Verify the report structure"):
+            for key in ('started_at', 'duration_s', 'concurrency', 'mix', 'total_requests', 'throughput_rps'):
+                assert key in report, f"Missing '{key}' in the report"
+            assert report['concurrency'] == 4
+            assert set(report['endpoints']) == set(ENDPOINTS)
+            assert report['total_requests'] == sum(stats['count'] for stats in report['endpoints'].values())
+        
+        with allure.step("Verify per-endpoint counts, percentiles and errors"):
+            for name, stats in report['endpoints'].items():
+                assert stats['count'] > 0, f"No requests to {name}"
+                assert stats['errors'] == 0, f"{name} had {stats['errors']} errors"
+                assert sum(stats['status_codes'].values()) == stats['count']
+                assert all(code.startswith('2') for code in stats['status_codes']), stats['status_codes']
+                latency = stats['latency_ms']
+                assert 0 < latency['p50'] <= latency['p90'] <= latency['p95'] <= latency['p99']
+                assert latency['max'] > 0
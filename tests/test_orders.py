@@ -23,7 +23,7 @@ class TestCreateOrder:
         
         with allure.step("Verify response structure"):
             data = response.json()
-            validator.assert_json_structure(data, ['id', 'amount', 'currency', 'status', 'created_at'])
+            validator.assert_schema(data, 'order')
         
         with allure.step("Verify response values"):
             validator.assert_field_value(data, 'amount', 1000.0)
@@ -54,6 +54,16 @@ class TestCreateOrder:
         with allure.step("Verify error message"):
             validator.assert_error_structure(response.json(), 'VALIDATION_ERROR')
     
+    def test_create_order_invalid_currency(self, api_client, validator, mock_server):
+        with allure.step("Create order with a non-string currency"):
+            response, execution_time = api_client.create_order(amount=1000.0, currency={'code': 'KZT'})
+        
+        with allure.step("Verify status code is 400"):
+            validator.assert_status_code(response, 400)
+        
+        with allure.step("Verify error message"):
+            validator.assert_error_structure(response.json(), 'VALIDATION_ERROR')
+    
     def test_create_order_empty_body(self, api_client, validator, mock_server):
         with allure.step("Create order with empty body"):
             response, execution_time = api_client._make_request('POST', '/orders', data=None)
@@ -90,7 +100,7 @@ class TestGetOrder:
         
         with allure.step("Verify response structure"):
             data = response.json()
-            validator.assert_json_structure(data, ['id', 'amount', 'currency', 'status', 'created_at'])
+            validator.assert_schema(data, 'order')
         
         with allure.step("Verify order ID matches"):
             validator.assert_field_value(data, 'id', order_id)
@@ -114,3 +124,11 @@ class TestGetOrder:
         
         with allure.step("Verify status code is 404"):
             validator.assert_status_code(response, 404)
+    
+    def test_get_order_non_ascii_digits(self, api_client, validator, mock_server):
+        with allure.step("Get order with a superscript digit in the ID"):
+            response, _ = api_client.get_order('order_\u00b2')
+        
+        with allure.step("Verify status code is 404"):
+            validator.assert_status_code(response, 404)
+            validator.assert_error_structure(response.json(), 'NOT_FOUND')
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 import allure
 from utils.config import config
 from utils.validators import ResponseValidator
@@ -22,10 +23,7 @@ class TestCreatePayment:
         
         with allure.step("Verify response structure"):
             data = response.json()
-            validator.assert_json_structure(
-                data,
-                ['id', 'order_id', 'amount', 'currency', 'status', 'created_at', 'payment_method']
-            )
+            validator.assert_schema(data, 'payment')
         
         with allure.step("Verify payment values"):
             validator.assert_field_value(data, 'order_id', order_id)
@@ -65,10 +63,7 @@ class TestGetPayment:
         
         with allure.step("Verify response structure"):
             data = response.json()
-            validator.assert_json_structure(
-                data,
-                ['id', 'order_id', 'amount', 'currency', 'status', 'created_at']
-            )
+            validator.assert_schema(data, 'payment')
         
         with allure.step("Verify payment ID matches"):
             validator.assert_field_value(data, 'id', payment_id)
@@ -105,10 +100,7 @@ class TestRefundPayment:
         
         with allure.step("Verify response structure"):
             data = response.json()
-            validator.assert_json_structure(
-                data,
-                ['id', 'payment_id', 'amount', 'currency', 'status', 'created_at']
-            )
+            validator.assert_schema(data, 'refund')
         
         with allure.step("Verify refund values"):
             validator.assert_field_value(data, 'payment_id', payment_id)
@@ -173,3 +165,22 @@ class TestRefundPayment:
         
         with allure.step("Verify error structure"):
             validator.assert_error_structure(response.json(), 'INVALID_STATUS')
+    
+    def test_concurrent_refunds_succeed_once(self, api_client, validator, test_helpers, mock_server):
+        with allure.step("Create order and payment"):
+            _, payment_id, _, _ = test_helpers.create_order_and_payment(
+                amount=7000.0, currency='KZT'
+            )
+        
+        with allure.step("Refund the same payment from many threads at once"):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                responses = [
+                    response for response, _ in executor.map(lambda _: api_client.refund_payment(payment_id), range(16))
+                ]
+        
+        with allure.step("Verify exactly one refund succeeded"):
+            status_codes = sorted(response.status_code for response in responses)
+            assert status_codes.count(201) == 1, f"Expected exactly one successful refund, got {status_codes}"
+            for response in responses:
+                if response.status_code != 201:
+                    validator.assert_error_structure(response.json(), 'INVALID_STATUS')
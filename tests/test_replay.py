@@ -0,0 +1,127 @@
+import json
+import allure
+import pytest
+from mock_server import app as app_module
+from mock_server.replay import ReplayStore
+from utils.api_client import APIClient
+from utils.capture import TrafficRecorder, iter_capture
+from utils.replay import ReplayDriver
+
+REPLAY_BASE_URL = 'http://replay.mock'
+
+
+@pytest.fixture
+def capture_path(tmp_path, mock_server, wsgi_app):
+    # Record a short session against the regular mock server
+    path = tmp_path / 'capture.jsonl.gz'
+    with TrafficRecorder(str(path)) as recorder:
+        with APIClient(base_url=mock_server, wsgi_app=wsgi_app, recorder=recorder) as client:
+            order_id = client.create_order(1000.0, 'KZT', description='replayed')[0].json()['id']
+            client.get_order(order_id)
+            client.create_payment(order_id)
+            client.list_order_payments(order_id, limit=5)
+            client.get_order('order_nonexistent')
+    return path
+
+
+@pytest.fixture
+def replay_server(capture_path):
+    store = ReplayStore(str(capture_path), replay_latency=False)
+    app_module.set_replay(store)
+    yield store
+    app_module.set_replay(None)
+
+
+@allure.feature("Traffic Replay")
+@allure.story("Capture")
+class TestTrafficCapture:
+    
+    def test_capture_records_exchanges(self, capture_path):
+        with allure.step("Stream the capture back"):
+            entries = list(iter_capture(str(capture_path)))
+        
+        with allure.step("Verify every exchange was recorded in order"):
+            assert [entry['route'] for entry in entries] == [
+                'POST /orders',
+                'GET /orders/{order_id}',
+                'POST /orders/{order_id}/payments',
+                'GET /orders/{order_id}/payments',
+                'GET /orders/{order_id}'
+            ]
+            assert [entry['status'] for entry in entries] == [201, 200, 201, 200, 404]
+            assert json.loads(entries[0]['body'])['description'] == 'replayed'
+            assert entries[3]['path'].endswith('/payments?limit=5')
+            for entry in entries:
+                assert entry['ms'] > 0
+                assert entry['ts'] > 0
+
+
+@allure.feature("Traffic Replay")
+@allure.story("Replay")
+class TestTrafficReplay:
+    
+    def test_replay_server_serves_recorded_responses(self, capture_path, replay_server, validator):
+        entries = list(iter_capture(str(capture_path)))
+        
+        with allure.step("Repeat the recorded requests against the replay server"):
+            with APIClient(base_url=REPLAY_BASE_URL, wsgi_app=app_module.app) as client:
+                order_response, _ = client.create_order(1000.0, 'KZT', description='replayed')
+                get_response, _ = client.get_order(order_response.json()['id'])
+                missing_response, _ = client.get_order('order_404')
+        
+        with allure.step("Verify the recorded bodies are returned"):
+            validator.assert_status_code(order_response, 201)
+            assert order_response.text == entries[0]['response']
+            assert get_response.text == entries[1]['response']
+        
+        with allure.step("Verify unrecorded requests are reported as misses"):
+            validator.assert_status_code(missing_response, 404)
+            validator.assert_error_structure(missing_response.json(), 'REPLAY_MISS')
+            assert replay_server.stats()['served'] == 2
+    
+    def test_replay_driver_reproduces_capture(self, capture_path, replay_server):
+        with allure.step("Replay the capture as fast as possible"):
+            report = ReplayDriver(
+                str(capture_path), base_url=REPLAY_BASE_URL, speed=0, concurrency=1, wsgi_app=app_module.app
+            ).run()
+        
+        with allure.step("Verify every request got its recorded response"):
+            assert report['total_requests'] == 5
+            for route, stats in report['routes'].items():
+                assert stats['errors'] == 0, route
+                assert stats['status_mismatches'] == 0, route
+                assert stats['body_mismatches'] == 0, route
+    
+    def test_replayed_latency_uses_server_time(self, capture_path):
+        store = ReplayStore(str(capture_path))
+        
+        with allure.step("Verify replayed delays follow the recorded server time"):
+            entry = next(iter_capture(str(capture_path)))
+            expected = entry['server_ms'] if entry['server_ms'] is not None else entry['ms']
+            assert store.latency_seconds(entry) == pytest.approx(expected / 1000)
+            assert ReplayStore(str(capture_path), replay_latency=False).latency_seconds(entry) == 0.0
+    
+    def test_miss_reads_ahead_within_limits(self, tmp_path):
+        path = str(tmp_path / 'orders.jsonl')
+        with TrafficRecorder(path) as recorder:
+            for seq in range(1, 101):
+                recorder.record(
+                    'GET /orders/{order_id}', 'GET', f'/orders/order_{seq}', None, 200,
+                    'application/json', json.dumps({'id': f'order_{seq}'}), float(seq), 1.0
+                )
+        store = ReplayStore(path, max_buffered=10, max_read_ahead=5, replay_latency=False)
+        
+        with allure.step("Miss on a request that is not in the capture"):
+            assert store.take('GET', '/orders/order_missing', None) is None
+            stats = store.stats()
+            assert (stats['buffered'], stats['exhausted']) == (5, False)
+        
+        with allure.step("Verify every recorded request is still served"):
+            assert store.take('GET', '/orders/order_3', None)['path'] == '/orders/order_3'
+            for seq in [1, 2] + list(range(4, 101)):
+                entry = store.take('GET', f'/orders/order_{seq}', None)
+                assert entry is not None, seq
+                assert json.loads(entry['response'])['id'] == f'order_{seq}'
+            stats = store.stats()
+            assert (stats['served'], stats['misses'], stats['buffered']) == (100, 1, 0)
+
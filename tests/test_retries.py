@@ -0,0 +1,137 @@
+import allure
+import pytest
+import time
+from utils.api_client import APIClient
+from utils.retry import CircuitBreaker, CircuitOpenError, RequestFailedError, RetryPolicy
+
+LIST_ORDERS = 'GET /orders'
+CREATE_ORDER = 'POST /orders'
+
+
+def failing_profile(rate: float = 1.0) -> dict:
+    return {'type': 'zero', 'error_rate': rate, 'error_status': 503}
+
+
+@pytest.fixture
+def make_client(mock_server, wsgi_app):
+    clients = []
+    
+    def factory(max_retries: int = 2, failure_threshold: int = 0, reset_timeout: float = 5.0) -> APIClient:
+        client = APIClient(
+            base_url=mock_server,
+            wsgi_app=wsgi_app,
+            retry_policy=RetryPolicy(max_retries=max_retries, backoff_base_ms=1, backoff_max_ms=5),
+            circuit_breaker=CircuitBreaker(failure_threshold, reset_timeout)
+        )
+        clients.append(client)
+        return client
+    
+    yield factory
+    for client in clients:
+        client.close()
+
+
+@allure.feature("Resilience")
+@allure.story("Retry Policy")
+class TestRetryPolicy:
+    
+    def test_get_is_retried_with_backoff(self, api_client, validator, make_client, restore_latency_profiles):
+        with allure.step("Fail every listing request with 503"):
+            api_client.update_latency_profiles({LIST_ORDERS: failing_profile()})
+        
+        with allure.step("List orders with two retries allowed"):
+            response, timing = make_client(max_retries=2).list_orders(limit=1)
+        
+        with allure.step("Verify the retries are reported in the timing"):
+            validator.assert_status_code(response, 503)
+            assert timing.attempts == 3
+            assert timing.retries == 2
+            assert timing.retry_wait_ms <= 10
+    
+    def test_post_is_retried_only_with_idempotency_key(
+        self, api_client, validator, make_client, restore_latency_profiles
+    ):
+        client = make_client(max_retries=2)
+        api_client.update_latency_profiles({CREATE_ORDER: failing_profile()})
+        
+        with allure.step("Verify a plain POST is not retried"):
+            response, timing = client.create_order(1000.0, 'KZT')
+            validator.assert_status_code(response, 503)
+            assert timing.retries == 0
+        
+        with allure.step("Verify a POST with an Idempotency-Key is retried"):
+            response, timing = client.create_order(1000.0, 'KZT', idempotency_key='retry-test-key')
+            validator.assert_status_code(response, 503)
+            assert timing.retries == 2
+    
+    def test_success_needs_no_retry(self, validator, make_client, mock_server):
+        with allure.step("List orders on a healthy server"):
+            response, timing = make_client(max_retries=2).list_orders(limit=1)
+        
+        with allure.step("Verify a single attempt"):
+            validator.assert_status_code(response, 200)
+            assert timing.attempts == 1
+            assert timing.breaker_state == 'closed'
+
+
+@allure.feature("Resilience")
+@allure.story("Circuit Breaker")
+class TestCircuitBreaker:
+    
+    def test_breaker_opens_and_recovers(self, api_client, validator, make_client, restore_latency_profiles):
+        client = make_client(max_retries=0, failure_threshold=2, reset_timeout=0.2)
+        api_client.update_latency_profiles({LIST_ORDERS: failing_profile()})
+        
+        with allure.step("Fail twice to open the breaker"):
+            client.list_orders(limit=1)
+            _, timing = client.list_orders(limit=1)
+            assert timing.breaker_state == 'open'
+        
+        with allure.step("Verify calls fail fast while open"):
+            with pytest.raises(CircuitOpenError):
+                client.list_orders(limit=1)
+            assert client.circuit_breaker.stats()['rejected'] == 1
+        
+        with allure.step("Verify a trial call closes the breaker once the server recovers"):
+            api_client.update_latency_profiles({LIST_ORDERS: None})
+            time.sleep(0.25)
+            response, timing = client.list_orders(limit=1)
+            validator.assert_status_code(response, 200)
+            assert timing.breaker_state == 'closed'
+    
+    def test_failed_preparation_keeps_the_breaker_usable(
+        self, api_client, validator, make_client, restore_latency_profiles
+    ):
+        client = make_client(max_retries=0, failure_threshold=2, reset_timeout=0.05)
+        api_client.update_latency_profiles({LIST_ORDERS: failing_profile()})
+        
+        with allure.step("Open the breaker and wait for the trial window"):
+            client.list_orders(limit=1)
+            client.list_orders(limit=1)
+            api_client.update_latency_profiles({LIST_ORDERS: None})
+            time.sleep(0.1)
+        
+        with allure.step("Fail to encode a request body"):
+            with pytest.raises(TypeError):
+                client._make_request('POST', '/orders', data={'amount': object()})
+        
+        with allure.step("Verify the trial call still goes through"):
+            response, timing = client.list_orders(limit=1)
+            validator.assert_status_code(response, 200)
+            assert timing.breaker_state == 'closed'
+    
+    def test_exhausted_retries_are_reported(self):
+        client = APIClient(
+            base_url='http://127.0.0.1:9',
+            retry_policy=RetryPolicy(max_retries=2, backoff_base_ms=1, backoff_max_ms=5),
+            circuit_breaker=CircuitBreaker(0)
+        )
+        
+        with allure.step("Call a port nobody listens on"):
+            with pytest.raises(RequestFailedError) as failure:
+                client.list_orders(limit=1)
+            client.close()
+        
+        with allure.step("Verify the retries are attached to the error"):
+            assert failure.value.retries == 2
+            assert failure.value.retry_wait_ms > 0
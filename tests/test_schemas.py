@@ -0,0 +1,70 @@
+import allure
+import pytest
+from mock_server.constants import ERROR_CODES
+from utils.schemas import ENDPOINT_SCHEMAS, get_checker, schema_for, validate
+
+
+@allure.feature("Validation")
+@allure.story("Response Schemas")
+class TestResponseSchemas:
+    
+    def test_reports_every_violation(self, validator):
+        order = {
+            'id': 'ord_1',
+            'amount': True,
+            'status': 'paid',
+            'created_at': '2024-01-01 00:00:00',
+            'description': '',
+            'customer': {}
+        }
+        
+        with allure.step("Validate a malformed order"):
+            violations = validate(order, 'order')
+        
+        with allure.step("Verify all violations are reported at once"):
+            assert len(violations) == 5, violations
+            assert "$.id: 'ord_1' does not start with 'order_'" in violations
+            assert "$.amount: expected number, got bool" in violations
+            assert "$.currency: missing" in violations
+            with pytest.raises(AssertionError, match=r"\(5 violations\)"):
+                validator.assert_schema(order, 'order')
+    
+    def test_nested_error_and_pages(self):
+        with allure.step("Verify nested error objects are checked"):
+            assert validate({'error': {'code': 'NOT_FOUND', 'message': 'gone'}}, 'error') == []
+            assert validate({'error': {'code': 'TEAPOT'}}, 'error') == [
+                f"$.error.code: 'TEAPOT' is not one of {sorted(ERROR_CODES)}",
+                "$.error.message: missing"
+            ]
+        
+        with allure.step("Verify array items carry their index in the path"):
+            page = {'data': [{'id': 'order_1'}, 'order_2'], 'next_cursor': None}
+            violations = validate(page, 'order_page')
+            assert "$.data[0].amount: missing" in violations
+            assert "$.data[1]: expected object, got str" in violations
+    
+    def test_schemas_are_compiled_once(self):
+        with allure.step("Verify every endpoint has a compiled schema"):
+            for route, name in ENDPOINT_SCHEMAS.items():
+                assert get_checker(name) is get_checker(name), route
+            assert schema_for('GET /orders/{order_id}', 404) == 'error'
+            assert schema_for('GET /health', 200) is None
+            with pytest.raises(KeyError):
+                get_checker('invoice')
+    
+    def test_live_responses_match_schemas(self, api_client, validator, test_helpers, mock_server):
+        with allure.step("Create order, payment and refund"):
+            order_id, payment_id, _, _ = test_helpers.create_order_and_payment()
+            refund_response, _ = api_client.refund_payment(payment_id)
+        
+        with allure.step("Verify every response matches its endpoint schema"):
+            responses = [
+                ('POST /payments/{payment_id}/refund', refund_response),
+                ('GET /orders/{order_id}', api_client.get_order(order_id)[0]),
+                ('POST /orders', api_client.create_order(1000.0, 'KZT', customer=None)[0]),
+                ('GET /orders/{order_id}', api_client.get_order('order_nonexistent_999')[0]),
+                ('GET /payments/{payment_id}', api_client.get_payment(payment_id)[0]),
+                ('GET /orders/{order_id}/payments', api_client.list_order_payments(order_id)[0])
+            ]
+            for route, response in responses:
+                validator.assert_schema(response.json(), schema_for(route, response.status_code))
@@ -0,0 +1,48 @@
+import allure
+import re
+from utils.config import config
+
+
+def metric_value(text: str, name: str, labels: str) -> float:
+    match = re.search(rf'^{re.escape(name)}\{{{re.escape(labels)}\}} (\S+)$', text, re.MULTILINE)
+    return float(match.group(1)) if match else 0.0
+
+
+@allure.feature("Performance")
+@allure.story("Server Metrics")
+class TestServerMetrics:
+    
+    def test_metrics_endpoint_counts_requests(self, api_client, validator, test_helpers, mock_server):
+        labels = 'route="GET /orders/{order_id}",status="200"'
+        
+        with allure.step("Read the request counter"):
+            response, execution_time = api_client.get_server_metrics()
+            validator.assert_status_code(response, 200)
+            validator.assert_response_time(execution_time, config.max_response_time_ms)
+            assert response.headers['Content-Type'].startswith('text/plain')
+            before = metric_value(response.text, 'mock_server_requests_total', labels)
+        
+        with allure.step("Get an order three times"):
+            order_id, _ = test_helpers.create_test_order()
+            for _ in range(3):
+                api_client.get_order(order_id)
+        
+        with allure.step("Verify the counter and histograms grew"):
+            text = api_client.get_server_metrics()[0].text
+            assert metric_value(text, 'mock_server_requests_total', labels) == before + 3
+            assert '# TYPE mock_server_handler_duration_seconds histogram' in text
+            assert 'mock_server_simulated_duration_seconds_bucket{route="GET /orders/{order_id}",le="+Inf"}' in text
+            assert re.search(r'^mock_server_requests_in_flight \d+$', text, re.MULTILINE)
+    
+    def test_server_timing_header(self, api_client, validator, mock_server, restore_latency_profiles):
+        with allure.step("Delay order creation by a fixed 20 ms"):
+            api_client.update_latency_profiles({'POST /orders': {'type': 'fixed', 'ms': 20}})
+        
+        with allure.step("Create order"):
+            response, timing = api_client.create_order(1000.0, 'KZT')
+            validator.assert_status_code(response, 201)
+        
+        with allure.step("Verify the server split handler and simulated time"):
+            validator.assert_json_structure(timing.server_timing, ['app', 'sim', 'total'])
+            assert timing.server_timing['sim'] >= 20
+            assert timing.server_ms <= float(timing), "Server time cannot exceed what the client observed"
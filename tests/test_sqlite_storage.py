@@ -0,0 +1,128 @@
+import sqlite3
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+import allure
+import pytest
+from mock_server.constants import DEFAULT_CURRENCY, ORDER_STATUS_PENDING, PAYMENT_STATUS_REFUNDED
+from mock_server.records import OrderRecord
+from mock_server.seed import seed
+from mock_server.sqlite_storage import SQLiteStorage
+from tests.conftest import wait_for_ready_port
+from utils.api_client import APIClient
+from utils.config import config
+
+
+def make_order(storage: SQLiteStorage, currency=DEFAULT_CURRENCY, seq=None) -> OrderRecord:
+    return OrderRecord(
+        seq or storage.orders.next_seq(),
+        amount=1000,
+        currency=currency,
+        status=ORDER_STATUS_PENDING,
+        created_at=1700000000
+    )
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "mock_server.db")
+
+
+@allure.feature("Mock Server")
+@allure.story("SQLite Storage")
+class TestSQLiteStorage:
+    
+    def test_records_survive_restart(self, db_path):
+        with allure.step("Seed a database and close it"):
+            storage = SQLiteStorage(db_path)
+            seed(storage, orders=120, payments_per_order=2)
+            order = make_order(storage)
+            storage.orders.insert(order)
+            storage.close()
+        
+        with allure.step("Reopen it and verify the records and counters"):
+            storage = SQLiteStorage(db_path)
+            try:
+                assert len(storage.orders) == 121
+                assert len(storage.payments) == 240
+                assert storage.orders.get(order.id)['amount'] == 1000
+                page, _ = storage.payments.query({'order': 1}, limit=10)
+                assert len(page) == 2
+                assert storage.orders.next_seq() == 122
+            finally:
+                storage.close()
+    
+    def test_failed_write_does_not_poison_the_connection(self, db_path):
+        storage = SQLiteStorage(db_path, batch_size=1000)
+        try:
+            with allure.step("Write a record before the failure"):
+                first = make_order(storage)
+                storage.orders.insert(first)
+            
+            with allure.step("Reject a record whose column cannot be bound"):
+                with pytest.raises(ValueError):
+                    storage.orders.insert(make_order(storage, currency={'code': 'KZT'}))
+            
+            with allure.step("Fail a statement inside the open batch"):
+                with pytest.raises(sqlite3.IntegrityError):
+                    storage.orders.insert(make_order(storage, seq=first.seq))
+            
+            with allure.step("Verify later writes and the earlier one are committed"):
+                second = make_order(storage)
+                storage.orders.insert(second)
+                storage.database.commit()
+                assert storage.orders.get(first.id) is not None
+                assert storage.orders.get(second.id) is not None
+                assert storage.database.pending == 0
+        finally:
+            storage.close()
+    
+    def test_locked_writes_back_only_changes(self, db_path):
+        storage = SQLiteStorage(db_path, batch_size=1000)
+        try:
+            seed(storage, orders=1, payments_per_order=1)
+            payment_id = 'payment_1'
+            
+            with allure.step("Leave the record untouched"):
+                with storage.payments.locked(payment_id):
+                    pass
+                assert storage.database.pending == 0
+            
+            with allure.step("Change the record"):
+                with storage.payments.locked(payment_id) as payment:
+                    payment.refund(10, PAYMENT_STATUS_REFUNDED, 1700000100)
+                assert storage.database.pending == 1
+                assert storage.payments.get(payment_id)['status'] == PAYMENT_STATUS_REFUNDED
+        finally:
+            storage.close()
+    
+    def test_sqlite_path_alone_selects_sqlite(self, db_path):
+        project_root = Path(__file__).parent.parent
+        stderr_file = tempfile.TemporaryFile()
+        
+        with allure.step("Start the server with --sqlite-path and no --storage"):
+            server_process = subprocess.Popen(
+                [sys.executable, str(project_root / "mock_server.py"), '--port', '0', '--sqlite-path', db_path],
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                cwd=str(project_root)
+            )
+            try:
+                port = wait_for_ready_port(server_process, config.mock_server_startup_timeout)
+                assert port is not None, "mock server did not report readiness"
+                with APIClient(base_url=f"http://127.0.0.1:{port}") as client:
+                    response, _ = client.create_order(amount=1000.0, currency='KZT')
+                    assert response.status_code == 201
+                    order_id = response.json()['id']
+            finally:
+                server_process.terminate()
+                server_process.wait()
+                stderr_file.close()
+        
+        with allure.step("Verify the order was written to that database"):
+            storage = SQLiteStorage(db_path)
+            try:
+                assert storage.orders.get(order_id)['amount'] == 1000.0
+            finally:
+                storage.close()
@@ -0,0 +1,95 @@
+import allure
+from mock_server.constants import ORDER_STATUS_PENDING, PAYMENT_STATUS_PENDING, PAYMENT_STATUS_REFUNDED
+from mock_server.records import OrderRecord, PaymentRecord
+from mock_server.storage import Storage
+
+
+def make_order(storage: Storage, currency: str, created_at: int) -> OrderRecord:
+    order = OrderRecord(
+        storage.orders.next_seq(),
+        amount=1000,
+        currency=currency,
+        status=ORDER_STATUS_PENDING,
+        created_at=created_at
+    )
+    storage.orders.insert(order)
+    return order
+
+
+def make_payment(storage: Storage, order_seq: int, created_at: int) -> PaymentRecord:
+    payment = PaymentRecord(
+        storage.payments.next_seq(),
+        order_seq=order_seq,
+        amount=1000,
+        currency='KZT',
+        status=PAYMENT_STATUS_PENDING,
+        created_at=created_at,
+        payment_method='card'
+    )
+    storage.payments.insert(payment)
+    return payment
+
+
+@allure.feature("Mock Server")
+@allure.story("Record Index")
+class TestRecordIndex:
+    
+    def test_out_of_order_created_at(self):
+        storage = Storage()
+        
+        with allure.step("Create a record older than the ones before it"):
+            for offset in range(10):
+                make_order(storage, 'KZT', 1700000000 + offset)
+            old = make_order(storage, 'XYZ', 1600000000)
+        
+        with allure.step("Verify created_at filters still find it"):
+            page, _ = storage.orders.query({'currency': 'XYZ'}, created_to=1650000000)
+            assert [order['id'] for order in page] == [old.id]
+            page, _ = storage.orders.query({'currency': 'XYZ'}, created_from=1500000000)
+            assert [order['id'] for order in page] == [old.id]
+    
+    def test_inserts_out_of_seq_order_keep_the_time_index(self):
+        storage = Storage()
+        clock = iter(range(1700000000, 1700000100))
+        
+        with allure.step("Allocate records across second boundaries and insert them newest first"):
+            allocated = [storage.orders.allocate(lambda: next(clock)) for _ in range(20)]
+            for seq, created_at in reversed(allocated):
+                storage.orders.insert(
+                    OrderRecord(seq, amount=1000, currency='KZT', status=ORDER_STATUS_PENDING, created_at=created_at)
+                )
+        
+        with allure.step("Verify created_at filters use the time index"):
+            assert storage.orders.index.time_ordered
+            page, _ = storage.orders.query({}, created_from=1700000005, created_to=1700000009)
+            assert [order['created_at'] for order in page] == [
+                "2023-11-14T22:13:25Z", "2023-11-14T22:13:26Z", "2023-11-14T22:13:27Z",
+                "2023-11-14T22:13:28Z", "2023-11-14T22:13:29Z"
+            ]
+    
+    def test_queries_stay_correct_under_eviction(self):
+        storage = Storage(max_records=500)
+        
+        with allure.step("Insert, refund and evict payments"):
+            for number in range(5000):
+                payment = make_payment(storage, number % 3 + 1, 1700000000 + number // 10)
+                if number % 4 == 0:
+                    with storage.payments.locked(payment.id) as record:
+                        record.refund(record.amount, PAYMENT_STATUS_REFUNDED, record.created_at)
+            assert len(storage.payments) == 500
+            assert len(storage.payments.index.all) <= 2 * 500 + 1024
+        
+        with allure.step("Compare query results with a full scan"):
+            for order_seq in (1, 2, 3):
+                for status in (PAYMENT_STATUS_PENDING, PAYMENT_STATUS_REFUNDED):
+                    page, _ = storage.payments.query(
+                        {'order': order_seq, 'status': status},
+                        created_from=1700000460,
+                        created_to=1700000480,
+                        limit=1000
+                    )
+                    assert [payment['id'] for payment in page] == [
+                        payment.id for _, payment in sorted(storage.payments.records.items())
+                        if payment.order_seq == order_seq and payment.status == status
+                        and 1700000460 <= payment.created_at <= 1700000480
+                    ]
@@ -0,0 +1,36 @@
+import allure
+from utils.metrics import PHASES
+
+
+@allure.feature("Performance")
+@allure.story("Request Timing")
+class TestRequestTiming:
+    
+    def test_timing_phase_breakdown(self, api_client, validator, mock_server):
+        with allure.step("Create order"):
+            response, timing = api_client.create_order(1000.0, 'KZT')
+            validator.assert_status_code(response, 201)
+        
+        with allure.step("Verify the timing still behaves as milliseconds"):
+            assert isinstance(timing, float)
+            assert timing > 0
+        
+        with allure.step("Verify the phases add up"):
+            breakdown = timing.breakdown()
+            validator.assert_json_structure(breakdown, ['total_ms', 'wall_ms', *PHASES])
+            for phase in PHASES:
+                assert breakdown[phase] >= 0, f"{phase} is negative: {breakdown}"
+            on_wire = timing.connect_ms + timing.send_ms + timing.ttfb_ms + timing.download_ms
+            assert on_wire <= float(timing) + 0.01, f"Phases exceed the total: {breakdown}"
+            assert timing.wall_ms >= float(timing) + timing.prepare_ms + timing.json_decode_ms - 0.01
+    
+    def test_json_is_decoded_once(self, api_client, validator, test_helpers, mock_server):
+        order_id, _ = test_helpers.create_test_order()
+        
+        with allure.step("Get order"):
+            response, timing = api_client.get_order(order_id)
+        
+        with allure.step("Verify the decoded body is reused"):
+            assert timing.json_decode_ms > 0
+            assert response.json() is response.json()
+            validator.assert_field_value(response.json(), 'id', order_id)
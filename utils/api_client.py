@@ -1,70 +1,353 @@
 import requests
 import time
-from typing import Dict, Any, Optional, Tuple
+import uuid
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from utils.capture import TrafficRecorder
 from utils.config import config
+from utils.json_backend import get_json_backend
+from utils.metrics import MetricsCollector, RequestTiming
+from utils.retry import CircuitBreaker, CircuitOpenError, RequestFailedError, RetryBudget, RetryPolicy
+from utils.timing import TimedHTTPAdapter, collect_phases, elapsed_ms, parse_server_timing, phase_breakdown
+from utils.wsgi_adapter import WSGIAdapter
 
 
 class APIClient:
     
-    def __init__(self):
-        self.base_url = config.api_base_url
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        metrics: Optional[MetricsCollector] = None,
+        wsgi_app: Optional[Any] = None,
+        auto_idempotency_keys: Optional[bool] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        recorder: Optional[TrafficRecorder] = None,
+        json_backend: Optional[str] = None
+    ):
+        self.base_url = base_url or config.api_base_url
         self.api_key = config.api_key
         self.timeout = config.api_timeout
         self.headers = {
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.api_key}'
         }
+        self.metrics = metrics
+        self.json_backend = get_json_backend(json_backend or config.api_json_backend)
+        # Every completed exchange is appended to the capture for later replay
+        self.recorder = recorder
+        self.wsgi_app = wsgi_app
+        # Send a fresh Idempotency-Key with every POST so retries of it cannot create duplicates
+        self.auto_idempotency_keys = (
+            config.api_auto_idempotency_keys if auto_idempotency_keys is None else auto_idempotency_keys
+        )
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=config.api_max_retries,
+            methods=config.api_retry_methods,
+            statuses=config.api_retry_statuses,
+            backoff_base_ms=config.api_retry_backoff_ms,
+            backoff_max_ms=config.api_retry_backoff_max_ms,
+            budget=RetryBudget(config.api_retry_budget_ratio, config.api_retry_budget_min)
+        )
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(
+            config.api_breaker_failure_threshold,
+            config.api_breaker_reset_timeout
+        )
+        self.session = self._create_session()
+    
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update(self.headers)
+        if not config.api_keep_alive:
+            session.headers['Connection'] = 'close'
+        
+        # Retries are done by _make_request so they show up in timings and respect the breaker
+        adapter = TimedHTTPAdapter(
+            pool_connections=config.api_pool_size,
+            pool_maxsize=config.api_pool_size,
+            max_retries=0
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        if self.wsgi_app is not None:
+            session.mount(self.base_url, WSGIAdapter(self.wsgi_app))
+        return session
+    
+    def close(self) -> None:
+        self.session.close()
+    
+    def __enter__(self) -> 'APIClient':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
     def _make_request(
         self,
         method: str,
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None
+        params: Optional[Dict[str, Any]] = None,
+        route: Optional[str] = None,
+        idempotency_key: Optional[str] = None
     ) -> Tuple[requests.Response, float]:
-        url = f"{self.base_url}{endpoint}"
-        start_time = time.time()
+        start_time = time.perf_counter()
+        started_at = time.time()
+        request_headers = {}
+        if data is None and method in ['POST', 'PUT', 'PATCH']:
+            request_headers['Content-Type'] = None
+        if idempotency_key is None and self.auto_idempotency_keys and method == 'POST':
+            idempotency_key = str(uuid.uuid4())
+        if idempotency_key is not None:
+            request_headers['Idempotency-Key'] = idempotency_key
         
+        # Encoding the body and merging headers happen once, outside the measured exchange,
+        # and before the breaker hands out a slot that a failure here would never give back
+        prepared = self.session.prepare_request(requests.Request(
+            method=method,
+            url=f"{self.base_url}{endpoint}",
+            data=self.json_backend.dumps(data) if data is not None else None,
+            params=params,
+            headers=request_headers
+        ))
+        send_kwargs = self.session.merge_environment_settings(prepared.url, {}, True, None, None)
+        prepare_ms = elapsed_ms(start_time)
+        
+        policy = self.retry_policy
+        breaker = self.circuit_breaker
+        if not breaker.allow():
+            raise CircuitOpenError(f"Request failed: circuit breaker is open for {self.base_url}")
+        policy.budget.deposit()
+        retryable = policy.is_retryable_method(method, idempotency_key)
+        retries = 0
+        retry_wait_ms = 0.0
+        exchange_start = time.perf_counter()
+        
+        # True while an allowed attempt has neither succeeded nor failed yet
+        outcome_pending = True
         try:
-            request_headers = self.headers.copy()
-            if data is None and method in ['POST', 'PUT', 'PATCH']:
-                request_headers.pop('Content-Type', None)
-            
-            response = requests.request(
-                method=method,
-                url=url,
-                json=data if data is not None else None,
-                params=params,
-                headers=request_headers,
-                timeout=self.timeout
+            while True:
+                response, error = None, None
+                with collect_phases() as collector:
+                    try:
+                        attempt_start = time.perf_counter()
+                        response = self.session.send(prepared, timeout=self.timeout, **send_kwargs)
+                        exchange_ms = elapsed_ms(attempt_start)
+                        download_start = time.perf_counter()
+                        response.content
+                        download_ms = elapsed_ms(download_start)
+                    except requests.exceptions.RequestException as e:
+                        error = e
+                
+                if error is not None or response.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                outcome_pending = False
+                
+                should_retry = (
+                    retryable
+                    and retries < policy.max_retries
+                    and (error is not None or response.status_code in policy.statuses)
+                )
+                # An open breaker or an exhausted budget ends the retries: fail fast instead of piling on
+                if not should_retry or not policy.budget.withdraw() or not breaker.allow():
+                    break
+                outcome_pending = True
+                
+                retry_after = response.headers.get('Retry-After') if response is not None else None
+                delay_ms = policy.backoff_ms(retries, retry_after)
+                time.sleep(delay_ms / 1000)
+                retry_wait_ms += delay_ms
+                retries += 1
+        finally:
+            if outcome_pending:
+                breaker.release()
+        
+        network_ms = elapsed_ms(exchange_start)
+        if error is not None:
+            raise RequestFailedError(
+                f"Request failed: {str(error)}", retries=retries, retry_wait_ms=retry_wait_ms
+            ) from error
+        
+        execution_time = RequestTiming(
+            network_ms,
+            attempts=retries + 1,
+            retries=retries,
+            retry_wait_ms=retry_wait_ms,
+            breaker_state=breaker.state,
+            phases=phase_breakdown(
+                collector, exchange_ms, download_ms, prepare_ms, self._decode_json(response)
+            ),
+            wall_ms=elapsed_ms(start_time),
+            server_timing=parse_server_timing(response.headers.get('Server-Timing'))
+        )
+        if self.metrics is not None:
+            self.metrics.record(route or f"{method} {endpoint}", response.status_code, execution_time)
+        if self.recorder is not None:
+            body = prepared.body.decode('utf-8') if isinstance(prepared.body, bytes) else prepared.body
+            self.recorder.record(
+                route or f"{method} {endpoint}",
+                method,
+                prepared.path_url,
+                body,
+                response.status_code,
+                response.headers.get('Content-Type'),
+                response.text,
+                started_at,
+                execution_time
             )
-            execution_time = (time.time() - start_time) * 1000
-            return response, execution_time
-        except requests.exceptions.RequestException as e:
-            execution_time = (time.time() - start_time) * 1000
-            raise Exception(f"Request failed: {str(e)}") from e
+        return response, execution_time
     
-    def create_order(self, amount: float, currency: str = 'KZT', **kwargs) -> Tuple[requests.Response, float]:
+    def _decode_json(self, response: requests.Response) -> float:
+        # Decode once so json_decode_ms is measured; later response.json() calls reuse the result
+        if 'json' not in response.headers.get('Content-Type', ''):
+            return 0.0
+        start = time.perf_counter()
+        try:
+            parsed = self.json_backend.loads(response.content)
+        except ValueError:
+            return elapsed_ms(start)
+        response.json = lambda **kwargs: parsed
+        return elapsed_ms(start)
+    
+    def create_order(
+        self,
+        amount: float,
+        currency: str = 'KZT',
+        idempotency_key: Optional[str] = None,
+        **kwargs
+    ) -> Tuple[requests.Response, float]:
         data = {
             'amount': amount,
             'currency': currency,
             **kwargs
         }
-        return self._make_request('POST', '/orders', data=data)
+        return self._make_request(
+            'POST', '/orders', data=data, route='POST /orders', idempotency_key=idempotency_key
+        )
+    
+    def create_orders_bulk(
+        self,
+        orders: List[Dict[str, Any]],
+        idempotency_key: Optional[str] = None
+    ) -> Tuple[requests.Response, float]:
+        return self._make_request(
+            'POST', '/orders:batch', data={'orders': orders}, route='POST /orders:batch',
+            idempotency_key=idempotency_key
+        )
+    
+    def list_orders(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        **filters
+    ) -> Tuple[requests.Response, float]:
+        params = {'limit': limit, 'cursor': cursor, **filters}
+        return self._make_request(
+            'GET', '/orders', params={k: v for k, v in params.items() if v is not None}, route='GET /orders'
+        )
+    
+    def iter_orders(self, limit: Optional[int] = None, **filters) -> Iterator[Dict[str, Any]]:
+        return self._iter_pages(lambda cursor: self.list_orders(limit=limit, cursor=cursor, **filters))
+    
+    def _iter_pages(self, fetch_page) -> Iterator[Dict[str, Any]]:
+        # Pages are fetched lazily, one request per page, as the caller consumes items
+        cursor = None
+        while True:
+            response, _ = fetch_page(cursor)
+            if response.status_code != 200:
+                raise Exception(f"Listing failed with status {response.status_code}: {response.text}")
+            page = response.json()
+            yield from page['data']
+            cursor = page['next_cursor']
+            if cursor is None:
+                return
     
     def get_order(self, order_id: str) -> Tuple[requests.Response, float]:
-        return self._make_request('GET', f'/orders/{order_id}')
+        return self._make_request('GET', f'/orders/{order_id}', route='GET /orders/{order_id}')
     
-    def create_payment(self, order_id: str, payment_method: str = 'card') -> Tuple[requests.Response, float]:
+    def create_payment(
+        self,
+        order_id: str,
+        payment_method: str = 'card',
+        idempotency_key: Optional[str] = None
+    ) -> Tuple[requests.Response, float]:
         data = {'payment_method': payment_method}
-        return self._make_request('POST', f'/orders/{order_id}/payments', data=data)
+        return self._make_request(
+            'POST', f'/orders/{order_id}/payments', data=data, route='POST /orders/{order_id}/payments',
+            idempotency_key=idempotency_key
+        )
+    
+    def list_order_payments(
+        self,
+        order_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> Tuple[requests.Response, float]:
+        params = {'limit': limit, 'cursor': cursor, 'status': status}
+        return self._make_request(
+            'GET', f'/orders/{order_id}/payments',
+            params={k: v for k, v in params.items() if v is not None},
+            route='GET /orders/{order_id}/payments'
+        )
+    
+    def iter_order_payments(
+        self,
+        order_id: str,
+        limit: Optional[int] = None,
+        status: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        return self._iter_pages(
+            lambda cursor: self.list_order_payments(order_id, limit=limit, cursor=cursor, status=status)
+        )
+    
+    def create_payments_bulk(
+        self,
+        payments: List[Dict[str, Any]],
+        idempotency_key: Optional[str] = None
+    ) -> Tuple[requests.Response, float]:
+        return self._make_request(
+            'POST', '/payments:batch', data={'payments': payments}, route='POST /payments:batch',
+            idempotency_key=idempotency_key
+        )
     
     def get_payment(self, payment_id: str) -> Tuple[requests.Response, float]:
-        return self._make_request('GET', f'/payments/{payment_id}')
+        return self._make_request('GET', f'/payments/{payment_id}', route='GET /payments/{payment_id}')
     
-    def refund_payment(self, payment_id: str, amount: Optional[float] = None) -> Tuple[requests.Response, float]:
+    def refund_payment(
+        self,
+        payment_id: str,
+        amount: Optional[float] = None,
+        idempotency_key: Optional[str] = None
+    ) -> Tuple[requests.Response, float]:
         data = {}
         if amount is not None:
             data['amount'] = amount
-        return self._make_request('POST', f'/payments/{payment_id}/refund', data=data)
-
+        return self._make_request(
+            'POST', f'/payments/{payment_id}/refund', data=data, route='POST /payments/{payment_id}/refund',
+            idempotency_key=idempotency_key
+        )
+    
+    def get_admin_stats(self) -> Tuple[requests.Response, float]:
+        return self._make_request('GET', '/admin/stats', route='GET /admin/stats')
+    
+    def get_server_metrics(self) -> Tuple[requests.Response, float]:
+        return self._make_request('GET', '/metrics', route='GET /metrics')
+    
+    def get_clock(self) -> Tuple[requests.Response, float]:
+        return self._make_request('GET', '/admin/clock', route='GET /admin/clock')
+    
+    def freeze_clock(self, frozen_at: Optional[str]) -> Tuple[requests.Response, float]:
+        return self._make_request('PUT', '/admin/clock', data={'frozen_at': frozen_at}, route='PUT /admin/clock')
+    
+    def get_latency_profiles(self) -> Tuple[requests.Response, float]:
+        return self._make_request('GET', '/admin/latency', route='GET /admin/latency')
+    
+    def set_latency_profiles(self, settings: Dict[str, Any]) -> Tuple[requests.Response, float]:
+        return self._make_request('PUT', '/admin/latency', data=settings, route='PUT /admin/latency')
+    
+    def update_latency_profiles(self, endpoints: Dict[str, Any]) -> Tuple[requests.Response, float]:
+        return self._make_request(
+            'PATCH', '/admin/latency', data={'endpoints': endpoints}, route='PATCH /admin/latency'
+        )
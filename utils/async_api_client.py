@@ -0,0 +1,118 @@
+import httpx
+import time
+from typing import Dict, Any, Optional, Tuple
+from utils.config import config
+from utils.json_backend import get_json_backend
+from utils.metrics import MetricsCollector
+from utils.timing import elapsed_ms
+from utils.wsgi_adapter import AsyncWSGITransport
+
+
+class AsyncAPIClient:
+    
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        metrics: Optional[MetricsCollector] = None,
+        wsgi_app: Optional[Any] = None,
+        json_backend: Optional[str] = None
+    ):
+        self.base_url = base_url or config.api_base_url
+        self.api_key = config.api_key
+        self.timeout = config.api_timeout
+        self.headers = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {self.api_key}'
+        }
+        self.metrics = metrics
+        self.json_backend = get_json_backend(json_backend or config.api_json_backend)
+        self.wsgi_app = wsgi_app
+        self.client = self._create_client()
+    
+    def _create_client(self) -> httpx.AsyncClient:
+        # Content-Type is only sent with a body, so bodiless POSTs go without it
+        headers = {k: v for k, v in self.headers.items() if k != 'Content-Type'}
+        if not config.api_keep_alive:
+            headers['Connection'] = 'close'
+        
+        limits = httpx.Limits(
+            max_connections=config.api_async_max_connections,
+            max_keepalive_connections=config.api_async_max_connections if config.api_keep_alive else 0
+        )
+        if self.wsgi_app is not None:
+            transport = AsyncWSGITransport(self.wsgi_app)
+        else:
+            transport = httpx.AsyncHTTPTransport(limits=limits, retries=config.api_max_retries)
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=headers,
+            timeout=self.timeout,
+            transport=transport
+        )
+    
+    async def close(self) -> None:
+        await self.client.aclose()
+    
+    async def __aenter__(self) -> 'AsyncAPIClient':
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+    
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        route: Optional[str] = None
+    ) -> Tuple[httpx.Response, float]:
+        start_time = time.perf_counter()
+        content, headers = None, None
+        if data is not None:
+            content = self.json_backend.dumps(data)
+            headers = {'Content-Type': 'application/json'}
+        
+        try:
+            response = await self.client.request(
+                method=method,
+                url=endpoint,
+                content=content,
+                params=params,
+                headers=headers
+            )
+            execution_time = elapsed_ms(start_time)
+            if self.metrics is not None:
+                self.metrics.record(route or f"{method} {endpoint}", response.status_code, execution_time)
+            return response, execution_time
+        except httpx.HTTPError as e:
+            execution_time = elapsed_ms(start_time)
+            raise Exception(f"Request failed: {str(e)}") from e
+    
+    async def create_order(self, amount: float, currency: str = 'KZT', **kwargs) -> Tuple[httpx.Response, float]:
+        data = {
+            'amount': amount,
+            'currency': currency,
+            **kwargs
+        }
+        return await self._make_request('POST', '/orders', data=data, route='POST /orders')
+    
+    async def get_order(self, order_id: str) -> Tuple[httpx.Response, float]:
+        return await self._make_request('GET', f'/orders/{order_id}', route='GET /orders/{order_id}')
+    
+    async def create_payment(self, order_id: str, payment_method: str = 'card') -> Tuple[httpx.Response, float]:
+        data = {'payment_method': payment_method}
+        return await self._make_request(
+            'POST', f'/orders/{order_id}/payments', data=data, route='POST /orders/{order_id}/payments'
+        )
+    
+    async def get_payment(self, payment_id: str) -> Tuple[httpx.Response, float]:
+        return await self._make_request('GET', f'/payments/{payment_id}', route='GET /payments/{payment_id}')
+    
+    async def refund_payment(self, payment_id: str, amount: Optional[float] = None) -> Tuple[httpx.Response, float]:
+        data = {}
+        if amount is not None:
+            data['amount'] = amount
+        return await self._make_request(
+            'POST', f'/payments/{payment_id}/refund', data=data, route='POST /payments/{payment_id}/refund'
+        )
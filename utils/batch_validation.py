@@ -0,0 +1,233 @@
+import queue
+import random
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+from utils.metrics import LatencyHistogram
+from utils.schemas import get_checker, route_for, schema_for
+
+UNMATCHED_ROUTE = 'unmatched'
+MALFORMED_ERROR = 'MALFORMED_ERROR'
+MAX_SAMPLE_BODY = 500
+
+# "$.data[17].status: 'paid' is not one of [...]" is counted as "$.data[].status"
+_VIOLATION_KEY = re.compile(r'\[\d+\]')
+
+
+class ValidationStats:
+    # Counters, a latency histogram and a reservoir of failure samples: memory depends on
+    # the number of routes, status codes and schema paths, never on how many responses
+    # were checked. Each worker fills its own and they are merged at the end.
+
+    def __init__(self, sample_size: int = 20, rng: Optional[random.Random] = None):
+        self.sample_size = sample_size
+        self.rng = rng or random.Random()
+        self.total = 0
+        self.passed = 0
+        self.invalid = 0
+        self.routes: Dict[str, Dict[str, int]] = {}
+        self.status_codes: Dict[str, int] = {}
+        self.error_codes: Dict[str, int] = {}
+        self.violations: Dict[str, int] = {}
+        self.latencies = LatencyHistogram()
+        self.samples: List[Dict[str, Any]] = []
+        self.failures_seen = 0
+
+    def record(
+        self,
+        route: str,
+        status_code: int,
+        error_code: Optional[str],
+        violations: List[str],
+        execution_time: Optional[float],
+        body: str
+    ) -> None:
+        passed = status_code < 400 and not violations
+        self.total += 1
+        route_counts = self.routes.get(route)
+        if route_counts is None:
+            route_counts = self.routes[route] = {'total': 0, 'passed': 0, 'failed': 0}
+        route_counts['total'] += 1
+        key = str(status_code)
+        self.status_codes[key] = self.status_codes.get(key, 0) + 1
+        if execution_time is not None:
+            self.latencies.record(execution_time)
+
+        if passed:
+            self.passed += 1
+            route_counts['passed'] += 1
+            return
+
+        route_counts['failed'] += 1
+        if error_code is not None:
+            self.error_codes[error_code] = self.error_codes.get(error_code, 0) + 1
+        if violations:
+            self.invalid += 1
+            for violation in violations:
+                path = _VIOLATION_KEY.sub('[]', violation.split(':', 1)[0])
+                self.violations[path] = self.violations.get(path, 0) + 1
+
+        # Reservoir sampling keeps every failure equally likely to be shown
+        self.failures_seen += 1
+        if len(self.samples) < self.sample_size:
+            slot = len(self.samples)
+            self.samples.append(None)
+        else:
+            slot = self.rng.randrange(self.failures_seen)
+            if slot >= self.sample_size:
+                return
+        self.samples[slot] = {
+            'route': route,
+            'status_code': status_code,
+            'error_code': error_code,
+            'violations': violations[:10],
+            'body': body[:MAX_SAMPLE_BODY]
+        }
+
+    def merge(self, other: 'ValidationStats') -> None:
+        self.total += other.total
+        self.passed += other.passed
+        self.invalid += other.invalid
+        for route, counts in other.routes.items():
+            own = self.routes.setdefault(route, {'total': 0, 'passed': 0, 'failed': 0})
+            for name, count in counts.items():
+                own[name] += count
+        for own, theirs in (
+            (self.status_codes, other.status_codes),
+            (self.error_codes, other.error_codes),
+            (self.violations, other.violations)
+        ):
+            for key, count in theirs.items():
+                own[key] = own.get(key, 0) + count
+        self.latencies.merge(other.latencies)
+        samples = self.samples + other.samples
+        self.failures_seen += other.failures_seen
+        if len(samples) > self.sample_size:
+            samples = self.rng.sample(samples, self.sample_size)
+        self.samples = samples
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            'total': self.total,
+            'passed': self.passed,
+            'failed': self.total - self.passed,
+            'invalid': self.invalid,
+            'pass_rate': round(self.passed / self.total, 4) if self.total else 0.0,
+            'routes': dict(sorted(self.routes.items())),
+            'status_codes': self.status_codes,
+            'error_codes': self.error_codes,
+            'violations': dict(sorted(self.violations.items(), key=lambda item: -item[1])),
+            'latency_ms': self.latencies.summary(),
+            'samples': self.samples
+        }
+
+
+def check_response(response: Any, route: Optional[str] = None) -> Tuple[str, Optional[str], List[str]]:
+    # Never raises: anything wrong with the response ends up in the violations list.
+    # Works with requests and httpx responses alike.
+    route = route or route_for(response.request.method, urlsplit(str(response.url)).path) or UNMATCHED_ROUTE
+    status_code = response.status_code
+    schema = schema_for(route, status_code)
+    if schema is None:
+        return route, None, []
+
+    try:
+        body = response.json()
+    except ValueError:
+        return route, MALFORMED_ERROR if status_code >= 400 else None, ["$: body is not valid JSON"]
+
+    violations: List[str] = []
+    get_checker(schema)(body, '$', violations)
+    error_code = None
+    if status_code >= 400:
+        # Same expectations as ResponseValidator.assert_error_structure
+        error = body.get('error') if isinstance(body, dict) else None
+        code = error.get('code') if isinstance(error, dict) else None
+        error_code = code if isinstance(code, str) and 'message' in error else MALFORMED_ERROR
+    return route, error_code, violations
+
+
+class BatchValidator:
+    # Checks (response, timing) records against the endpoint schemas on worker threads.
+    # Records go through a bounded queue, so a producer faster than the workers blocks
+    # instead of buffering responses; nothing raises, results are only aggregated.
+    #
+    #     with BatchValidator(workers=4) as validator:
+    #         for response, timing in responses:
+    #             validator.submit(response, timing)
+    #     report = validator.report()
+
+    def __init__(
+        self,
+        workers: int = 4,
+        sample_size: int = 20,
+        queue_size: int = 1000,
+        seed: Optional[int] = None
+    ):
+        self.workers = workers
+        self.sample_size = sample_size
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.rng = random.Random(seed)
+        self.stats = [ValidationStats(sample_size, random.Random(self.rng.random())) for _ in range(workers)]
+        self.threads: List[threading.Thread] = []
+        self._result: Optional[ValidationStats] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> 'BatchValidator':
+        with self._lock:
+            if not self.threads:
+                self.threads = [
+                    threading.Thread(target=self._worker, args=(stats,), daemon=True) for stats in self.stats
+                ]
+                for thread in self.threads:
+                    thread.start()
+        return self
+
+    def _worker(self, stats: ValidationStats) -> None:
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            response, execution_time, route = item
+            try:
+                route, error_code, violations = check_response(response, route)
+                body = response.text if violations or response.status_code >= 400 else ''
+            except Exception as e:
+                route, error_code, violations, body = route or UNMATCHED_ROUTE, None, [f"$: {e!r}"], ''
+            stats.record(route, response.status_code, error_code, violations, execution_time, body)
+
+    def submit(self, response: Any, execution_time: Optional[float] = None, route: Optional[str] = None) -> None:
+        if self._result is not None:
+            raise RuntimeError("BatchValidator is already closed")
+        self.start()
+        self.queue.put((response, execution_time, route))
+
+    def validate(self, records: Iterable[Tuple[Any, Optional[float]]]) -> Dict[str, Any]:
+        # Drains a generator of (response, timing) pairs and returns the report
+        with self:
+            for response, execution_time in records:
+                self.submit(response, execution_time)
+        return self.report()
+
+    def close(self) -> None:
+        if self._result is not None:
+            return
+        for _ in self.threads:
+            self.queue.put(None)
+        for thread in self.threads:
+            thread.join()
+        result = ValidationStats(self.sample_size, self.rng)
+        for stats in self.stats:
+            result.merge(stats)
+        self._result = result
+
+    def report(self) -> Dict[str, Any]:
+        self.close()
+        return self._result.report()
+
+    def __enter__(self) -> 'BatchValidator':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
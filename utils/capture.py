@@ -0,0 +1,82 @@
+import gzip
+import hashlib
+import threading
+from typing import Dict, Any, IO, Iterator, Optional
+from urllib.parse import unquote
+from utils.json_backend import get_json_backend
+
+# A capture is JSON Lines, one exchange per line, gzip-compressed when the file name ends
+# in .gz. Lines are only ever appended, and readers stream them one at a time, so a
+# capture can grow far larger than memory.
+
+
+def open_capture(path: str, mode: str) -> IO[str]:
+    if str(path).endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def iter_capture(path: str) -> Iterator[Dict[str, Any]]:
+    backend = get_json_backend()
+    with open_capture(path, 'r') as f:
+        for line in f:
+            if line.strip():
+                yield backend.loads(line)
+
+
+def request_key(method: str, path: str, body: Optional[str]) -> str:
+    # Requests match on method, path with query string and the exact body; the path is
+    # compared unquoted since client and server may percent-encode it differently
+    digest = hashlib.sha1((body or '').encode('utf-8')).hexdigest()
+    return f"{method.upper()} {unquote(path)} {digest}"
+
+
+class TrafficRecorder:
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = open_capture(path, 'a')
+        self.recorded = 0
+        self.json_backend = get_json_backend()
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        route: str,
+        method: str,
+        path: str,
+        body: Optional[str],
+        status_code: int,
+        content_type: Optional[str],
+        response_body: str,
+        started_at: float,
+        execution_time: float
+    ) -> None:
+        entry = {
+            'ts': round(started_at, 6),
+            'route': route,
+            'method': method,
+            'path': path,
+            'body': body,
+            'status': status_code,
+            'content_type': content_type,
+            'response': response_body,
+            'ms': round(float(execution_time), 3),
+            'server_ms': getattr(execution_time, 'server_ms', None)
+        }
+        line = self.json_backend.dumps(entry).decode('utf-8') + '\n'
+        with self._lock:
+            self.file.write(line)
+            self.recorded += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if not self.file.closed:
+                self.file.close()
+
+    def __enter__(self) -> 'TrafficRecorder':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
@@ -17,14 +17,90 @@ class Config:
                 self.api_base_url = config.get('api', {}).get('base_url', 'http://localhost:5000')
                 self.api_key = config.get('api', {}).get('api_key', 'test_api_key_12345')
                 self.api_timeout = config.get('api', {}).get('timeout', 5)
+                self.api_pool_size = config.get('api', {}).get('pool_size', 10)
+                self.api_max_retries = config.get('api', {}).get('max_retries', 0)
+                self.api_keep_alive = config.get('api', {}).get('keep_alive', True)
+                self.api_async_max_connections = config.get('api', {}).get('async_max_connections', 100)
+                self.api_auto_idempotency_keys = config.get('api', {}).get('auto_idempotency_keys', False)
+                self.api_json_backend = config.get('api', {}).get('json_backend', 'auto')
+                self.api_retry_methods = config.get('api', {}).get(
+                    'retry_methods', ['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE']
+                )
+                self.api_retry_statuses = config.get('api', {}).get('retry_statuses', [429, 502, 503, 504])
+                self.api_retry_backoff_ms = config.get('api', {}).get('retry_backoff_ms', 50)
+                self.api_retry_backoff_max_ms = config.get('api', {}).get('retry_backoff_max_ms', 2000)
+                self.api_retry_budget_ratio = config.get('api', {}).get('retry_budget_ratio', 0.2)
+                self.api_retry_budget_min = config.get('api', {}).get('retry_budget_min', 10)
+                self.api_breaker_failure_threshold = config.get('api', {}).get('breaker_failure_threshold', 5)
+                self.api_breaker_reset_timeout = config.get('api', {}).get('breaker_reset_timeout', 5)
                 self.max_response_time_ms = config.get('test', {}).get('max_response_time_ms', 500)
                 self.mock_server_port = config.get('test', {}).get('mock_server_port', 5000)
+                self.mock_server_mode = config.get('test', {}).get('mock_server_mode', 'subprocess')
+                self.mock_server_startup_timeout = config.get('test', {}).get('mock_server_startup_timeout', 15)
+                self.mock_server_engine = config.get('mock_server', {}).get('engine', 'waitress')
+                self.mock_server_threads = config.get('mock_server', {}).get('threads', 8)
+                self.mock_server_workers = config.get('mock_server', {}).get('workers', 1)
+                self.mock_server_max_records = config.get('mock_server', {}).get('max_records', 0)
+                self.mock_server_ttl_seconds = config.get('mock_server', {}).get('ttl_seconds', 0)
+                self.mock_server_storage = config.get('mock_server', {}).get('storage', 'memory')
+                self.mock_server_sqlite_path = config.get('mock_server', {}).get('sqlite_path', 'mock_server.db')
+                self.mock_server_sqlite_batch_size = config.get('mock_server', {}).get('sqlite_batch_size', 500)
+                self.mock_server_sqlite_flush_interval_ms = config.get('mock_server', {}).get(
+                    'sqlite_flush_interval_ms', 50
+                )
+                self.mock_server_idempotency_max_keys = config.get('mock_server', {}).get('idempotency_max_keys', 10000)
+                self.mock_server_idempotency_ttl_seconds = config.get('mock_server', {}).get(
+                    'idempotency_ttl_seconds', 86400
+                )
+                self.mock_server_json_backend = config.get('mock_server', {}).get('json_backend', 'auto')
+                self.mock_server_latency_profiles = config.get('mock_server', {}).get('latency_profiles', {})
+                self.latency_report_path = config.get('test', {}).get('latency_report_path', 'latency-report.json')
+                self.attach_latency_report = config.get('test', {}).get('attach_latency_report', True)
+                self.latency_budgets = config.get('test', {}).get('latency_budgets', {})
+                self.latency_baseline_path = config.get('test', {}).get('latency_baseline_path', 'latency-baseline.json')
+                self.latency_regression_tolerance = config.get('test', {}).get('latency_regression_tolerance', 1.5)
+                self.latency_regression_slack_ms = config.get('test', {}).get('latency_regression_slack_ms', 25)
         else:
             self.api_base_url = os.getenv('API_BASE_URL', 'http://localhost:5000')
             self.api_key = os.getenv('API_KEY', 'test_api_key_12345')
             self.api_timeout = int(os.getenv('API_TIMEOUT', '5'))
+            self.api_pool_size = int(os.getenv('API_POOL_SIZE', '10'))
+            self.api_max_retries = int(os.getenv('API_MAX_RETRIES', '0'))
+            self.api_keep_alive = os.getenv('API_KEEP_ALIVE', 'true').lower() == 'true'
+            self.api_async_max_connections = int(os.getenv('API_ASYNC_MAX_CONNECTIONS', '100'))
+            self.api_auto_idempotency_keys = os.getenv('API_AUTO_IDEMPOTENCY_KEYS', 'false').lower() == 'true'
+            self.api_json_backend = os.getenv('API_JSON_BACKEND', 'auto')
+            self.api_retry_methods = os.getenv('API_RETRY_METHODS', 'GET,HEAD,OPTIONS,PUT,DELETE').split(',')
+            self.api_retry_statuses = [int(s) for s in os.getenv('API_RETRY_STATUSES', '429,502,503,504').split(',')]
+            self.api_retry_backoff_ms = float(os.getenv('API_RETRY_BACKOFF_MS', '50'))
+            self.api_retry_backoff_max_ms = float(os.getenv('API_RETRY_BACKOFF_MAX_MS', '2000'))
+            self.api_retry_budget_ratio = float(os.getenv('API_RETRY_BUDGET_RATIO', '0.2'))
+            self.api_retry_budget_min = float(os.getenv('API_RETRY_BUDGET_MIN', '10'))
+            self.api_breaker_failure_threshold = int(os.getenv('API_BREAKER_FAILURE_THRESHOLD', '5'))
+            self.api_breaker_reset_timeout = float(os.getenv('API_BREAKER_RESET_TIMEOUT', '5'))
             self.max_response_time_ms = int(os.getenv('MAX_RESPONSE_TIME_MS', '500'))
             self.mock_server_port = int(os.getenv('MOCK_SERVER_PORT', '5000'))
+            self.mock_server_mode = os.getenv('MOCK_SERVER_MODE', 'subprocess')
+            self.mock_server_startup_timeout = float(os.getenv('MOCK_SERVER_STARTUP_TIMEOUT', '15'))
+            self.mock_server_engine = os.getenv('MOCK_SERVER_ENGINE', 'waitress')
+            self.mock_server_threads = int(os.getenv('MOCK_SERVER_THREADS', '8'))
+            self.mock_server_workers = int(os.getenv('MOCK_SERVER_WORKERS', '1'))
+            self.mock_server_max_records = int(os.getenv('MOCK_SERVER_MAX_RECORDS', '0'))
+            self.mock_server_ttl_seconds = float(os.getenv('MOCK_SERVER_TTL_SECONDS', '0'))
+            self.mock_server_storage = os.getenv('MOCK_SERVER_STORAGE', 'memory')
+            self.mock_server_sqlite_path = os.getenv('MOCK_SERVER_SQLITE_PATH', 'mock_server.db')
+            self.mock_server_sqlite_batch_size = int(os.getenv('MOCK_SERVER_SQLITE_BATCH_SIZE', '500'))
+            self.mock_server_sqlite_flush_interval_ms = float(os.getenv('MOCK_SERVER_SQLITE_FLUSH_INTERVAL_MS', '50'))
+            self.mock_server_idempotency_max_keys = int(os.getenv('MOCK_SERVER_IDEMPOTENCY_MAX_KEYS', '10000'))
+            self.mock_server_idempotency_ttl_seconds = float(os.getenv('MOCK_SERVER_IDEMPOTENCY_TTL_SECONDS', '86400'))
+            self.mock_server_json_backend = os.getenv('MOCK_SERVER_JSON_BACKEND', 'auto')
+            self.mock_server_latency_profiles = json.loads(os.getenv('MOCK_SERVER_LATENCY_PROFILES', '{}'))
+            self.latency_report_path = os.getenv('LATENCY_REPORT_PATH', 'latency-report.json')
+            self.attach_latency_report = os.getenv('ATTACH_LATENCY_REPORT', 'true').lower() == 'true'
+            self.latency_budgets = json.loads(os.getenv('LATENCY_BUDGETS', '{}'))
+            self.latency_baseline_path = os.getenv('LATENCY_BASELINE_PATH', 'latency-baseline.json')
+            self.latency_regression_tolerance = float(os.getenv('LATENCY_REGRESSION_TOLERANCE', '1.5'))
+            self.latency_regression_slack_ms = float(os.getenv('LATENCY_REGRESSION_SLACK_MS', '25'))
 
 
 config = Config()
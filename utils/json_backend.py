@@ -0,0 +1,45 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_BACKENDS = ('auto', 'orjson', 'stdlib')
+
+
+class StdlibJSONBackend:
+    name = 'stdlib'
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, sort_keys=sort_keys).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonBackend(StdlibJSONBackend):
+    # orjson rejects a few things the stdlib accepts (non-string keys, integers beyond
+    # 64 bits); those payloads fall back to the stdlib encoder instead of failing
+
+    name = 'orjson'
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else None)
+        except TypeError:
+            return super().dumps(obj, sort_keys)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+def get_json_backend(name: str = 'auto') -> StdlibJSONBackend:
+    if name not in JSON_BACKENDS:
+        raise ValueError(f"Unknown JSON backend '{name}', expected one of {', '.join(JSON_BACKENDS)}")
+    if name == 'orjson' and orjson is None:
+        raise RuntimeError("orjson is not installed: pip install orjson")
+    if name == 'stdlib' or orjson is None:
+        return StdlibJSONBackend()
+    return OrjsonBackend()
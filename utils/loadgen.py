@@ -0,0 +1,263 @@
+"""
+Load generator for the ioka API mock.
+
+Usage:
+    python -m utils.loadgen --concurrency 16 --duration 30
+    python -m utils.loadgen --rps 500 --mix create_order=1,get_order=4 --output run.json
+    python -m utils.loadgen --duration 60 --capture capture.jsonl.gz    # record for utils.replay
+    python -m utils.loadgen --duration 60 --validate    # check every response against its schema
+"""
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional
+from utils.api_client import APIClient
+from utils.batch_validation import BatchValidator
+from utils.capture import TrafficRecorder
+from utils.metrics import LatencyHistogram
+
+ENDPOINTS = ['create_order', 'get_order', 'create_payment', 'get_payment', 'refund_payment']
+DEFAULT_MIX = 'create_order=2,get_order=3,create_payment=2,get_payment=3,refund_payment=1'
+ID_POOL_SIZE = 10000
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    weights = {}
+    for item in mix.split(','):
+        name, _, weight = item.strip().partition('=')
+        if name not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint '{name}', expected one of {', '.join(ENDPOINTS)}")
+        weights[name] = float(weight or 1)
+    if not any(weights.values()):
+        raise ValueError("Endpoint mix must contain at least one positive weight")
+    return weights
+
+
+class EndpointStats:
+
+    def __init__(self):
+        self.latencies = LatencyHistogram()
+        self.server_latencies = LatencyHistogram()
+        self.status_codes: Dict[str, int] = {}
+        self.errors = 0
+
+    def record(self, status_code: int, execution_time: float) -> None:
+        self.latencies.record(execution_time)
+        # Server-side time from the Server-Timing header, to compare with what the client saw
+        server_ms = getattr(execution_time, 'server_ms', None)
+        if server_ms is not None:
+            self.server_latencies.record(server_ms)
+        key = str(status_code)
+        self.status_codes[key] = self.status_codes.get(key, 0) + 1
+
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        count = self.latencies.count
+        report = {
+            'count': count,
+            'errors': self.errors,
+            'throughput_rps': round(count / elapsed, 2) if elapsed else 0.0,
+            'status_codes': self.status_codes,
+            'latency_ms': {
+                key: value for key, value in self.latencies.summary().items() if key != 'count'
+            }
+        }
+        if self.server_latencies.count:
+            report['server_latency_ms'] = {
+                key: value for key, value in self.server_latencies.summary().items() if key != 'count'
+            }
+        return report
+
+
+class LoadGenerator:
+
+    def __init__(
+        self,
+        mix: Dict[str, float],
+        concurrency: int = 4,
+        duration: float = 10.0,
+        rps: Optional[float] = None,
+        recorder: Optional[TrafficRecorder] = None,
+        validator: Optional[BatchValidator] = None,
+        base_url: Optional[str] = None,
+        wsgi_app: Optional[Any] = None
+    ):
+        self.endpoints = list(mix)
+        self.weights = [mix[name] for name in self.endpoints]
+        self.concurrency = concurrency
+        self.duration = duration
+        self.rps = rps
+        self.recorder = recorder
+        self.validator = validator
+        self.base_url = base_url
+        self.wsgi_app = wsgi_app
+        self.stats = {name: EndpointStats() for name in ENDPOINTS}
+        self.order_ids = deque(maxlen=ID_POOL_SIZE)
+        self.payment_ids = deque(maxlen=ID_POOL_SIZE)
+        self.refundable_ids = deque(maxlen=ID_POOL_SIZE)
+        self.lock = threading.Lock()
+        self.next_slot = 0.0
+        self.deadline = 0.0
+
+    def _wait_for_slot(self) -> bool:
+        if self.rps:
+            with self.lock:
+                slot = max(self.next_slot, time.monotonic())
+                self.next_slot = slot + 1.0 / self.rps
+            delay = slot - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        return time.monotonic() < self.deadline
+
+    def _record(self, name: str, response, execution_time: float) -> None:
+        with self.lock:
+            self.stats[name].record(response.status_code, execution_time)
+        if self.validator is not None:
+            self.validator.submit(response, execution_time)
+
+    def _pick_id(self, pool: deque, pop: bool = False) -> Optional[str]:
+        with self.lock:
+            if not pool:
+                return None
+            if pop:
+                return pool.popleft()
+            return pool[random.randrange(len(pool))]
+
+    def _create_order(self, client: APIClient) -> Optional[str]:
+        response, execution_time = client.create_order(round(random.uniform(100, 100000), 2), 'KZT')
+        self._record('create_order', response, execution_time)
+        if response.status_code != 201:
+            return None
+        order_id = response.json()['id']
+        with self.lock:
+            self.order_ids.append(order_id)
+        return order_id
+
+    def _create_payment(self, client: APIClient, refundable: bool = True) -> Optional[str]:
+        order_id = self._pick_id(self.order_ids) or self._create_order(client)
+        if order_id is None:
+            return None
+        response, execution_time = client.create_payment(order_id)
+        self._record('create_payment', response, execution_time)
+        if response.status_code != 201:
+            return None
+        payment_id = response.json()['id']
+        with self.lock:
+            self.payment_ids.append(payment_id)
+            if refundable:
+                self.refundable_ids.append(payment_id)
+        return payment_id
+
+    def _get_order(self, client: APIClient) -> None:
+        order_id = self._pick_id(self.order_ids) or self._create_order(client)
+        if order_id is not None:
+            response, execution_time = client.get_order(order_id)
+            self._record('get_order', response, execution_time)
+
+    def _get_payment(self, client: APIClient) -> None:
+        payment_id = self._pick_id(self.payment_ids) or self._create_payment(client)
+        if payment_id is not None:
+            response, execution_time = client.get_payment(payment_id)
+            self._record('get_payment', response, execution_time)
+
+    def _refund_payment(self, client: APIClient) -> None:
+        payment_id = self._pick_id(self.refundable_ids, pop=True) or self._create_payment(client, refundable=False)
+        if payment_id is None:
+            return
+        response, execution_time = client.refund_payment(payment_id)
+        self._record('refund_payment', response, execution_time)
+
+    def _run_endpoint(self, client: APIClient, name: str) -> None:
+        actions = {
+            'create_order': self._create_order,
+            'get_order': self._get_order,
+            'create_payment': self._create_payment,
+            'get_payment': self._get_payment,
+            'refund_payment': self._refund_payment
+        }
+        actions[name](client)
+
+    def _worker(self) -> None:
+        with APIClient(base_url=self.base_url, wsgi_app=self.wsgi_app, recorder=self.recorder) as client:
+            while self._wait_for_slot():
+                name = random.choices(self.endpoints, weights=self.weights)[0]
+                try:
+                    self._run_endpoint(client, name)
+                except Exception:
+                    with self.lock:
+                        self.stats[name].errors += 1
+
+    def run(self) -> Dict[str, Any]:
+        started_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        start = time.monotonic()
+        self.next_slot = start
+        self.deadline = start + self.duration
+
+        threads = [threading.Thread(target=self._worker, daemon=True) for _ in range(self.concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        elapsed = time.monotonic() - start
+        total = sum(stats.latencies.count for stats in self.stats.values())
+        report = {
+            'started_at': started_at,
+            'duration_s': round(elapsed, 3),
+            'concurrency': self.concurrency,
+            'target_rps': self.rps,
+            'mix': dict(zip(self.endpoints, self.weights)),
+            'total_requests': total,
+            'throughput_rps': round(total / elapsed, 2) if elapsed else 0.0,
+            'endpoints': {
+                name: stats.report(elapsed)
+                for name, stats in self.stats.items()
+                if stats.latencies.count or stats.errors
+            }
+        }
+        if self.validator is not None:
+            report['validation'] = self.validator.report()
+        return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Drive load against the ioka API through APIClient")
+    parser.add_argument('--mix', default=DEFAULT_MIX, help="Endpoint weights, e.g. create_order=1,get_order=3")
+    parser.add_argument('--concurrency', type=int, default=4, help="Number of worker threads")
+    parser.add_argument('--rps', type=float, default=None, help="Target requests per second across all workers")
+    parser.add_argument('--duration', type=float, default=10.0, help="Run duration in seconds")
+    parser.add_argument('--output', default=None, help="Write the JSON report to this file instead of stdout")
+    parser.add_argument('--capture', default=None, help="Record the generated traffic to this capture file")
+    parser.add_argument('--validate', action='store_true', help="Validate every response against its schema")
+    parser.add_argument('--validate-workers', type=int, default=2, help="Threads checking responses")
+    args = parser.parse_args(argv)
+
+    recorder = TrafficRecorder(args.capture) if args.capture else None
+    generator = LoadGenerator(
+        parse_mix(args.mix),
+        concurrency=args.concurrency,
+        duration=args.duration,
+        rps=args.rps,
+        recorder=recorder,
+        validator=BatchValidator(workers=args.validate_workers) if args.validate else None
+    )
+    try:
+        report = json.dumps(generator.run(), indent=2)
+    finally:
+        if recorder is not None:
+            recorder.close()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(report + '\n')
+    else:
+        print(report)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,161 @@
+import math
+import threading
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(int(math.ceil(q / 100.0 * len(sorted_values))) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class LatencyHistogram:
+    # Log-bucketed like HdrHistogram: every recorded value lands in a bucket whose
+    # bounds are within `precision` of each other, so memory stays flat however many
+    # samples arrive while percentiles keep a bounded relative error.
+
+    def __init__(self, precision: float = 0.01):
+        self.precision = precision
+        self._log_base = math.log1p(precision)
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def _bucket(self, value: float) -> int:
+        if value <= 1e-3:
+            return 0
+        return int(math.log(value * 1000) / self._log_base) + 1
+
+    def _bucket_value(self, bucket: int) -> float:
+        if bucket == 0:
+            return 0.0
+        return math.exp(bucket * self._log_base) / 1000
+
+    def record(self, value: float) -> None:
+        bucket = self._bucket(value)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+        if other.count and (self.count == 0 or other.min < self.min):
+            self.min = other.min
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def percentile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(int(math.ceil(q / 100.0 * self.count)), 1)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(max(self._bucket_value(bucket), self.min), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            'count': self.count,
+            'p50': round(self.percentile(50), 3),
+            'p90': round(self.percentile(90), 3),
+            'p95': round(self.percentile(95), 3),
+            'p99': round(self.percentile(99), 3),
+            'max': round(self.max, 3),
+            'mean': round(self.total / self.count, 3) if self.count else 0.0
+        }
+
+
+PHASES = ('prepare_ms', 'connect_ms', 'send_ms', 'ttfb_ms', 'download_ms', 'json_decode_ms')
+
+
+class RequestTiming(float):
+    # Milliseconds on the wire - from handing the request to the transport until the last
+    # body byte arrived, across retries - as a plain float, so existing
+    # `response, execution_time = ...` callers keep working. Client-side work (encoding
+    # the body, merging headers, decoding JSON) is reported in its own phases; wall_ms
+    # covers everything. Phases describe the final attempt.
+
+    def __new__(
+        cls,
+        total_ms: float,
+        attempts: int = 1,
+        retries: int = 0,
+        retry_wait_ms: float = 0.0,
+        breaker_state: str = 'closed',
+        phases: Optional[Dict[str, float]] = None,
+        wall_ms: Optional[float] = None,
+        server_timing: Optional[Dict[str, float]] = None
+    ):
+        timing = super().__new__(cls, total_ms)
+        timing.attempts = attempts
+        timing.retries = retries
+        timing.retry_wait_ms = retry_wait_ms
+        timing.breaker_state = breaker_state
+        for phase in PHASES:
+            setattr(timing, phase, (phases or {}).get(phase, 0.0))
+        timing.wall_ms = total_ms if wall_ms is None else wall_ms
+        # Durations the server reported in its Server-Timing header, e.g. {'app': .., 'sim': .., 'total': ..}
+        timing.server_timing = server_timing or {}
+        return timing
+
+    @property
+    def server_ms(self) -> Optional[float]:
+        return self.server_timing.get('total')
+
+    def breakdown(self) -> Dict[str, float]:
+        return {
+            'total_ms': round(float(self), 3),
+            'wall_ms': round(self.wall_ms, 3),
+            **{phase: round(getattr(self, phase), 3) for phase in PHASES}
+        }
+
+
+class MetricsCollector:
+
+    def __init__(self, precision: float = 0.01):
+        self.precision = precision
+        self.histograms: Dict[Tuple[str, int], LatencyHistogram] = {}
+        self.lock = threading.Lock()
+
+    def record(self, route: str, status_code: int, execution_time: float) -> None:
+        key = (route, status_code)
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = LatencyHistogram(self.precision)
+            histogram.record(execution_time)
+
+    def routes(self) -> List[str]:
+        with self.lock:
+            return sorted({route for route, _ in self.histograms})
+
+    def histogram(self, route: str, status_code: Optional[int] = None) -> LatencyHistogram:
+        merged = LatencyHistogram(self.precision)
+        with self.lock:
+            for (key_route, key_status), histogram in self.histograms.items():
+                if key_route == route and status_code in (None, key_status):
+                    merged.merge(histogram)
+        return merged
+
+    def summary(self) -> Dict[str, Any]:
+        report = {}
+        for route in self.routes():
+            with self.lock:
+                statuses = {
+                    str(status): histogram.summary()
+                    for (key_route, status), histogram in sorted(self.histograms.items())
+                    if key_route == route
+                }
+            report[route] = {**self.histogram(route).summary(), 'statuses': statuses}
+        return report
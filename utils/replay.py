@@ -0,0 +1,160 @@
+"""
+Replay a traffic capture recorded with APIClient(recorder=TrafficRecorder(...)).
+
+Usage:
+    python -m utils.replay capture.jsonl.gz
+    python -m utils.replay capture.jsonl.gz --speed 2 --concurrency 16 --output replay.json
+    python -m utils.replay capture.jsonl.gz --speed 0    # as fast as possible
+"""
+import argparse
+import json
+import queue
+import sys
+import threading
+import time
+from typing import Dict, Any, List, Optional
+from utils.api_client import APIClient
+from utils.capture import iter_capture
+from utils.metrics import LatencyHistogram
+
+
+class RouteStats:
+
+    def __init__(self):
+        self.latencies = LatencyHistogram()
+        self.recorded_latencies = LatencyHistogram()
+        self.status_mismatches = 0
+        self.body_mismatches = 0
+        self.errors = 0
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            'count': self.latencies.count,
+            'errors': self.errors,
+            'status_mismatches': self.status_mismatches,
+            'body_mismatches': self.body_mismatches,
+            'latency_ms': self.latencies.summary(),
+            'recorded_latency_ms': self.recorded_latencies.summary()
+        }
+
+
+class ReplayDriver:
+    # Re-issues captured requests on the original schedule divided by `speed`. The capture
+    # is streamed through a small bounded queue, so traces larger than memory replay fine;
+    # when workers fall behind the schedule the delay shows up as dispatch lag.
+
+    def __init__(
+        self,
+        path: str,
+        base_url: Optional[str] = None,
+        speed: float = 1.0,
+        concurrency: int = 8,
+        wsgi_app: Optional[Any] = None
+    ):
+        self.path = path
+        self.base_url = base_url
+        self.speed = speed
+        self.concurrency = concurrency
+        self.wsgi_app = wsgi_app
+        self.stats: Dict[str, RouteStats] = {}
+        self.max_lag_ms = 0.0
+        self.lock = threading.Lock()
+
+    def _route_stats(self, route: str) -> RouteStats:
+        stats = self.stats.get(route)
+        if stats is None:
+            stats = self.stats[route] = RouteStats()
+        return stats
+
+    def _replay(self, client: APIClient, entry: Dict[str, Any]) -> None:
+        route = entry.get('route') or f"{entry['method']} {entry['path']}"
+        try:
+            response, execution_time = client._make_request(
+                entry['method'],
+                entry['path'],
+                data=json.loads(entry['body']) if entry.get('body') else None,
+                route=route
+            )
+        except Exception:
+            with self.lock:
+                self._route_stats(route).errors += 1
+            return
+        with self.lock:
+            stats = self._route_stats(route)
+            stats.latencies.record(execution_time)
+            stats.recorded_latencies.record(entry['ms'])
+            if response.status_code != entry['status']:
+                stats.status_mismatches += 1
+            elif response.text != entry['response']:
+                stats.body_mismatches += 1
+
+    def _worker(self, work: queue.Queue) -> None:
+        with APIClient(base_url=self.base_url, wsgi_app=self.wsgi_app) as client:
+            while True:
+                entry = work.get()
+                if entry is None:
+                    return
+                self._replay(client, entry)
+
+    def run(self) -> Dict[str, Any]:
+        work: queue.Queue = queue.Queue(maxsize=self.concurrency * 4)
+        threads = [
+            threading.Thread(target=self._worker, args=(work,), daemon=True) for _ in range(self.concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+
+        start = time.monotonic()
+        first_ts = None
+        for entry in iter_capture(self.path):
+            if first_ts is None:
+                first_ts = entry['ts']
+            if self.speed > 0:
+                due = start + (entry['ts'] - first_ts) / self.speed
+                delay = due - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    self.max_lag_ms = max(self.max_lag_ms, -delay * 1000)
+            work.put(entry)
+        for _ in threads:
+            work.put(None)
+        for thread in threads:
+            thread.join()
+
+        elapsed = time.monotonic() - start
+        total = sum(stats.latencies.count + stats.errors for stats in self.stats.values())
+        return {
+            'capture': str(self.path),
+            'speed': self.speed,
+            'concurrency': self.concurrency,
+            'duration_s': round(elapsed, 3),
+            'total_requests': total,
+            'throughput_rps': round(total / elapsed, 2) if elapsed else 0.0,
+            'max_lag_ms': round(self.max_lag_ms, 3),
+            'routes': {route: stats.report() for route, stats in sorted(self.stats.items())}
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay recorded API traffic")
+    parser.add_argument('capture', help="Capture file (.jsonl or .jsonl.gz)")
+    parser.add_argument('--base-url', default=None, help="Target server, defaults to api.base_url")
+    parser.add_argument('--speed', type=float, default=1.0, help="Rate multiplier; 0 sends as fast as possible")
+    parser.add_argument('--concurrency', type=int, default=8, help="Number of worker threads")
+    parser.add_argument('--output', default=None, help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    driver = ReplayDriver(args.capture, base_url=args.base_url, speed=args.speed, concurrency=args.concurrency)
+    report = json.dumps(driver.run(), indent=2)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(report + '\n')
+    else:
+        print(report)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,148 @@
+import random
+import threading
+import time
+from typing import Callable, Dict, Any, Iterable, Optional
+
+BREAKER_CLOSED = 'closed'
+BREAKER_OPEN = 'open'
+BREAKER_HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class RequestFailedError(Exception):
+    # Raised once every attempt failed; keeps what the retries cost
+
+    def __init__(self, message: str, retries: int = 0, retry_wait_ms: float = 0.0):
+        super().__init__(message)
+        self.retries = retries
+        self.retry_wait_ms = retry_wait_ms
+
+
+class RetryBudget:
+    # Retries are paid for by regular traffic: each request deposits `ratio` tokens and
+    # each retry spends one, so retries stay a bounded fraction of load when a server
+    # degrades. `min_tokens` lets a quiet client still retry a few times.
+
+    def __init__(self, ratio: float = 0.2, min_tokens: float = 10):
+        self.ratio = ratio
+        self.max_tokens = max(min_tokens, 1.0)
+        self.tokens = self.max_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class RetryPolicy:
+
+    def __init__(
+        self,
+        max_retries: int = 0,
+        methods: Iterable[str] = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'),
+        statuses: Iterable[int] = (429, 502, 503, 504),
+        backoff_base_ms: float = 50,
+        backoff_max_ms: float = 2000,
+        budget: Optional[RetryBudget] = None,
+        rng: Optional[random.Random] = None
+    ):
+        self.max_retries = max_retries
+        self.methods = {method.upper() for method in methods}
+        self.statuses = set(statuses)
+        self.backoff_base_ms = backoff_base_ms
+        self.backoff_max_ms = backoff_max_ms
+        self.budget = budget or RetryBudget()
+        self.rng = rng or random.Random()
+
+    def is_retryable_method(self, method: str, idempotency_key: Optional[str] = None) -> bool:
+        # A POST carrying an Idempotency-Key is safe to repeat: the server replays the first result
+        return method.upper() in self.methods or idempotency_key is not None
+
+    def backoff_ms(self, retry: int, retry_after: Optional[str] = None) -> float:
+        # Full jitter: uniform in [0, min(max, base * 2^retry)], raised to a Retry-After hint
+        delay = self.rng.uniform(0, min(self.backoff_max_ms, self.backoff_base_ms * 2 ** retry))
+        if retry_after is not None:
+            try:
+                delay = max(delay, min(float(retry_after) * 1000, self.backoff_max_ms))
+            except ValueError:
+                pass
+        return delay
+
+
+class CircuitBreaker:
+    # Opens after `failure_threshold` consecutive failures and rejects calls for
+    # `reset_timeout` seconds; then one trial call decides between closing and reopening.
+    # A threshold of 0 disables the breaker.
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 5.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = BREAKER_CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.opens = 0
+        self.rejected = 0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        if not self.failure_threshold:
+            return True
+        with self._lock:
+            if self.state == BREAKER_OPEN and self.clock() - self.opened_at >= self.reset_timeout:
+                self.state = BREAKER_HALF_OPEN
+            if self.state == BREAKER_CLOSED:
+                return True
+            if self.state == BREAKER_HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def release(self) -> None:
+        # The allowed call never reached the service: free the trial slot without a verdict
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._trial_in_flight = False
+            self.state = BREAKER_CLOSED
+
+    def record_failure(self) -> None:
+        if not self.failure_threshold:
+            return
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == BREAKER_HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != BREAKER_OPEN:
+                    self.opens += 1
+                self.state = BREAKER_OPEN
+                self.opened_at = self.clock()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'state': self.state,
+                'consecutive_failures': self.failures,
+                'opens': self.opens,
+                'rejected': self.rejected
+            }
@@ -0,0 +1,259 @@
+import re
+from typing import Any, Callable, Dict, List, Optional, Pattern, Union
+from mock_server.constants import ERROR_CODES, ORDER_STATUSES, PAYMENT_STATUSES, REFUND_STATUSES
+
+# Response schemas are plain dicts:
+#   type      'string', 'number', 'integer', 'boolean', 'object' or 'array'
+#   nullable  None is accepted as well
+#   optional  the field may be missing from its parent object
+#   enum      allowed values
+#   prefix    required string prefix, e.g. 'order_'
+#   pattern   regular expression the whole string must match
+#   minimum   lower bound for numbers
+#   fields    object members, each with its own schema
+#   items     schema of every array element
+# A schema is compiled once into a closure that appends every violation it finds to a list
+# instead of stopping at the first one.
+
+Checker = Callable[[Any, str, List[str]], None]
+
+TIMESTAMP_PATTERN = r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z"
+
+TYPES = {
+    'string': (str,),
+    'number': (int, float),
+    'integer': (int,),
+    'boolean': (bool,),
+    'object': (dict,),
+    'array': (list,)
+}
+
+ERROR = {
+    'type': 'object',
+    'fields': {
+        'error': {
+            'type': 'object',
+            'fields': {
+                'code': {'type': 'string', 'enum': ERROR_CODES},
+                'message': {'type': 'string'}
+            }
+        }
+    }
+}
+
+ORDER = {
+    'type': 'object',
+    'fields': {
+        'id': {'type': 'string', 'prefix': 'order_'},
+        'amount': {'type': 'number', 'minimum': 0},
+        'currency': {'type': 'string'},
+        'status': {'type': 'string', 'enum': ORDER_STATUSES},
+        'created_at': {'type': 'string', 'pattern': TIMESTAMP_PATTERN},
+        'description': {'type': 'string'},
+        'customer': {'type': 'object', 'nullable': True}
+    }
+}
+
+PAYMENT = {
+    'type': 'object',
+    'fields': {
+        'id': {'type': 'string', 'prefix': 'payment_'},
+        'order_id': {'type': 'string', 'prefix': 'order_'},
+        'amount': {'type': 'number', 'minimum': 0},
+        'currency': {'type': 'string'},
+        'status': {'type': 'string', 'enum': PAYMENT_STATUSES},
+        'created_at': {'type': 'string', 'pattern': TIMESTAMP_PATTERN},
+        'payment_method': {'type': 'string'},
+        'refunded_amount': {'type': 'number', 'minimum': 0, 'optional': True},
+        'refunded_at': {'type': 'string', 'pattern': TIMESTAMP_PATTERN, 'optional': True}
+    }
+}
+
+REFUND = {
+    'type': 'object',
+    'fields': {
+        'id': {'type': 'string', 'prefix': 'refund_payment_'},
+        'payment_id': {'type': 'string', 'prefix': 'payment_'},
+        'amount': {'type': 'number', 'minimum': 0},
+        'currency': {'type': 'string'},
+        'status': {'type': 'string', 'enum': REFUND_STATUSES},
+        'created_at': {'type': 'string', 'pattern': TIMESTAMP_PATTERN}
+    }
+}
+
+
+def page_of(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'type': 'object',
+        'fields': {
+            'data': {'type': 'array', 'items': item},
+            'next_cursor': {'type': 'string', 'nullable': True}
+        }
+    }
+
+
+def batch_of(name: str, item: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'type': 'object',
+        'fields': {
+            'results': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'fields': {
+                        'index': {'type': 'integer', 'minimum': 0},
+                        'status': {'type': 'integer'},
+                        name: {**item, 'optional': True},
+                        'error': {**ERROR['fields']['error'], 'optional': True}
+                    }
+                }
+            },
+            'created': {'type': 'integer', 'minimum': 0},
+            'failed': {'type': 'integer', 'minimum': 0}
+        }
+    }
+
+
+SCHEMAS = {
+    'error': ERROR,
+    'order': ORDER,
+    'payment': PAYMENT,
+    'refund': REFUND,
+    'order_page': page_of(ORDER),
+    'payment_page': page_of(PAYMENT),
+    'order_batch': batch_of('order', ORDER),
+    'payment_batch': batch_of('payment', PAYMENT)
+}
+
+# Schema of the success response per route; error statuses always use 'error'
+ENDPOINT_SCHEMAS = {
+    'POST /orders': 'order',
+    'GET /orders/{order_id}': 'order',
+    'GET /orders': 'order_page',
+    'POST /orders:batch': 'order_batch',
+    'POST /orders/{order_id}/payments': 'payment',
+    'GET /orders/{order_id}/payments': 'payment_page',
+    'GET /payments/{payment_id}': 'payment',
+    'POST /payments:batch': 'payment_batch',
+    'POST /payments/{payment_id}/refund': 'refund'
+}
+
+
+def route_pattern(path: str) -> Pattern:
+    # "/orders/{order_id}" matches the end of the request path, so a base URL with its
+    # own path prefix still resolves
+    return re.compile(re.sub(r'\\\{\w+\\\}', '[^/]+', re.escape(path)) + '$')
+
+
+ROUTE_PATTERNS = [
+    (method, route_pattern(path), f"{method} {path}")
+    for method, path in (route.split(' ', 1) for route in ENDPOINT_SCHEMAS)
+]
+
+
+def compile_schema(schema: Dict[str, Any]) -> Checker:
+    checks: List[Checker] = []
+
+    if 'enum' in schema:
+        allowed = frozenset(schema['enum'])
+
+        def check_enum(value: Any, path: str, errors: List[str]) -> None:
+            if value not in allowed:
+                errors.append(f"{path}: {value!r} is not one of {sorted(allowed)}")
+        checks.append(check_enum)
+
+    if 'prefix' in schema:
+        prefix = schema['prefix']
+
+        def check_prefix(value: Any, path: str, errors: List[str]) -> None:
+            if not value.startswith(prefix):
+                errors.append(f"{path}: {value!r} does not start with '{prefix}'")
+        checks.append(check_prefix)
+
+    if 'pattern' in schema:
+        match = re.compile(schema['pattern']).fullmatch
+
+        def check_pattern(value: Any, path: str, errors: List[str]) -> None:
+            if match(value) is None:
+                errors.append(f"{path}: {value!r} does not match {schema['pattern']}")
+        checks.append(check_pattern)
+
+    if 'minimum' in schema:
+        minimum = schema['minimum']
+
+        def check_minimum(value: Any, path: str, errors: List[str]) -> None:
+            if value < minimum:
+                errors.append(f"{path}: {value!r} is less than {minimum}")
+        checks.append(check_minimum)
+
+    if 'fields' in schema:
+        fields = [
+            (name, f".{name}", compile_schema(field), not field.get('optional', False))
+            for name, field in schema['fields'].items()
+        ]
+
+        def check_fields(value: Dict[str, Any], path: str, errors: List[str]) -> None:
+            for name, suffix, check, required in fields:
+                if name in value:
+                    check(value[name], path + suffix, errors)
+                elif required:
+                    errors.append(f"{path + suffix}: missing")
+        checks.append(check_fields)
+
+    if 'items' in schema:
+        check_item = compile_schema(schema['items'])
+
+        def check_items(value: List[Any], path: str, errors: List[str]) -> None:
+            for index, item in enumerate(value):
+                check_item(item, f"{path}[{index}]", errors)
+        checks.append(check_items)
+
+    expected = schema.get('type')
+    types = TYPES[expected] if expected else None
+    # bool is an int subclass but never a valid number in these payloads
+    reject_bool = expected in ('number', 'integer')
+    nullable = schema.get('nullable', False)
+
+    def check(value: Any, path: str, errors: List[str]) -> None:
+        if value is None and nullable:
+            return
+        if types is not None and (not isinstance(value, types) or reject_bool and isinstance(value, bool)):
+            errors.append(f"{path}: expected {expected}, got {type(value).__name__}")
+            return
+        for nested in checks:
+            nested(value, path, errors)
+
+    return check
+
+
+_compiled: Dict[str, Checker] = {}
+
+
+def get_checker(name: str) -> Checker:
+    checker = _compiled.get(name)
+    if checker is None:
+        if name not in SCHEMAS:
+            raise KeyError(f"Unknown schema '{name}', expected one of {', '.join(SCHEMAS)}")
+        checker = _compiled[name] = compile_schema(SCHEMAS[name])
+    return checker
+
+
+def validate(data: Any, schema: Union[str, Dict[str, Any]]) -> List[str]:
+    # Named schemas come from the compiled cache; an inline dict is compiled on every call
+    checker = get_checker(schema) if isinstance(schema, str) else compile_schema(schema)
+    errors: List[str] = []
+    checker(data, '$', errors)
+    return errors
+
+
+def route_for(method: str, path: str) -> Optional[str]:
+    for route_method, pattern, route in ROUTE_PATTERNS:
+        if route_method == method and pattern.search(path):
+            return route
+    return None
+
+
+def schema_for(route: str, status_code: int) -> Optional[str]:
+    if status_code >= 400:
+        return 'error'
+    return ENDPOINT_SCHEMAS.get(route)
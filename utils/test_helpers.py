@@ -1,4 +1,4 @@
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, List
 import requests
 from utils.api_client import APIClient
 from utils.validators import ResponseValidator
@@ -40,4 +40,30 @@ class TestHelpers:
         order_id, order_response = self.create_test_order(amount, currency)
         payment_id, payment_response = self.create_test_payment(order_id, payment_method)
         return order_id, payment_id, order_response, payment_response
-
+    
+    def create_test_orders(
+        self,
+        count: int,
+        amount: float = 1000.0,
+        currency: str = 'KZT'
+    ) -> List[str]:
+        response, _ = self.api_client.create_orders_bulk(
+            [{'amount': amount, 'currency': currency} for _ in range(count)]
+        )
+        self.validator.assert_status_code(response, 200)
+        data = response.json()
+        assert data['failed'] == 0, f"Expected all orders to be created, {data['failed']} failed"
+        return [result['order']['id'] for result in data['results']]
+    
+    def create_test_payments(
+        self,
+        order_ids: List[str],
+        payment_method: str = 'card'
+    ) -> List[str]:
+        response, _ = self.api_client.create_payments_bulk(
+            [{'order_id': order_id, 'payment_method': payment_method} for order_id in order_ids]
+        )
+        self.validator.assert_status_code(response, 200)
+        data = response.json()
+        assert data['failed'] == 0, f"Expected all payments to be created, {data['failed']} failed"
+        return [result['payment']['id'] for result in data['results']]
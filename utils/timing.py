@@ -0,0 +1,121 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Socket-level phases are recorded by instrumented urllib3 connections into the
+# collector of the calling thread; requests and urllib3 run a call on the caller's thread.
+_current = threading.local()
+
+
+class PhaseCollector:
+    __slots__ = ('connect_ms', 'send_ms')
+
+    def __init__(self):
+        self.connect_ms = 0.0
+        self.send_ms = 0.0
+
+
+@contextmanager
+def collect_phases() -> Iterator[PhaseCollector]:
+    collector = PhaseCollector()
+    _current.collector = collector
+    try:
+        yield collector
+    finally:
+        _current.collector = None
+
+
+def current_collector() -> Optional[PhaseCollector]:
+    return getattr(_current, 'collector', None)
+
+
+def elapsed_ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000
+
+
+class TimedConnectionMixin:
+    # DNS resolution, TCP connect and the TLS handshake all happen in connect(); request()
+    # writes headers and body and may connect first, which is subtracted from send time
+
+    def connect(self) -> None:
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            collector = current_collector()
+            if collector is not None:
+                collector.connect_ms += elapsed_ms(start)
+
+    def request(self, *args, **kwargs) -> None:
+        collector = current_collector()
+        connect_before = collector.connect_ms if collector is not None else 0.0
+        start = time.perf_counter()
+        try:
+            super().request(*args, **kwargs)
+        finally:
+            if collector is not None:
+                collector.send_ms += elapsed_ms(start) - (collector.connect_ms - connect_before)
+
+
+class TimedHTTPConnection(TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool
+        }
+
+
+def phase_breakdown(
+    collector: PhaseCollector,
+    exchange_ms: float,
+    download_ms: float,
+    prepare_ms: float = 0.0,
+    json_decode_ms: float = 0.0
+) -> Dict[str, float]:
+    # exchange_ms runs from handing the request to the adapter until response headers are
+    # parsed; whatever connect and send did not account for is waiting on the server
+    return {
+        'prepare_ms': prepare_ms,
+        'connect_ms': collector.connect_ms,
+        'send_ms': collector.send_ms,
+        'ttfb_ms': max(exchange_ms - collector.connect_ms - collector.send_ms, 0.0),
+        'download_ms': download_ms,
+        'json_decode_ms': json_decode_ms
+    }
+
+
+def parse_server_timing(header: Optional[str]) -> Dict[str, float]:
+    # "app;dur=1.2, sim;dur=5.0, total;dur=6.2" -> {'app': 1.2, 'sim': 5.0, 'total': 6.2}
+    timings = {}
+    for metric in (header or '').split(','):
+        name, *params = [part.strip() for part in metric.split(';')]
+        for param in params:
+            key, _, value = param.partition('=')
+            if key == 'dur' and name:
+                try:
+                    timings[name] = float(value)
+                except ValueError:
+                    pass
+    return timings
@@ -1,5 +1,7 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence, Union
 import requests
+from utils.metrics import LatencyHistogram, percentile
+from utils.schemas import validate
 
 
 class ResponseValidator:
@@ -14,11 +16,60 @@ class ResponseValidator:
         assert execution_time < max_time_ms, \
             f"Response time {execution_time:.2f}ms exceeds {max_time_ms}ms"
     
+    @staticmethod
+    def assert_latency_percentiles(
+        samples: Union[LatencyHistogram, Sequence[float]],
+        budget: Dict[str, float],
+        endpoint: str = ''
+    ) -> None:
+        if isinstance(samples, LatencyHistogram):
+            count = samples.count
+            observed = {name: samples.percentile(float(name[1:])) for name in budget}
+        else:
+            ordered = sorted(samples)
+            count = len(ordered)
+            observed = {name: percentile(ordered, float(name[1:])) for name in budget}
+        
+        assert count > 0, f"No latency samples collected for {endpoint or 'endpoint'}"
+        violations = [
+            f"{name} {observed[name]:.2f}ms >= {limit}ms"
+            for name, limit in budget.items()
+            if observed[name] >= limit
+        ]
+        assert not violations, \
+            f"Latency budget exceeded for {endpoint or 'endpoint'} ({count} samples): {', '.join(violations)}"
+    
+    @staticmethod
+    def assert_no_latency_regression(
+        current: Dict[str, float],
+        baseline: Dict[str, float],
+        tolerance: float,
+        slack_ms: float = 0.0,
+        endpoint: str = '',
+        percentiles: Optional[Sequence[str]] = None
+    ) -> None:
+        names = percentiles or [name for name in baseline if name.startswith('p')]
+        regressions = [
+            f"{name} {current[name]:.2f}ms vs baseline {baseline[name]:.2f}ms"
+            for name in names
+            if name in current and name in baseline
+            and current[name] > baseline[name] * tolerance + slack_ms
+        ]
+        assert not regressions, \
+            f"Latency regression for {endpoint or 'endpoint'} beyond x{tolerance}: {', '.join(regressions)}"
+    
     @staticmethod
     def assert_json_structure(data: Dict[str, Any], required_fields: List[str]) -> None:
         for field in required_fields:
             assert field in data, f"Response should contain '{field}' field"
     
+    @staticmethod
+    def assert_schema(data: Any, schema: Union[str, Dict[str, Any]]) -> None:
+        violations = validate(data, schema)
+        assert not violations, \
+            f"Response does not match schema '{schema if isinstance(schema, str) else 'inline'}' " \
+            f"({len(violations)} violations):\n" + '\n'.join(violations)
+    
     @staticmethod
     def assert_error_structure(data: Dict[str, Any], expected_code: Optional[str] = None) -> None:
         assert 'error' in data, "Response should contain 'error' field"
@@ -0,0 +1,71 @@
+import asyncio
+import io
+import httpx
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib.parse import urlsplit
+from werkzeug.test import EnvironBuilder, run_wsgi_app
+
+
+class WSGIAdapter(BaseAdapter):
+    # Dispatches requests.Session calls straight into a WSGI app, skipping sockets entirely
+
+    def __init__(self, app):
+        super().__init__()
+        self.app = app
+
+    def send(self, request: requests.PreparedRequest, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        url = urlsplit(request.url)
+        body = request.body
+        if hasattr(body, 'read'):
+            body = body.read()
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+
+        environ = EnvironBuilder(
+            path=url.path,
+            base_url=f"{url.scheme}://{url.netloc}",
+            query_string=url.query,
+            method=request.method,
+            headers=dict(request.headers),
+            data=body or b''
+        ).get_environ()
+        app_iter, status, headers = run_wsgi_app(self.app, environ, buffered=True)
+        try:
+            content = b''.join(app_iter)
+        finally:
+            if hasattr(app_iter, 'close'):
+                app_iter.close()
+
+        response = requests.Response()
+        status_code, _, reason = status.partition(' ')
+        response.status_code = int(status_code)
+        response.reason = reason
+        response.headers = CaseInsensitiveDict(headers.to_wsgi_list())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(content)
+        response._content = content
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+class AsyncWSGITransport(httpx.AsyncBaseTransport):
+    # httpx only ships a sync WSGI transport; run it off the event loop
+
+    def __init__(self, app):
+        self.transport = httpx.WSGITransport(app=app)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        return await asyncio.to_thread(self._handle, request)
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        response = self.transport.handle_request(request)
+        content = response.read()
+        return httpx.Response(response.status_code, headers=response.headers, content=content)